@@ -5,6 +5,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import Group
+from django.db.models import Count
 from django.utils.html import format_html
 from .models import User, Department, Company
 
@@ -44,15 +45,24 @@ class DepartmentAdmin(admin.ModelAdmin):
     raw_id_fields = ['parent']  # 자기 참조는 raw_id_fields 사용
     readonly_fields = ['created_at', 'updated_at']
     
+    def get_queryset(self, request):
+        # 목록의 사용자/사규 수를 부서별로 세지 않고 한 번에 조회
+        return super().get_queryset(request).annotate(
+            member_total=Count('members', distinct=True),
+            regulation_total=Count('regulations', distinct=True),
+        )
+
     def user_count(self, obj):
         """소속 사용자 수"""
-        return obj.members.count()
+        return obj.member_total
     user_count.short_description = '사용자'
+    user_count.admin_order_field = 'member_total'
     
     def regulation_count(self, obj):
         """책임 사규 수"""
-        return obj.regulations.count()
+        return obj.regulation_total
     regulation_count.short_description = '사규'
+    regulation_count.admin_order_field = 'regulation_total'
 
 
 @admin.register(User)
@@ -34,6 +34,7 @@ INSTALLED_APPS = [
     'dashboard.apps.DashboardConfig',
     'notifications.apps.NotificationsConfig',
     'reports.apps.ReportsConfig',
+    'tasks.apps.TasksConfig',
 ]
 
 MIDDLEWARE = [
@@ -110,6 +111,28 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# 파일 저장소
+# attachments: 사규 첨부파일 (같은 내용의 파일은 SHA-256 해시 기준으로 한 번만 저장)
+# exports: 백그라운드에서 생성한 보고서 (MEDIA_ROOT 밖에 저장하며 reports:export_download 화면으로만 내려받음)
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+    'attachments': {
+        'BACKEND': 'regulations.storage.ContentAddressedStorage',
+    },
+    'exports': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        'OPTIONS': {
+            'location': BASE_DIR / 'var' / 'exports',
+            'base_url': None,
+        },
+    },
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -129,10 +152,72 @@ DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 # Allowed file extensions for regulation documents
 ALLOWED_DOCUMENT_EXTENSIONS = ['.pdf', '.docx', '.doc', '.hwp', '.hwpx']
 
+# 첨부파일 다운로드 설정
+# 운영 환경에서는 웹 서버가 파일을 직접 전송하도록 OFFLOAD를 지정
+#   nginx:  'X-Accel-Redirect' + internal location (예: location /protected-media/ { internal; alias <MEDIA_ROOT>/; })
+#   Apache: 'X-Sendfile' (mod_xsendfile)
+DOWNLOAD_SETTINGS = {
+    'OFFLOAD': '',
+    'OFFLOAD_PREFIX': '/protected-media/',
+    'CACHE_MAX_AGE': 60 * 60 * 24 * 365,
+}
+
+# 캐시 설정
+# default: 프로세스별 캐시 (버전 비교 결과 등)
+# shared: 웹/작업자(runworker) 프로세스가 함께 보는 캐시 (사규 코드/사규명 오토마톤, 공통코드 버전 값)
+#   서버가 여러 대이면 DatabaseCache(createcachetable 필요) 또는 Redis 등 공용 캐시로 바꿔야 함
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'var' / 'cache',
+    },
+}
+
 # Session settings
 SESSION_COOKIE_AGE = 28800  # 8 hours
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 
+# 감사 로그(다운로드/조회 기록) 설정
+# 이벤트는 메모리 대기열에 모아 FLUSH_SIZE건 또는 FLUSH_INTERVAL_MS마다 일괄 저장하며,
+# 저장 실패 시 SPOOL_PATH 파일에 기록 후 재저장 (프로세스 강제 종료 시 최대 FLUSH_SIZE건 유실 가능)
+AUDIT_SETTINGS = {
+    'BUFFERED': True,
+    'FLUSH_SIZE': 100,
+    'FLUSH_INTERVAL_MS': 500,
+    'QUEUE_SIZE': 10000,
+    'SPOOL_PATH': BASE_DIR / 'var' / 'audit_spool.jsonl',
+}
+
+# 이용 현황 보고서 설정
+# 다운로드/조회 로그는 일별 집계 테이블(reports.DailyRegulationUsage)에 반영되며,
+# 보고서는 집계 테이블만 조회합니다. 집계에 반영된 원본 로그는 보관 일수가 지나면 삭제됩니다.
+REPORT_SETTINGS = {
+    'USAGE_LOG_RETENTION_DAYS': 365,
+    'ROLLUP_BATCH_SIZE': 50000,
+    'PRUNE_CHUNK_SIZE': 1000,
+}
+
+# 유사 사규 추천 설정
+# 사규명/설명/본문의 글자 n-gram TF-IDF 유사도 상위 TOP_K건을 주기 작업(regulations.update_similarities)으로 계산하며,
+# 사규별 n-gram 빈도는 MATRIX_PATH에 저장하여 바뀐 사규만 다시 벡터화합니다. (설정 변경 시 build_regulation_similarity --rebuild)
+SIMILARITY_SETTINGS = {
+    'TOP_K': 10,
+    'MIN_SCORE': 0.3,
+    'MATRIX_PATH': BASE_DIR / 'var' / 'similarity.npz',
+}
+
+# 유사 중복 사규 탐지 설정 (본문 MinHash 서명 / LSH)
+# NUM_PERM, BANDS, SHINGLE_SIZE 변경 시 find_duplicate_regulations --rebuild 실행
+DUPLICATE_SETTINGS = {
+    'NUM_PERM': 128,
+    'BANDS': 32,
+    'SHINGLE_SIZE': 5,
+    'THRESHOLD': 0.8,
+}
+
 # 사규 관련 설정
 REGULATION_SETTINGS = {
     # 정기검토 알림 일수 (만료 전)
@@ -153,7 +238,69 @@ REGULATION_SETTINGS = {
     ],
 }
 
+# 이메일 설정
+# 운영 환경에서는 SMTP 백엔드(django.core.mail.backends.smtp.EmailBackend)와
+# EMAIL_HOST/EMAIL_PORT 등을 지정합니다.
+EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+DEFAULT_FROM_EMAIL = 'ncompliance@company.com'
 
+# 알림 관련 설정
+NOTIFICATION_SETTINGS = {
+    # SMTP 연결 1회당 발송할 최대 메일 수
+    'EMAIL_BATCH_SIZE': 200,
+    # 이메일 발송 최대 시도 횟수 (초과 시 발송실패 처리)
+    'EMAIL_MAX_ATTEMPTS': 5,
+    # 재시도 대기 기본 시간(초), 실패할 때마다 2배씩 증가
+    'EMAIL_RETRY_BASE_SECONDS': 60,
+    # 발송 점유 시간(초) - 배치를 점유한 발송 작업이 이 시간 안에 끝나지 않으면 다시 발송 대상이 됨
+    'EMAIL_SENDING_TIMEOUT': 600,
+    # 일간 요약 메일 발송 시각 (0~23시, TIME_ZONE 기준)
+    'DAILY_DIGEST_HOUR': 8,
+    # 메일 제목 머리말
+    'EMAIL_SUBJECT_PREFIX': '[사규관리] ',
+    # 읽은 알림을 보관 테이블로 옮기기까지의 일수
+    'ARCHIVE_AFTER_DAYS': 90,
+    # 보관 알림 및 오래된 안 읽은 알림을 완전히 삭제하기까지의 일수
+    'PURGE_AFTER_DAYS': 730,
+    # 보관/삭제 시 한 트랜잭션에서 처리할 건수 (SQLite 쓰기 잠금 시간을 짧게 유지)
+    'RETENTION_CHUNK_SIZE': 500,
+    # 청크 사이 대기 시간(초) - 다른 요청이 쓰기 잠금을 얻을 수 있도록 양보
+    'RETENTION_CHUNK_PAUSE': 0.05,
+    # 같은 사규의 연속 변경을 하나의 제개정 알림으로 병합하는 대기 시간(초)
+    # 대기 중 새 버전이 등록되면 대기 시간이 다시 시작됩니다. (0이면 즉시 발송)
+    'CHANGE_COALESCE_SECONDS': 300,
+    # 병합 대기의 최대 시간(초) - 변경이 계속되어도 최초 변경 후 이 시간 안에는 발송
+    'CHANGE_COALESCE_MAX_SECONDS': 1800,
+    # 제개정 알림 수신 대상
+    # - BROADCAST: 적용범위(전 임직원/소속부서)에 해당하는 모든 사용자
+    # - SUBSCRIPTION: 그룹/분류/태그/책임부서/즐겨찾기 구독이 일치하는 사용자
+    #   (사용자마다 즐겨찾기/소속부서 기본 구독이 만들어지며, 의무준수 사규는 구독과 관계없이 적용범위 전체에 발송)
+    'CHANGE_DELIVERY': 'BROADCAST',
+}
 
+# 백그라운드 작업 설정 (python manage.py runworker)
+TASK_SETTINGS = {
+    # True이면 작업을 대기열에 적재하지 않고 즉시 실행 (테스트/개발용)
+    'EAGER': False,
+    # 동시에 실행할 작업 수
+    'WORKERS': 4,
+    # 작업 실행 방식: 'thread' 또는 'process'
+    'POOL': 'thread',
+    # 대기열 확인 주기(초)
+    'POLL_INTERVAL': 1.0,
+    # 작업 점유 시간(초) - 이 시간 안에 끝나지 않으면 다른 작업자가 다시 실행
+    'VISIBILITY_TIMEOUT': 300,
+    # 재시도 대기 기본 시간(초), 실패할 때마다 2배씩 증가
+    'RETRY_BASE_SECONDS': 30,
+    # 완료된 작업을 삭제하기까지의 일수
+    'SUCCEEDED_RETENTION_DAYS': 7,
+    # 실패한 작업을 삭제하기까지의 일수 (원인 확인을 위해 더 오래 보관)
+    'FAILED_RETENTION_DAYS': 30,
+    # 삭제 시 한 트랜잭션에서 처리할 건수 (SQLite 쓰기 잠금 시간을 짧게 유지)
+    'RETENTION_CHUNK_SIZE': 500,
+    # 청크 사이 대기 시간(초) - 다른 요청이 쓰기 잠금을 얻을 수 있도록 양보
+    'RETENTION_CHUNK_PAUSE': 0.05,
+}
 
-
+# 이 행 수를 넘는 엑셀 보고서는 백그라운드 작업으로 생성 후 알림으로 전달
+REPORT_ASYNC_THRESHOLD = 2000
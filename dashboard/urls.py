@@ -10,6 +10,12 @@ app_name = 'dashboard'
 urlpatterns = [
     path('', views.index, name='index'),
     path('api/regulation/<int:pk>/', views.regulation_content, name='regulation_content'),
+    path('api/regulation/<int:pk>/articles/', views.regulation_articles, name='regulation_articles'),
+    path(
+        'api/regulation/<int:pk>/articles/<int:number>/',
+        views.regulation_article,
+        name='regulation_article',
+    ),
     path('api/favorite/<int:pk>/toggle/', views.toggle_favorite, name='toggle_favorite'),
 ]
 
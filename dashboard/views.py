@@ -12,7 +12,17 @@ from django.utils import timezone
 from django.views.decorators.http import require_POST
 from datetime import timedelta
 
-from regulations.models import Regulation, RegulationVersion, Favorite
+from regulations.articles import PIECE_KINDS
+from regulations.audit import record_view
+from regulations.codes import get_codes, get_model_choices
+from regulations.models import Regulation, RegulationArticle, RegulationStats, RegulationVersion, Favorite
+
+
+# 이보다 긴 본문은 조문 단위로 나누어 불러옴 (조문 색인이 있는 경우)
+PAGED_CONTENT_LENGTH = 30000
+# 조문 단위 조회 시 한 번에 불러오는 조문 수
+ARTICLE_PAGE_SIZE = 30
+ARTICLE_PAGE_MAX = 100
 
 
 @login_required
@@ -64,11 +74,8 @@ def index(request):
     grouped_regulations = {}
     category_order = ['POLICY', 'REGULATION', 'GUIDELINE']
 
-    # 그룹 노출 순서 정의
-    group_order = [
-        '이사회', 'HR', '재무', '구매', '준법', '반부패', 
-        '정보보호', '개인정보보호', '안전보건', 'ESG'
-    ]
+    # 그룹 노출 순서 (공통코드 GROUP 정렬순서)
+    group_order = [entry.code for entry in get_codes('GROUP')]
 
     for reg in filtered_regulations:
         cat = reg.category
@@ -138,7 +145,7 @@ def index(request):
         "category_counts": category_counts,
         "current_category": current_category,
         "grouped_regulations": grouped_list,
-        "category_choices": Regulation.CATEGORY_CHOICES,
+        "category_choices": get_model_choices('CATEGORY', Regulation.CATEGORY_CHOICES),
         "favorite_regulation_ids": list(favorite_regulation_ids),
     }
 
@@ -156,16 +163,27 @@ def landing(request):
 def regulation_content(request, pk):
     """사규 본문 API - JSON으로 반환"""
     regulation = get_object_or_404(Regulation, pk=pk)
+    record_view(request, regulation, source='CONTENT')
     
     # 즐겨찾기 여부 확인
     is_favorite = Favorite.objects.filter(
         user=request.user, regulation=regulation
     ).exists()
+
+    # 긴 본문은 본문 대신 조문 수를 내려주고 조문 API로 나누어 불러옴
+    content = regulation.content or ''
+    article_count = 0
+    if len(content) > PAGED_CONTENT_LENGTH:
+        article_count = regulation.articles.filter(kind__in=PIECE_KINDS).count()
     
     return JsonResponse({
         'id': regulation.pk,
         'title': regulation.title,
-        'content': regulation.content or '',
+        'content': '' if article_count else content,
+        # 미리 변환해 둔 본문 HTML
+        'content_html': '' if article_count or not content else regulation.get_content_html(),
+        'paged': bool(article_count),
+        'article_count': article_count,
         'reference_url': regulation.reference_url or '',
         'category': regulation.get_category_display(),
         'group': regulation.group or '',
@@ -175,6 +193,92 @@ def regulation_content(request, pk):
     })
 
 
+def _article_json(article):
+    return {
+        'anchor': article.anchor,
+        'kind': article.kind,
+        'label': article.label,
+        'title': article.title,
+        'heading': article.heading,
+        'depth': article.depth,
+        'in_addenda': article.in_addenda,
+        'text': article.text,
+    }
+
+
+def _parse_int(value, default, minimum=0, maximum=None):
+    try:
+        number = max(int(value), minimum)
+    except (TypeError, ValueError):
+        return default
+    return min(number, maximum) if maximum is not None else number
+
+
+@login_required
+def regulation_articles(request, pk):
+    """
+    사규 조문 목록 API (?offset=&limit=, toc=1이면 목차 포함)
+    긴 본문을 조문 단위로 나누어 불러올 때 사용
+    """
+    regulation = get_object_or_404(Regulation, pk=pk)
+    if not regulation.can_user_access(request.user):
+        return JsonResponse({'error': '이 사규에 대한 접근 권한이 없습니다.'}, status=403)
+
+    offset = _parse_int(request.GET.get('offset'), 0)
+    limit = _parse_int(request.GET.get('limit'), ARTICLE_PAGE_SIZE, 1, ARTICLE_PAGE_MAX)
+    pieces = regulation.articles.filter(kind__in=PIECE_KINDS).order_by('position')
+    total = pieces.count()
+    data = {
+        'id': regulation.pk,
+        'count': total,
+        'offset': offset,
+        'articles': [_article_json(article) for article in pieces[offset:offset + limit]],
+        'next_offset': offset + limit if offset + limit < total else None,
+    }
+    if request.GET.get('toc'):
+        data['toc'] = [
+            {
+                'anchor': anchor, 'kind': kind, 'label': label, 'title': title, 'depth': depth,
+            }
+            for anchor, kind, label, title, depth in pieces.exclude(kind='PREAMBLE')
+            .values_list('anchor', 'kind', 'label', 'title', 'depth')
+        ]
+    return JsonResponse(data)
+
+
+@login_required
+def regulation_article(request, pk, number):
+    """사규 조문 API (제N조, ?branch=M이면 제N조의M) - 항/호 포함"""
+    regulation = get_object_or_404(Regulation, pk=pk)
+    if not regulation.can_user_access(request.user):
+        return JsonResponse({'error': '이 사규에 대한 접근 권한이 없습니다.'}, status=403)
+
+    branch = _parse_int(request.GET.get('branch'), None, 1)
+    article = regulation.get_article(number, branch)
+    if article is None:
+        return JsonResponse({'error': '해당 조문이 없습니다.'}, status=404)
+
+    # 항과 호 (항이 없는 조문은 호가 조에 바로 속함)
+    nodes = list(article.children.order_by('position'))
+    items = RegulationArticle.objects.filter(
+        parent__in=[node.pk for node in nodes if node.kind == 'PARAGRAPH']
+    ).order_by('position')
+    children_by_parent = {}
+    for item in items:
+        children_by_parent.setdefault(item.parent_id, []).append(item)
+
+    data = _article_json(article)
+    data['url'] = article.get_absolute_url()
+    data['children'] = [
+        dict(
+            _article_json(node),
+            children=[_article_json(item) for item in children_by_parent.get(node.pk, [])],
+        )
+        for node in nodes
+    ]
+    return JsonResponse(data)
+
+
 @login_required
 @require_POST
 def toggle_favorite(request, pk):
@@ -192,11 +296,20 @@ def toggle_favorite(request, pk):
         return JsonResponse({
             'status': 'removed',
             'is_favorite': False,
+            'favorite_count': _favorite_count(regulation),
             'message': '즐겨찾기가 해제되었습니다.'
         })
     
     return JsonResponse({
         'status': 'added',
         'is_favorite': True,
+        'favorite_count': _favorite_count(regulation),
         'message': '즐겨찾기에 추가되었습니다.'
     })
+
+
+def _favorite_count(regulation):
+    """사규 즐겨찾기 수 (RegulationStats 집계값)"""
+    return RegulationStats.objects.filter(regulation=regulation).values_list(
+        'favorite_count', flat=True
+    ).first() or 0
@@ -6,4 +6,7 @@ class NotificationsConfig(AppConfig):
     name = 'notifications'
     verbose_name = '알림 관리'
 
+    def ready(self):
+        from . import signals  # noqa: F401
+
 
@@ -0,0 +1,30 @@
+"""
+알림 설정값
+settings.NOTIFICATION_SETTINGS 조회 (미설정 항목은 기본값 사용)
+"""
+
+from django.conf import settings
+
+
+DEFAULTS = {
+    'EMAIL_BATCH_SIZE': 200,
+    'EMAIL_MAX_ATTEMPTS': 5,
+    'EMAIL_RETRY_BASE_SECONDS': 60,
+    'EMAIL_SENDING_TIMEOUT': 600,
+    'DAILY_DIGEST_HOUR': 8,
+    'EMAIL_SUBJECT_PREFIX': '[사규관리] ',
+    'ARCHIVE_AFTER_DAYS': 90,
+    'PURGE_AFTER_DAYS': 730,
+    'RETENTION_CHUNK_SIZE': 500,
+    'RETENTION_CHUNK_PAUSE': 0.05,
+    'CHANGE_COALESCE_SECONDS': 300,
+    'CHANGE_COALESCE_MAX_SECONDS': 1800,
+    'CHANGE_DELIVERY': 'BROADCAST',
+}
+
+
+def get_notification_settings():
+    """NOTIFICATION_SETTINGS 설정값 반환"""
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'NOTIFICATION_SETTINGS', {}))
+    return config
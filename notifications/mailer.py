@@ -0,0 +1,254 @@
+"""
+알림 이메일 발송
+발송 대기열(EmailOutbox) 적재 및 배치 발송 로직
+
+- 알림 생성 시 이메일 수신 사용자분만 대기열에 적재합니다.
+- 발송 작업은 배치마다 SMTP 연결 하나를 열어 재사용합니다.
+- 배치는 SMTP 연결 전에 조건부 UPDATE로 발송중(SENDING) 상태로 점유하므로, 발송 작업이 동시에 실행되어도
+  같은 메일을 두 번 보내지 않습니다. 점유 후 EMAIL_SENDING_TIMEOUT 안에 끝나지 않은 배치는 시도 횟수를 늘려
+  다시 발송하고, 최대 시도 횟수를 넘으면 발송실패 처리합니다. (발송 중 작업자가 계속 종료되는 메일의 무한 재발송 방지)
+- 요약 발송 주기(1시간/일간)가 설정된 사용자는 여러 알림을 한 통으로 묶어 보냅니다.
+- 발송 실패 시 지수 백오프로 재시도하고, 최대 시도 횟수를 넘으면 발송실패 처리합니다.
+"""
+
+import uuid
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Case, F, PositiveSmallIntegerField, Q, When
+from django.utils import timezone
+
+from .conf import get_notification_settings
+from .models import EmailOutbox, NotificationSetting
+
+
+def get_digest_send_time(digest, now=None):
+    """
+    요약 발송 주기에 따른 발송 예정 시간 계산
+    - IMMEDIATE: 즉시
+    - HOURLY: 다음 정시
+    - DAILY: 다음 DAILY_DIGEST_HOUR 시각
+    """
+    now = now or timezone.now()
+
+    if digest == 'HOURLY':
+        return (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+
+    if digest == 'DAILY':
+        hour = get_notification_settings()['DAILY_DIGEST_HOUR']
+        local_now = timezone.localtime(now)
+        send_time = local_now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if send_time <= local_now:
+            send_time += timedelta(days=1)
+        return send_time
+
+    return now
+
+
+def queue_notification_emails(notifications):
+    """
+    알림 이메일 대기열 적재
+    이메일 알림을 켠 사용자의 알림만 EmailOutbox에 적재하고 적재 건수를 반환
+    """
+    notifications = [n for n in notifications if n.pk]
+    if not notifications:
+        return 0
+
+    # 이메일 수신 사용자는 전체 사용자 중 일부이므로 한 번에 조회 후 메모리에서 매칭
+    # (수만 명 대상 발송 시 user_id__in 파라미터 수 제한을 피하기 위함)
+    digest_by_user = dict(
+        NotificationSetting.objects.filter(
+            email_notification=True,
+            user__is_active=True,
+        ).exclude(
+            user__email=''
+        ).values_list('user_id', 'email_digest')
+    )
+    if not digest_by_user:
+        return 0
+
+    now = timezone.now()
+    send_times = {}
+    entries = []
+    for notification in notifications:
+        digest = digest_by_user.get(notification.user_id)
+        if digest is None:
+            continue
+        if digest not in send_times:
+            send_times[digest] = get_digest_send_time(digest, now)
+        entries.append(EmailOutbox(
+            user_id=notification.user_id,
+            notification=notification,
+            send_after=send_times[digest],
+        ))
+
+    if entries:
+        EmailOutbox.objects.bulk_create(entries, batch_size=1000)
+
+    return len(entries)
+
+
+def build_email_message(user, entries, connection=None):
+    """
+    발송할 이메일 메시지 생성
+    알림이 1건이면 알림 내용을 그대로, 여러 건이면 요약 메일로 생성
+    """
+    config = get_notification_settings()
+    prefix = config['EMAIL_SUBJECT_PREFIX']
+
+    if len(entries) == 1:
+        notification = entries[0].notification
+        subject = f"{prefix}{notification.title}"
+        body = notification.message
+    else:
+        subject = f"{prefix}알림 요약 ({len(entries)}건)"
+        lines = [f"{user.get_full_name()}님, 확인하지 않은 알림 {len(entries)}건이 있습니다.", ""]
+        for index, entry in enumerate(entries, 1):
+            notification = entry.notification
+            lines.append(
+                f"{index}. {notification.title} "
+                f"({timezone.localtime(notification.created_at).strftime('%Y-%m-%d %H:%M')})"
+            )
+            lines.append(notification.message)
+            lines.append("")
+        body = "\n".join(lines).strip()
+
+    return EmailMessage(
+        subject=subject,
+        body=body,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+        connection=connection,
+    )
+
+
+def send_pending_emails(batch_size=None, now=None):
+    """
+    발송 대기 이메일 배치 발송
+    발송 시간이 된 대기열을 사용자 단위로 묶어 SMTP 연결 하나로 발송
+
+    Returns:
+        (발송 메일 수, 실패 메일 수)
+    """
+    config = get_notification_settings()
+    batch_size = batch_size or config['EMAIL_BATCH_SIZE']
+    now = now or timezone.now()
+    lock_time = timezone.now()
+
+    # 점유한 발송 작업이 점유 시간 안에 끝내지 못한 메일 (중단된 시도도 1회로 셈)
+    stale = Q(status='SENDING', locked_until__lt=lock_time)
+    EmailOutbox.objects.filter(stale, attempts__gte=config['EMAIL_MAX_ATTEMPTS'] - 1).update(
+        status='FAILED',
+        attempts=F('attempts') + 1,
+        locked_by='',
+        locked_until=None,
+        last_error='발송 작업이 시간 안에 끝나지 않았습니다. (EMAIL_SENDING_TIMEOUT)',
+    )
+
+    # 발송 대기 중이거나 점유 시간이 지난 메일
+    due = Q(status='PENDING', send_after__lte=now) | stale
+
+    # 배치 크기는 메일(사용자) 수 기준 - 한 사용자의 대기 알림은 같은 배치에서 묶어서 처리
+    user_ids = list(
+        EmailOutbox.objects.filter(due).order_by('user_id')
+        .values_list('user_id', flat=True).distinct()[:batch_size]
+    )
+    if not user_ids:
+        return 0, 0
+
+    # SMTP 연결 전에 배치 점유 (다른 발송 작업이 먼저 점유한 메일은 제외됨)
+    token = uuid.uuid4().hex
+    EmailOutbox.objects.filter(due, user_id__in=user_ids).update(
+        status='SENDING',
+        attempts=Case(
+            When(stale, then=F('attempts') + 1),
+            default=F('attempts'),
+            output_field=PositiveSmallIntegerField(),
+        ),
+        locked_by=token,
+        locked_until=lock_time + timedelta(seconds=config['EMAIL_SENDING_TIMEOUT']),
+    )
+    owned = EmailOutbox.objects.filter(status='SENDING', locked_by=token)
+
+    grouped = OrderedDict()
+    for entry in owned.select_related(
+        'user', 'notification'
+    ).order_by('user_id', 'notification__created_at'):
+        grouped.setdefault(entry.user_id, []).append(entry)
+    if not grouped:
+        # 모두 다른 발송 작업이 점유 - 다음 배치로 진행
+        return 0, 0
+
+    sent_ids = []
+    failed_entries = []
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        # 연결 자체가 실패하면 배치 전체를 재시도 대상으로 처리
+        for entries in grouped.values():
+            failed_entries.extend((entry, e) for entry in entries)
+    else:
+        try:
+            for entries in grouped.values():
+                message = build_email_message(entries[0].user, entries, connection)
+                try:
+                    connection.send_messages([message])
+                except Exception as e:
+                    failed_entries.extend((entry, e) for entry in entries)
+                else:
+                    sent_ids.extend(entry.pk for entry in entries)
+        finally:
+            connection.close()
+
+    if sent_ids:
+        owned.filter(pk__in=sent_ids).update(
+            status='SENT',
+            sent_at=timezone.now(),
+            attempts=F('attempts') + 1,
+            locked_by='',
+            locked_until=None,
+            last_error='',
+        )
+
+    failed_users = set()
+    if failed_entries:
+        max_attempts = config['EMAIL_MAX_ATTEMPTS']
+        retry_base = config['EMAIL_RETRY_BASE_SECONDS']
+        for entry, error in failed_entries:
+            failed_users.add(entry.user_id)
+            entry.attempts += 1
+            entry.last_error = str(error)[:1000]
+            entry.locked_by = ''
+            entry.locked_until = None
+            if entry.attempts >= max_attempts:
+                entry.status = 'FAILED'
+            else:
+                # 지수 백오프: 60초, 120초, 240초 ...
+                entry.status = 'PENDING'
+                entry.send_after = now + timedelta(seconds=retry_base * 2 ** (entry.attempts - 1))
+        owned.bulk_update(
+            [entry for entry, _ in failed_entries],
+            ['attempts', 'last_error', 'status', 'send_after', 'locked_by', 'locked_until'],
+        )
+
+    return len(grouped) - len(failed_users), len(failed_users)
+
+
+def drain_outbox(batch_size=None):
+    """
+    발송 시간이 된 대기열을 모두 발송
+    배치 단위로 반복하며 (발송 메일 수, 실패 메일 수) 합계를 반환
+    """
+    total_sent = total_failed = 0
+    now = timezone.now()
+    while True:
+        sent, failed = send_pending_emails(batch_size=batch_size, now=now)
+        total_sent += sent
+        total_failed += failed
+        if sent == 0 and failed == 0:
+            break
+    return total_sent, total_failed
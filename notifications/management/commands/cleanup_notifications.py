@@ -0,0 +1,51 @@
+"""
+알림 보관/삭제 명령어
+보관 기간이 지난 읽은 알림을 압축 보관하고, 삭제 기간이 지난 데이터를 정리
+
+사용 예 (cron 등으로 매일 새벽 실행):
+    python manage.py cleanup_notifications
+    python manage.py cleanup_notifications --archive-days 30 --purge-days 365
+"""
+
+from django.core.management.base import BaseCommand
+
+from notifications.retention import archive_read_notifications, purge_expired
+
+
+class Command(BaseCommand):
+    help = '오래된 알림을 압축 보관하고, 보관 기간이 지난 데이터를 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--archive-days',
+            type=int,
+            default=None,
+            help='읽은 알림을 보관할 기준 일수 (기본값: NOTIFICATION_SETTINGS["ARCHIVE_AFTER_DAYS"])'
+        )
+        parser.add_argument(
+            '--purge-days',
+            type=int,
+            default=None,
+            help='완전히 삭제할 기준 일수 (기본값: NOTIFICATION_SETTINGS["PURGE_AFTER_DAYS"])'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='한 트랜잭션에서 처리할 건수 (기본값: NOTIFICATION_SETTINGS["RETENTION_CHUNK_SIZE"])'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+
+        archived = archive_read_notifications(
+            days=options['archive_days'], chunk_size=chunk_size
+        )
+        self.stdout.write(f'  - 보관 처리된 알림: {archived}건')
+
+        purged = purge_expired(days=options['purge_days'], chunk_size=chunk_size)
+        self.stdout.write(f'  - 삭제된 보관 데이터: {purged["archives"]}건')
+        self.stdout.write(f'  - 삭제된 안 읽은 알림: {purged["notifications"]}건')
+        self.stdout.write(f'  - 삭제된 이메일 발송 이력: {purged["emails"]}건')
+
+        self.stdout.write(self.style.SUCCESS('알림 정리 완료!'))
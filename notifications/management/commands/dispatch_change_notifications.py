@@ -0,0 +1,19 @@
+"""
+제개정 알림 발송 명령어
+병합 대기 시간이 지난 제개정 알림을 발송
+
+사용 예 (cron 등으로 1분마다 실행):
+    python manage.py dispatch_change_notifications
+"""
+
+from django.core.management.base import BaseCommand
+
+from notifications.services import dispatch_change_notifications
+
+
+class Command(BaseCommand):
+    help = '병합 대기 시간이 지난 제개정 알림을 발송합니다.'
+
+    def handle(self, *args, **options):
+        count = dispatch_change_notifications()
+        self.stdout.write(self.style.SUCCESS(f'제개정 알림 발송 완료: {count}건'))
@@ -0,0 +1,31 @@
+"""
+알림 이메일 발송 명령어
+발송 대기열(EmailOutbox)에서 발송 시간이 된 이메일을 배치 단위로 발송
+
+사용 예 (cron 등으로 주기 실행):
+    python manage.py send_notification_emails
+    python manage.py send_notification_emails --batch-size 100
+"""
+
+from django.core.management.base import BaseCommand
+
+from notifications.mailer import drain_outbox
+
+
+class Command(BaseCommand):
+    help = '발송 대기 중인 알림 이메일을 배치 단위로 발송합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='SMTP 연결 1회당 발송할 최대 메일 수 (기본값: NOTIFICATION_SETTINGS["EMAIL_BATCH_SIZE"])'
+        )
+
+    def handle(self, *args, **options):
+        sent, failed = drain_outbox(batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'이메일 발송 완료: {sent}통'))
+        if failed:
+            self.stdout.write(self.style.WARNING(f'발송 실패(재시도 예정 포함): {failed}통'))
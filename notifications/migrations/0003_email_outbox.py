@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-19 05:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_add_batch_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationsetting',
+            name='email_digest',
+            field=models.CharField(choices=[('IMMEDIATE', '즉시'), ('HOURLY', '1시간 요약'), ('DAILY', '일간 요약')], default='IMMEDIATE', help_text='여러 알림을 모아 한 통의 메일로 발송하는 주기', max_length=10, verbose_name='이메일 발송주기'),
+        ),
+        migrations.CreateModel(
+            name='EmailOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', '발송대기'), ('SENT', '발송완료'), ('FAILED', '발송실패')], default='PENDING', max_length=10, verbose_name='상태')),
+                ('send_after', models.DateTimeField(help_text='요약 발송 주기 또는 재시도 대기 후 발송 가능한 시간', verbose_name='발송예정시간')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도횟수')),
+                ('last_error', models.TextField(blank=True, verbose_name='최근오류')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='발송시간')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('notification', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='email_outbox', to='notifications.notification', verbose_name='알림')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='email_outbox', to=settings.AUTH_USER_MODEL, verbose_name='수신자')),
+            ],
+            options={
+                'verbose_name': '이메일 발송 대기열',
+                'verbose_name_plural': '이메일 발송 대기열',
+                'ordering': ['send_after'],
+                'indexes': [models.Index(fields=['status', 'send_after'], name='outbox_status_send_after_idx')],
+            },
+        ),
+    ]
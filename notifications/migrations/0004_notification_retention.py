@@ -0,0 +1,49 @@
+# Generated by Django 6.0 on 2026-10-19 05:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_email_outbox'),
+        ('regulations', '0013_commoncode'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.DateField(help_text='알림 생성월의 1일', verbose_name='보관월')),
+                ('notification_count', models.PositiveIntegerField(default=0, verbose_name='알림수')),
+                ('payload', models.BinaryField(verbose_name='압축데이터')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='보관일')),
+            ],
+            options={
+                'verbose_name': '알림 보관',
+                'verbose_name_plural': '알림 보관',
+                'ordering': ['-period'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'is_read', 'created_at'], name='notif_user_read_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'created_at'], name='notif_user_created_idx'),
+        ),
+        migrations.AddField(
+            model_name='notificationarchive',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_archives', to=settings.AUTH_USER_MODEL, verbose_name='수신자'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationarchive',
+            index=models.Index(fields=['user', 'period'], name='notif_archive_user_period_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0 on 2026-10-19 05:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_notification_retention'),
+        ('regulations', '0013_commoncode'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingChangeNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', '병합대기'), ('DISPATCHED', '발송완료')], default='PENDING', max_length=10, verbose_name='상태')),
+                ('event_count', models.PositiveIntegerField(default=1, verbose_name='병합된 변경 수')),
+                ('first_event_at', models.DateTimeField(verbose_name='최초 변경시간')),
+                ('due_at', models.DateTimeField(verbose_name='발송예정시간')),
+                ('dispatched_at', models.DateTimeField(blank=True, null=True, verbose_name='발송시간')),
+                ('notification_count', models.PositiveIntegerField(default=0, verbose_name='발송 알림 수')),
+                ('exclude_user', models.ForeignKey(blank=True, help_text='버전을 등록한 사용자 (여러 사용자가 등록한 경우 비움)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='제외 사용자')),
+                ('regulation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_change_notifications', to='regulations.regulation', verbose_name='관련사규')),
+                ('versions', models.ManyToManyField(related_name='pending_change_notifications', to='regulations.regulationversion', verbose_name='병합된 버전')),
+            ],
+            options={
+                'verbose_name': '제개정 알림 대기',
+                'verbose_name_plural': '제개정 알림 대기',
+                'ordering': ['due_at'],
+                'indexes': [models.Index(fields=['status', 'due_at'], name='pending_change_status_due_idx'), models.Index(fields=['regulation', 'status'], name='pending_change_reg_status_idx')],
+            },
+        ),
+    ]
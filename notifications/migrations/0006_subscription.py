@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-19 05:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_pending_change_notification'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Subscription',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_type', models.CharField(choices=[('GROUP', '그룹'), ('CATEGORY', '분류'), ('TAG', '태그'), ('DEPARTMENT', '책임부서'), ('FAVORITE', '즐겨찾기 사규')], max_length=20, verbose_name='구독유형')),
+                ('target_value', models.CharField(blank=True, help_text='그룹명, 분류코드, 태그명 또는 부서 ID (즐겨찾기는 비움)', max_length=100, verbose_name='구독대상')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='subscriptions', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '알림 구독',
+                'verbose_name_plural': '알림 구독',
+                'ordering': ['target_type', 'target_value'],
+                'indexes': [models.Index(fields=['target_type', 'target_value'], name='subscription_target_idx')],
+                'unique_together': {('user', 'target_type', 'target_value')},
+            },
+        ),
+    ]
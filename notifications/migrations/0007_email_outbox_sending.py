@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-19 07:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0006_subscription'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailoutbox',
+            name='locked_by',
+            field=models.CharField(blank=True, max_length=32, verbose_name='발송작업'),
+        ),
+        migrations.AddField(
+            model_name='emailoutbox',
+            name='locked_until',
+            field=models.DateTimeField(blank=True, help_text='발송 작업이 응답 없이 이 시간을 넘기면 다른 발송 작업이 다시 발송', null=True, verbose_name='점유만료시간'),
+        ),
+        migrations.AlterField(
+            model_name='emailoutbox',
+            name='status',
+            field=models.CharField(choices=[('PENDING', '발송대기'), ('SENDING', '발송중'), ('SENT', '발송완료'), ('FAILED', '발송실패')], default='PENDING', max_length=10, verbose_name='상태'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.db import migrations
+
+
+def seed_subscriptions(apps, schema_editor):
+    """재직 중인 사용자의 기본 구독 생성 (즐겨찾기 사규, 소속부서 책임 사규)"""
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    Subscription = apps.get_model('notifications', 'Subscription')
+
+    subscriptions = []
+    for user_id, department_id in User.objects.filter(is_active=True).values_list('pk', 'department_id').iterator():
+        subscriptions.append(Subscription(user_id=user_id, target_type='FAVORITE', target_value=''))
+        if department_id:
+            subscriptions.append(Subscription(
+                user_id=user_id, target_type='DEPARTMENT', target_value=str(department_id)
+            ))
+    Subscription.objects.bulk_create(subscriptions, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_email_outbox_sending'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_subscriptions, migrations.RunPython.noop),
+    ]
@@ -3,7 +3,10 @@
 Notification models for nCompliance
 """
 
+import json
 import uuid
+import zlib
+
 from django.db import models
 from django.conf import settings
 
@@ -47,6 +50,11 @@ class Notification(models.Model):
         verbose_name = '알림'
         verbose_name_plural = '알림'
         ordering = ['-created_at']
+        indexes = [
+            # 알림함 조회(전체/안 읽은 알림 최신순) 및 보관 대상 조회용
+            models.Index(fields=['user', 'is_read', 'created_at'], name='notif_user_read_created_idx'),
+            models.Index(fields=['user', 'created_at'], name='notif_user_created_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.get_notification_type_display()}] {self.title}"
@@ -77,6 +85,12 @@ class NotificationSetting(models.Model):
     알림 설정 모델
     사용자별 알림 수신 설정
     """
+    DIGEST_CHOICES = [
+        ('IMMEDIATE', '즉시'),
+        ('HOURLY', '1시간 요약'),
+        ('DAILY', '일간 요약'),
+    ]
+
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -87,6 +101,9 @@ class NotificationSetting(models.Model):
     receive_expiry_notification = models.BooleanField('만료예정알림수신', default=True)
     receive_review_notification = models.BooleanField('검토요청알림수신', default=True)
     email_notification = models.BooleanField('이메일알림', default=False)
+    email_digest = models.CharField('이메일 발송주기', max_length=10,
+                                    choices=DIGEST_CHOICES, default='IMMEDIATE',
+                                    help_text='여러 알림을 모아 한 통의 메일로 발송하는 주기')
     created_at = models.DateTimeField('생성일', auto_now_add=True)
     updated_at = models.DateTimeField('수정일', auto_now=True)
 
@@ -98,6 +115,189 @@ class NotificationSetting(models.Model):
         return f"{self.user.username}의 알림 설정"
 
 
+class EmailOutbox(models.Model):
+    """
+    이메일 발송 대기열 모델
+    알림 생성 시 적재되고, 발송 작업(send_notification_emails)이 배치 단위로 처리
+    """
+    STATUS_CHOICES = [
+        ('PENDING', '발송대기'),
+        ('SENDING', '발송중'),
+        ('SENT', '발송완료'),
+        ('FAILED', '발송실패'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='email_outbox',
+        verbose_name='수신자'
+    )
+    notification = models.ForeignKey(
+        Notification,
+        on_delete=models.CASCADE,
+        related_name='email_outbox',
+        verbose_name='알림'
+    )
+    status = models.CharField('상태', max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    send_after = models.DateTimeField('발송예정시간',
+                                      help_text='요약 발송 주기 또는 재시도 대기 후 발송 가능한 시간')
+    attempts = models.PositiveSmallIntegerField('시도횟수', default=0)
+    locked_by = models.CharField('발송작업', max_length=32, blank=True)
+    locked_until = models.DateTimeField('점유만료시간', null=True, blank=True,
+                                        help_text='발송 작업이 응답 없이 이 시간을 넘기면 다른 발송 작업이 다시 발송')
+    last_error = models.TextField('최근오류', blank=True)
+    sent_at = models.DateTimeField('발송시간', null=True, blank=True)
+    created_at = models.DateTimeField('생성일', auto_now_add=True)
+
+    class Meta:
+        verbose_name = '이메일 발송 대기열'
+        verbose_name_plural = '이메일 발송 대기열'
+        ordering = ['send_after']
+        indexes = [
+            models.Index(fields=['status', 'send_after'], name='outbox_status_send_after_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.notification.title} ({self.get_status_display()})"
+
+
+class NotificationArchive(models.Model):
+    """
+    알림 보관 모델
+    보관 기간이 지난 읽은 알림을 사용자/월 단위로 압축하여 보관
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notification_archives',
+        verbose_name='수신자'
+    )
+    period = models.DateField('보관월', help_text='알림 생성월의 1일')
+    notification_count = models.PositiveIntegerField('알림수', default=0)
+    payload = models.BinaryField('압축데이터')
+    created_at = models.DateTimeField('보관일', auto_now_add=True)
+
+    class Meta:
+        verbose_name = '알림 보관'
+        verbose_name_plural = '알림 보관'
+        ordering = ['-period']
+        indexes = [
+            models.Index(fields=['user', 'period'], name='notif_archive_user_period_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} {self.period:%Y-%m} ({self.notification_count}건)"
+
+    @staticmethod
+    def compress(records):
+        """알림 레코드 목록을 압축 데이터로 변환"""
+        return zlib.compress(
+            json.dumps(records, ensure_ascii=False, default=str).encode('utf-8'), 9
+        )
+
+    def get_records(self):
+        """압축된 알림 레코드 목록 반환"""
+        return json.loads(zlib.decompress(bytes(self.payload)).decode('utf-8'))
 
 
+class PendingChangeNotification(models.Model):
+    """
+    제개정 알림 병합 대기 모델
+    같은 사규의 연속된 버전 등록을 일정 시간 모아 한 번의 알림으로 발송
+    """
+    STATUS_CHOICES = [
+        ('PENDING', '병합대기'),
+        ('DISPATCHED', '발송완료'),
+    ]
+
+    regulation = models.ForeignKey(
+        'regulations.Regulation',
+        on_delete=models.CASCADE,
+        related_name='pending_change_notifications',
+        verbose_name='관련사규'
+    )
+    versions = models.ManyToManyField(
+        'regulations.RegulationVersion',
+        related_name='pending_change_notifications',
+        verbose_name='병합된 버전'
+    )
+    exclude_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='제외 사용자',
+        help_text='버전을 등록한 사용자 (여러 사용자가 등록한 경우 비움)'
+    )
+    status = models.CharField('상태', max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    event_count = models.PositiveIntegerField('병합된 변경 수', default=1)
+    first_event_at = models.DateTimeField('최초 변경시간')
+    due_at = models.DateTimeField('발송예정시간')
+    dispatched_at = models.DateTimeField('발송시간', null=True, blank=True)
+    notification_count = models.PositiveIntegerField('발송 알림 수', default=0)
+
+    class Meta:
+        verbose_name = '제개정 알림 대기'
+        verbose_name_plural = '제개정 알림 대기'
+        ordering = ['due_at']
+        indexes = [
+            models.Index(fields=['status', 'due_at'], name='pending_change_status_due_idx'),
+            models.Index(fields=['regulation', 'status'], name='pending_change_reg_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.regulation} ({self.event_count}건, {self.get_status_display()})"
+
+
+class Subscription(models.Model):
+    """
+    알림 구독 모델
+    사용자가 관심 있는 그룹/분류/태그/책임부서/즐겨찾기 사규의 제개정 알림만 수신
+    """
+    TARGET_TYPE_CHOICES = [
+        ('GROUP', '그룹'),
+        ('CATEGORY', '분류'),
+        ('TAG', '태그'),
+        ('DEPARTMENT', '책임부서'),
+        ('FAVORITE', '즐겨찾기 사규'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='subscriptions',
+        verbose_name='사용자'
+    )
+    target_type = models.CharField('구독유형', max_length=20, choices=TARGET_TYPE_CHOICES)
+    target_value = models.CharField('구독대상', max_length=100, blank=True,
+                                    help_text='그룹명, 분류코드, 태그명 또는 부서 ID (즐겨찾기는 비움)')
+    created_at = models.DateTimeField('생성일', auto_now_add=True)
+
+    class Meta:
+        verbose_name = '알림 구독'
+        verbose_name_plural = '알림 구독'
+        ordering = ['target_type', 'target_value']
+        unique_together = ['user', 'target_type', 'target_value']
+        indexes = [
+            models.Index(fields=['target_type', 'target_value'], name='subscription_target_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.get_target_type_display()}: {self.get_target_display()}"
 
+    def get_target_display(self):
+        """구독 대상 표시명"""
+        if self.target_type == 'FAVORITE':
+            return '즐겨찾기한 사규'
+        if self.target_type == 'CATEGORY':
+            from regulations.codes import get_labels
+            from regulations.models import Regulation
+            labels = get_labels('CATEGORY', Regulation.CATEGORY_CHOICES)
+            return labels.get(self.target_value, self.target_value)
+        if self.target_type == 'DEPARTMENT':
+            from accounts.models import Department
+            department = Department.objects.filter(pk=self.target_value).first() if self.target_value.isdigit() else None
+            return department.name if department else self.target_value
+        return self.target_value
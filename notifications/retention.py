@@ -0,0 +1,114 @@
+"""
+알림 보관 및 삭제
+보관 기간이 지난 알림을 압축 보관 테이블로 옮기고, 아주 오래된 데이터는 삭제
+
+모든 작업은 RETENTION_CHUNK_SIZE 단위의 짧은 트랜잭션으로 나누어 실행하여
+SQLite의 데이터베이스 쓰기 잠금을 오래 점유하지 않도록 합니다.
+"""
+
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .conf import get_notification_settings
+from .models import EmailOutbox, Notification, NotificationArchive
+
+
+def _run_in_chunks(queryset, handler, chunk_size, pause):
+    """
+    쿼리셋을 pk 기준 청크로 나누어 handler(pk 목록)를 반복 실행
+    처리한 총 건수를 반환
+    """
+    total = 0
+    while True:
+        pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:chunk_size])
+        if not pks:
+            break
+        with transaction.atomic():
+            handler(pks)
+        total += len(pks)
+        if len(pks) < chunk_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return total
+
+
+def archive_read_notifications(days=None, chunk_size=None, pause=None, now=None):
+    """
+    읽은 알림 보관
+    생성 후 days일이 지난 읽은 알림을 사용자/월 단위로 압축하여 NotificationArchive로 이동
+    """
+    config = get_notification_settings()
+    days = config['ARCHIVE_AFTER_DAYS'] if days is None else days
+    chunk_size = chunk_size or config['RETENTION_CHUNK_SIZE']
+    pause = config['RETENTION_CHUNK_PAUSE'] if pause is None else pause
+    cutoff = (now or timezone.now()) - timedelta(days=days)
+
+    queryset = Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+
+    def archive(pks):
+        partitions = {}
+        for notification in Notification.objects.filter(pk__in=pks).order_by('created_at'):
+            created = timezone.localtime(notification.created_at)
+            key = (notification.user_id, created.date().replace(day=1))
+            partitions.setdefault(key, []).append({
+                'id': notification.pk,
+                'regulation_id': notification.regulation_id,
+                'notification_type': notification.notification_type,
+                'title': notification.title,
+                'message': notification.message,
+                'read_at': notification.read_at.isoformat() if notification.read_at else None,
+                'created_at': notification.created_at.isoformat(),
+                'batch_id': str(notification.batch_id) if notification.batch_id else None,
+            })
+
+        NotificationArchive.objects.bulk_create([
+            NotificationArchive(
+                user_id=user_id,
+                period=period,
+                notification_count=len(records),
+                payload=NotificationArchive.compress(records),
+            )
+            for (user_id, period), records in partitions.items()
+        ])
+        Notification.objects.filter(pk__in=pks).delete()
+
+    return _run_in_chunks(queryset, archive, chunk_size, pause)
+
+
+def purge_expired(days=None, chunk_size=None, pause=None, now=None):
+    """
+    오래된 알림 데이터 삭제
+    - 보관월이 days일 이전인 보관 데이터
+    - days일이 지난 안 읽은 알림
+    - days일이 지난 발송완료/발송실패 이메일 대기열
+
+    Returns:
+        항목별 삭제 건수 dict
+    """
+    config = get_notification_settings()
+    days = config['PURGE_AFTER_DAYS'] if days is None else days
+    chunk_size = chunk_size or config['RETENTION_CHUNK_SIZE']
+    pause = config['RETENTION_CHUNK_PAUSE'] if pause is None else pause
+    cutoff = (now or timezone.now()) - timedelta(days=days)
+
+    def delete_from(model):
+        return lambda pks: model.objects.filter(pk__in=pks).delete()
+
+    return {
+        'archives': _run_in_chunks(
+            NotificationArchive.objects.filter(period__lt=cutoff.date().replace(day=1)),
+            delete_from(NotificationArchive), chunk_size, pause,
+        ),
+        'notifications': _run_in_chunks(
+            Notification.objects.filter(created_at__lt=cutoff),
+            delete_from(Notification), chunk_size, pause,
+        ),
+        'emails': _run_in_chunks(
+            EmailOutbox.objects.filter(status__in=['SENT', 'FAILED'], created_at__lt=cutoff),
+            delete_from(EmailOutbox), chunk_size, pause,
+        ),
+    }
@@ -3,10 +3,14 @@
 알림 생성 및 발송 로직
 """
 
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 
-from .models import Notification, NotificationSetting
+from .conf import get_notification_settings
+from .models import Notification, NotificationSetting, PendingChangeNotification
+from .mailer import queue_notification_emails
+from .subscriptions import subscriber_ids_query
 from accounts.models import User
 
 
@@ -14,6 +18,7 @@ def create_change_notification(regulation, version, exclude_user=None):
     """
     제개정 알림 생성
     사규가 제정/개정/폐지되었을 때 관련 사용자에게 알림 발송
+    version에 버전 목록을 넘기면 여러 변경을 요약한 알림 한 건으로 발송
     """
     change_type_labels = {
         'CREATE': '제정',
@@ -21,60 +26,159 @@ def create_change_notification(regulation, version, exclude_user=None):
         'ABOLISH': '폐지',
     }
     
-    change_label = change_type_labels.get(version.change_type, '변경')
+    versions = list(version) if isinstance(version, (list, tuple)) else [version]
+    latest = versions[-1]
+    change_label = change_type_labels.get(latest.change_type, '변경')
     
     # 알림 제목 및 내용
     title = f"[{change_label}] {regulation.title}"
-    message = f"""
+    if len(versions) == 1:
+        message = f"""
 사규가 {change_label}되었습니다.
 
 - 사규코드: {regulation.code}
 - 사규명: {regulation.title}
-- 버전: v{version.version_number}
-- 변경사유: {version.change_reason}
-- {change_label}일: {version.created_at.strftime('%Y-%m-%d')}
-    """.strip()
+- 버전: v{latest.version_number}
+- 변경사유: {latest.change_reason}
+- {change_label}일: {latest.created_at.strftime('%Y-%m-%d')}
+        """.strip()
+    else:
+        history = "\n".join(
+            f"- v{v.version_number} ({change_type_labels.get(v.change_type, '변경')}): {v.change_reason}"
+            for v in versions
+        )
+        message = f"""
+사규가 {change_label}되었습니다. (변경 {len(versions)}건)
+
+- 사규코드: {regulation.code}
+- 사규명: {regulation.title}
+- 최종버전: v{latest.version_number}
+- {change_label}일: {latest.created_at.strftime('%Y-%m-%d')}
+
+[변경 내역]
+{history}
+        """.strip()
     
     # 알림 수신 대상 결정
-    if regulation.scope == 'ALL':
-        # 전 임직원
-        users = User.objects.filter(is_active=True)
-    else:
+    users = User.objects.filter(is_active=True)
+    if get_notification_settings()['CHANGE_DELIVERY'] == 'SUBSCRIPTION' and not regulation.is_mandatory:
+        # 사규의 그룹/분류/태그/책임부서/즐겨찾기를 구독한 사용자에게만 발송
+        # (의무준수 사규는 구독과 관계없이 적용범위 전체에 발송)
+        users = users.filter(pk__in=subscriber_ids_query(regulation))
+    
+    if regulation.scope != 'ALL':
         # 해당 부서만
-        users = User.objects.filter(
-            is_active=True,
-            department=regulation.responsible_dept
-        )
+        users = users.filter(department=regulation.responsible_dept)
     
     # 제외 사용자 처리
     if exclude_user:
         users = users.exclude(pk=exclude_user.pk)
     
+    # 제개정 알림 수신을 끈 사용자 제외 (설정이 없는 사용자는 수신)
+    users = users.exclude(notification_setting__receive_change_notification=False)
+    
     # 알림 생성
-    notifications = []
-    for user in users:
-        # 알림 설정 확인
-        try:
-            setting = user.notification_setting
-            if not setting.receive_change_notification:
-                continue
-        except NotificationSetting.DoesNotExist:
-            pass
-        
-        notifications.append(Notification(
-            user=user,
+    notifications = [
+        Notification(
+            user_id=user_id,
             regulation=regulation,
             notification_type='CHANGE',
             title=title,
             message=message,
-        ))
+        )
+        for user_id in users.values_list('pk', flat=True)
+    ]
     
     if notifications:
-        Notification.objects.bulk_create(notifications)
+        Notification.objects.bulk_create(notifications, batch_size=1000)
+        queue_notification_emails(notifications)
     
     return len(notifications)
 
 
+def schedule_change_notification(regulation, version, exclude_user=None):
+    """
+    제개정 알림 예약
+    같은 사규에 대기 중인 알림이 있으면 새 버전을 병합하고 대기 시간을 연장
+    (CHANGE_COALESCE_SECONDS가 0이면 즉시 발송)
+    """
+    config = get_notification_settings()
+    window = timedelta(seconds=config['CHANGE_COALESCE_SECONDS'])
+    max_delay = timedelta(seconds=config['CHANGE_COALESCE_MAX_SECONDS'])
+
+    if not window:
+        from .tasks import send_change_notification
+        send_change_notification.delay(
+            regulation.pk, [version.pk], exclude_user.pk if exclude_user else None
+        )
+        return 0
+
+    now = timezone.now()
+    with transaction.atomic():
+        pending = PendingChangeNotification.objects.select_for_update().filter(
+            regulation=regulation,
+            status='PENDING',
+        ).first()
+
+        if pending:
+            # 이전 발송 예약은 취소하고 새 버전을 병합하여 다시 대기
+            pending.event_count += 1
+            pending.due_at = min(now + window, pending.first_event_at + max_delay)
+            if exclude_user is None or pending.exclude_user_id != exclude_user.pk:
+                pending.exclude_user = None
+            pending.save(update_fields=['event_count', 'due_at', 'exclude_user'])
+        else:
+            pending = PendingChangeNotification.objects.create(
+                regulation=regulation,
+                exclude_user=exclude_user,
+                first_event_at=now,
+                due_at=now + window,
+            )
+        pending.versions.add(version)
+
+    return 0
+
+
+def dispatch_change_notifications(now=None):
+    """
+    병합 대기 시간이 지난 제개정 알림 발송
+    발송한 알림 수를 반환
+    """
+    now = now or timezone.now()
+    total_notifications = 0
+
+    pending_ids = list(
+        PendingChangeNotification.objects.filter(
+            status='PENDING', due_at__lte=now
+        ).values_list('pk', flat=True)
+    )
+
+    for pending_id in pending_ids:
+        with transaction.atomic():
+            # 다른 작업이 이미 발송했거나 병합으로 대기 시간이 연장된 경우 건너뜀
+            pending = PendingChangeNotification.objects.select_for_update().filter(
+                pk=pending_id, status='PENDING', due_at__lte=now
+            ).select_related('regulation', 'exclude_user').first()
+            if not pending:
+                continue
+
+            versions = list(pending.versions.order_by('created_at', 'pk'))
+            count = 0
+            if versions:
+                count = create_change_notification(
+                    pending.regulation, versions, exclude_user=pending.exclude_user
+                )
+
+            pending.status = 'DISPATCHED'
+            pending.dispatched_at = timezone.now()
+            pending.notification_count = count
+            pending.save(update_fields=['status', 'dispatched_at', 'notification_count'])
+
+        total_notifications += count
+
+    return total_notifications
+
+
 def create_expiry_notification(regulation, days_until_expiry):
     """
     만료예정 알림 생성
@@ -117,6 +221,7 @@ def create_expiry_notification(regulation, days_until_expiry):
     
     if notifications:
         Notification.objects.bulk_create(notifications)
+        queue_notification_emails(notifications)
     
     return len(notifications)
 
@@ -190,11 +295,18 @@ def create_review_notification(regulation, requester):
     
     if notifications:
         Notification.objects.bulk_create(notifications)
+        queue_notification_emails(notifications)
     
     return len(notifications)
 
 
-
-
-
-
+def get_broadcast_recipients(target, target_role='', target_users=None):
+    """
+    관리자 알림 발송 대상 사용자 쿼리셋
+    target: all(전체), role(역할별), user(지정 사용자)
+    """
+    if target == 'role' and target_role:
+        return User.objects.filter(is_active=True, role=target_role)
+    if target == 'user' and target_users:
+        return User.objects.filter(pk__in=target_users, is_active=True)
+    return User.objects.filter(is_active=True)
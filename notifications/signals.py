@@ -0,0 +1,17 @@
+"""
+알림 시그널
+- 사용자 생성 시 기본 알림 구독(즐겨찾기 사규, 소속부서 책임 사규) 생성
+"""
+
+from django.conf import settings
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .subscriptions import create_default_subscriptions
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def subscribe_new_user(sender, instance, created, raw=False, **kwargs):
+    """새 사용자 기본 구독 생성"""
+    if created and not raw:
+        create_default_subscriptions([instance])
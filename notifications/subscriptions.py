@@ -0,0 +1,68 @@
+"""
+알림 구독 매칭
+변경된 사규의 속성(그룹/분류/태그/책임부서/즐겨찾기)과 일치하는 구독자 조회
+사용자마다 즐겨찾기 사규와 소속부서 책임 사규의 기본 구독을 만듦 (notifications.signals)
+
+구독 조건은 하나의 SQL 조건으로 합쳐지므로, 사규 변경 1건당 단일 쿼리로
+수신자를 찾으며 다른 쿼리의 서브쿼리로도 그대로 사용할 수 있습니다.
+"""
+
+from django.db.models import Q
+
+from .models import Subscription
+
+
+def get_subscription_filter(regulation):
+    """사규와 일치하는 구독 조건(Q) 생성"""
+    from regulations.models import Favorite, RegulationTag
+
+    condition = Q(target_type='CATEGORY', target_value=regulation.category)
+
+    if regulation.group:
+        condition |= Q(target_type='GROUP', target_value=regulation.group)
+
+    if regulation.responsible_dept_id:
+        condition |= Q(target_type='DEPARTMENT', target_value=str(regulation.responsible_dept_id))
+
+    if regulation.pk:
+        condition |= Q(
+            target_type='TAG',
+            target_value__in=RegulationTag.objects.filter(
+                regulations=regulation
+            ).values('name'),
+        )
+        condition |= Q(
+            target_type='FAVORITE',
+            user_id__in=Favorite.objects.filter(
+                regulation=regulation
+            ).values('user_id'),
+        )
+
+    return condition
+
+
+def subscriber_ids_query(regulation):
+    """구독자 ID 쿼리셋 (서브쿼리용, 평가 전까지 쿼리를 실행하지 않음)"""
+    return Subscription.objects.filter(
+        get_subscription_filter(regulation)
+    ).values('user_id').distinct()
+
+
+def match_subscribers(regulation):
+    """사규 변경 시 알림을 받을 구독자 ID 집합 반환 (단일 쿼리)"""
+    return set(subscriber_ids_query(regulation).values_list('user_id', flat=True))
+
+
+def create_default_subscriptions(users):
+    """
+    기본 구독 생성: 즐겨찾기한 사규, 소속부서가 책임부서인 사규
+    이미 있는 구독은 건너뜀
+    """
+    subscriptions = []
+    for user in users:
+        subscriptions.append(Subscription(user_id=user.pk, target_type='FAVORITE', target_value=''))
+        if user.department_id:
+            subscriptions.append(Subscription(
+                user_id=user.pk, target_type='DEPARTMENT', target_value=str(user.department_id)
+            ))
+    Subscription.objects.bulk_create(subscriptions, batch_size=1000, ignore_conflicts=True)
@@ -0,0 +1,80 @@
+"""
+알림 백그라운드 작업
+알림 대량 생성, 이메일 발송, 만료예정 점검 등 요청 처리와 분리된 작업
+"""
+
+import uuid
+
+from tasks.registry import task
+
+
+@task(name='notifications.send_change_notification', priority=5)
+def send_change_notification(regulation_id, version_ids, exclude_user_id=None):
+    """제개정 알림 발송"""
+    from accounts.models import User
+    from regulations.models import Regulation, RegulationVersion
+    from .services import create_change_notification
+
+    regulation = Regulation.objects.filter(pk=regulation_id).first()
+    versions = list(
+        RegulationVersion.objects.filter(pk__in=version_ids).order_by('created_at', 'pk')
+    )
+    if not regulation or not versions:
+        return 0
+
+    exclude_user = User.objects.filter(pk=exclude_user_id).first() if exclude_user_id else None
+    return create_change_notification(regulation, versions, exclude_user=exclude_user)
+
+
+@task(name='notifications.broadcast_notification', priority=5)
+def broadcast_notification(target, target_role, target_users, notification_type, title, message, batch_id):
+    """관리자 알림 일괄 발송 (동일한 batch_id로 묶음)"""
+    from .mailer import queue_notification_emails
+    from .models import Notification
+    from .services import get_broadcast_recipients
+
+    users = get_broadcast_recipients(target, target_role, target_users)
+    notifications = [
+        Notification(
+            user_id=user_id,
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            batch_id=uuid.UUID(batch_id),
+        )
+        for user_id in users.values_list('pk', flat=True)
+    ]
+    Notification.objects.bulk_create(notifications, batch_size=1000)
+    queue_notification_emails(notifications)
+    return len(notifications)
+
+
+@task(name='notifications.dispatch_change_notifications', every=60)
+def dispatch_change_notifications():
+    """병합 대기 시간이 지난 제개정 알림 발송 (1분 주기)"""
+    from .services import dispatch_change_notifications as dispatch
+    return dispatch()
+
+
+@task(name='notifications.send_notification_emails', every=60)
+def send_notification_emails():
+    """발송 대기 이메일 발송 (1분 주기)"""
+    from .mailer import drain_outbox
+    sent, failed = drain_outbox()
+    return {'sent': sent, 'failed': failed}
+
+
+@task(name='notifications.check_expiry_notifications', every=24 * 60 * 60)
+def check_expiry_notifications():
+    """만료예정 알림 점검 (1일 주기)"""
+    from .services import check_expiry_notifications as check
+    return check()
+
+
+@task(name='notifications.cleanup_notifications', every=24 * 60 * 60)
+def cleanup_notifications():
+    """오래된 알림 보관/삭제 (1일 주기)"""
+    from .retention import archive_read_notifications, purge_expired
+    purged = purge_expired()
+    purged['archived'] = archive_read_notifications()
+    return purged
@@ -16,6 +16,8 @@ urlpatterns = [
     path('<int:pk>/delete/', views.notification_delete, name='delete'),
     path('mark-all-read/', views.mark_all_as_read, name='mark_all_read'),
     path('settings/', views.notification_settings, name='settings'),
+    path('subscriptions/add/', views.subscription_add, name='subscription_add'),
+    path('subscriptions/<int:pk>/delete/', views.subscription_delete, name='subscription_delete'),
     path('unread-count/', views.unread_count, name='unread_count'),
 ]
 
@@ -10,8 +10,12 @@ from django.http import JsonResponse
 from django.utils import timezone
 from django.core.paginator import Paginator
 
-from .models import Notification, NotificationSetting
-from accounts.models import User
+from .models import Notification, NotificationSetting, Subscription
+from .services import get_broadcast_recipients
+from .tasks import broadcast_notification
+from accounts.models import Department, User
+from regulations.codes import get_model_choices
+from regulations.models import Regulation, RegulationTag
 
 
 def is_admin(user):
@@ -119,15 +123,63 @@ def notification_settings(request):
         setting.receive_expiry_notification = request.POST.get('receive_expiry', '') == 'on'
         setting.receive_review_notification = request.POST.get('receive_review', '') == 'on'
         setting.email_notification = request.POST.get('email_notification', '') == 'on'
+        email_digest = request.POST.get('email_digest', 'IMMEDIATE')
+        if email_digest in dict(NotificationSetting.DIGEST_CHOICES):
+            setting.email_digest = email_digest
         setting.save()
         
         return redirect('notifications:settings')
     
     return render(request, 'notifications/settings.html', {
         'setting': setting,
+        'digest_choices': NotificationSetting.DIGEST_CHOICES,
+        'subscriptions': request.user.subscriptions.all(),
+        'has_favorite_subscription': request.user.subscriptions.filter(target_type='FAVORITE').exists(),
+        'group_options': Regulation.objects.exclude(group='').values_list('group', flat=True).distinct().order_by('group'),
+        'category_options': get_model_choices('CATEGORY', Regulation.CATEGORY_CHOICES),
+        'tag_options': RegulationTag.objects.values_list('name', flat=True),
+        'department_options': Department.objects.filter(is_active=True),
     })
 
 
+@login_required
+def subscription_add(request):
+    """알림 구독 추가"""
+    if request.method == 'POST':
+        target_type = request.POST.get('target_type', '')
+        target_value = request.POST.get(f'target_value_{target_type.lower()}', '').strip()
+
+        if target_type not in dict(Subscription.TARGET_TYPE_CHOICES):
+            messages.error(request, '구독 유형을 선택해 주세요.')
+        elif target_type != 'FAVORITE' and not target_value:
+            messages.error(request, '구독 대상을 선택해 주세요.')
+        else:
+            if target_type == 'FAVORITE':
+                target_value = ''
+            _, created = Subscription.objects.get_or_create(
+                user=request.user,
+                target_type=target_type,
+                target_value=target_value,
+            )
+            if created:
+                messages.success(request, '알림 구독이 추가되었습니다.')
+            else:
+                messages.info(request, '이미 구독 중입니다.')
+
+    return redirect('notifications:settings')
+
+
+@login_required
+def subscription_delete(request, pk):
+    """알림 구독 해제"""
+    if request.method == 'POST':
+        subscription = get_object_or_404(Subscription, pk=pk, user=request.user)
+        subscription.delete()
+        messages.success(request, '알림 구독이 해제되었습니다.')
+
+    return redirect('notifications:settings')
+
+
 @login_required
 def unread_count(request):
     """안 읽은 알림 수 반환 (AJAX)"""
@@ -155,30 +207,13 @@ def notification_create(request):
             messages.error(request, '제목과 내용은 필수 입력 항목입니다.')
             return redirect('notifications:create')
         
-        # 대상 사용자 결정
-        if target == 'all':
-            users = User.objects.filter(is_active=True)
-        elif target == 'role' and target_role:
-            users = User.objects.filter(is_active=True, role=target_role)
-        elif target == 'user' and target_users:
-            users = User.objects.filter(pk__in=target_users, is_active=True)
-        else:
-            users = User.objects.filter(is_active=True)
-        
-        # 알림 생성 (동일한 batch_id로 묶음)
-        batch_id = uuid.uuid4()
-        created_count = 0
-        for user in users:
-            Notification.objects.create(
-                user=user,
-                notification_type=notification_type,
-                title=title,
-                message=message,
-                batch_id=batch_id,
-            )
-            created_count += 1
+        # 알림 생성은 백그라운드 작업으로 처리 (동일한 batch_id로 묶음)
+        recipient_count = get_broadcast_recipients(target, target_role, target_users).count()
+        broadcast_notification.delay(
+            target, target_role, target_users, notification_type, title, message, str(uuid.uuid4())
+        )
         
-        messages.success(request, f'{created_count}명에게 알림이 발송되었습니다.')
+        messages.success(request, f'{recipient_count}명에게 알림 발송이 요청되었습니다.')
         return redirect('notifications:list')
     
     # GET 요청
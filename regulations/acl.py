@@ -0,0 +1,218 @@
+"""
+사규 접근 권한 일괄 지정
+사번 목록, 부서(하위부서 포함), 법인 코드로 접근 가능 직원/부서를 한 번에 지정합니다.
+
+- 사번은 BATCH_SIZE 단위로 나누어 묶음마다 쿼리 1회로 조회
+- 하위부서는 재귀 CTE(WITH RECURSIVE) 한 번으로 조회
+- 현재 allowed_users/allowed_departments와 비교하여 바뀐 부분만 중간 테이블에 일괄 추가/삭제
+"""
+
+import csv
+import io
+import re
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from accounts.models import Company, Department, User
+
+
+# 사번 조회/중간 테이블 추가·삭제 단위
+BATCH_SIZE = 500
+
+# 적용 방식
+MODE_CHOICES = [
+    ('ADD', '추가'),
+    ('REMOVE', '제외'),
+    ('REPLACE', '교체'),
+]
+
+SEPARATORS = re.compile(r'[\s,;]+')
+
+
+def parse_codes(text):
+    """쉼표/공백/줄바꿈으로 구분한 코드 목록 (입력 순서 유지, 중복 제거)"""
+    return list(dict.fromkeys(code for code in SEPARATORS.split(text or '') if code))
+
+
+def read_employee_file(uploaded):
+    """업로드한 사번 파일 (.xlsx는 첫 번째 열, .csv/.txt는 모든 값)"""
+    if uploaded.name.lower().endswith('.xlsx'):
+        from openpyxl import load_workbook
+
+        sheet = load_workbook(uploaded, read_only=True, data_only=True).active
+        values = [row[0] for row in sheet.iter_rows(values_only=True) if row and row[0] is not None]
+        return parse_codes('\n'.join(str(value) for value in values))
+    text = uploaded.read().decode('utf-8-sig', errors='replace')
+    return parse_codes('\n'.join(' '.join(row) for row in csv.reader(io.StringIO(text))))
+
+
+def _batches(values):
+    values = list(values)
+    for start in range(0, len(values), BATCH_SIZE):
+        yield values[start:start + BATCH_SIZE]
+
+
+def resolve_users(employee_ids):
+    """
+    사번 → 직원 ID
+    Returns:
+        ({직원 ID, ...}, [없는 사번, ...])
+    """
+    found = {}
+    for batch in _batches(employee_ids):
+        found.update(User.objects.filter(employee_id__in=batch).values_list('employee_id', 'pk'))
+    return set(found.values()), [code for code in employee_ids if code not in found]
+
+
+def department_subtree(department_ids):
+    """부서와 모든 하위부서 ID (재귀 CTE 1회)"""
+    department_ids = list(department_ids)
+    if not department_ids:
+        return set()
+    table = connection.ops.quote_name(Department._meta.db_table)
+    placeholders = ', '.join(['%s'] * len(department_ids))
+    sql = f"""
+        WITH RECURSIVE tree(id) AS (
+            SELECT id FROM {table} WHERE id IN ({placeholders})
+            UNION
+            SELECT d.id FROM {table} d JOIN tree t ON d.parent_id = t.id
+        )
+        SELECT id FROM tree
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, department_ids)
+        return {row[0] for row in cursor.fetchall()}
+
+
+def resolve_departments(department_codes, company_codes, include_children=True):
+    """
+    부서 코드/법인 코드 → 부서 ID (법인은 소속 부서 전체)
+    Returns:
+        ({부서 ID, ...}, [없는 부서 코드, ...], [없는 법인 코드, ...])
+    """
+    found = dict(
+        Department.objects.filter(code__in=department_codes).values_list('code', 'pk')
+    ) if department_codes else {}
+    department_ids = set(found.values())
+    if include_children:
+        department_ids = department_subtree(department_ids)
+
+    missing_companies = []
+    if company_codes:
+        rows = list(Department.objects.filter(company__code__in=company_codes).values_list(
+            'company__code', 'pk'
+        ))
+        department_ids.update(pk for _, pk in rows)
+        with_departments = {code for code, _ in rows}
+        existing = set(Company.objects.filter(code__in=company_codes).values_list('code', flat=True))
+        missing_companies = [
+            code for code in company_codes if code not in existing or code not in with_departments
+        ]
+
+    missing = [code for code in department_codes if code not in found]
+    return department_ids, missing, missing_companies
+
+
+def _target(current, given, mode, has_input):
+    if not has_input:
+        return set(current)
+    if mode == 'ADD':
+        return current | given
+    if mode == 'REMOVE':
+        return current - given
+    return set(given)
+
+
+def audience_count(regulation, access_level, user_ids, department_ids):
+    """
+    지정한 권한으로 사규를 볼 수 있는 재직 직원 수 (Regulation.can_user_access 기준)
+    관리자/준법지원인과 책임부서 담당자 포함
+    """
+    company_ids = list(regulation.allowed_companies.values_list('pk', flat=True))
+    users = User.objects.filter(is_active=True)
+    privileged = Q(is_superuser=True) | Q(role__in=['ADMIN', 'COMPLIANCE'])
+    members = users.exclude(privileged).filter(
+        Q(company__in=company_ids) | Q(company__isnull=True, department__company__in=company_ids)
+    )
+    managers = Q(role='DEPT_MANAGER', department=regulation.responsible_dept_id) if (
+        regulation.responsible_dept_id
+    ) else Q(pk__in=[])
+
+    total = users.filter(privileged).count()
+    if access_level == 'ALL':
+        return total + members.count()
+    if access_level == 'DEPARTMENTS':
+        return total + members.filter(Q(department__in=department_ids) | managers).count()
+    # 직원 지정: 직원 ID 목록이 길 수 있으므로 나누어 셈
+    for batch in _batches(sorted(user_ids)):
+        total += members.filter(pk__in=batch).count()
+    manager_ids = set(members.filter(managers).values_list('pk', flat=True))
+    return total + len(manager_ids - set(user_ids))
+
+
+def plan_changes(regulation, employee_ids=(), department_codes=(), company_codes=(),
+                 include_children=True, mode='ADD', access_level=None):
+    """
+    적용 전 변경 내용 계산 (미리보기와 적용에 함께 사용)
+    Returns:
+        dict: 추가/삭제할 직원·부서 ID, 없는 코드, 적용 전후 접근 가능 인원
+    """
+    access_level = access_level or regulation.access_level
+    given_users, missing_users = resolve_users(employee_ids)
+    given_departments, missing_departments, missing_companies = resolve_departments(
+        department_codes, company_codes, include_children
+    )
+
+    current_users = set(regulation.allowed_users.values_list('pk', flat=True))
+    current_departments = set(regulation.allowed_departments.values_list('pk', flat=True))
+    users = _target(current_users, given_users, mode, bool(employee_ids))
+    departments = _target(
+        current_departments, given_departments, mode, bool(department_codes or company_codes)
+    )
+    return {
+        'mode': mode,
+        'access_level': access_level,
+        'users': users,
+        'departments': departments,
+        'add_users': users - current_users,
+        'remove_users': current_users - users,
+        'add_departments': departments - current_departments,
+        'remove_departments': current_departments - departments,
+        'missing_users': missing_users,
+        'missing_departments': missing_departments,
+        'missing_companies': missing_companies,
+        'audience_before': audience_count(
+            regulation, regulation.access_level, current_users, current_departments
+        ),
+        'audience_after': audience_count(regulation, access_level, users, departments),
+    }
+
+
+def _apply_delta(through, regulation, column, added, removed):
+    """중간 테이블에 바뀐 행만 추가/삭제"""
+    for batch in _batches(sorted(removed)):
+        through.objects.filter(regulation=regulation, **{f'{column}__in': batch}).delete()
+    through.objects.bulk_create(
+        [through(regulation=regulation, **{column: pk}) for pk in sorted(added)],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+def apply_changes(regulation, plan):
+    """plan_changes 결과 적용"""
+    from .models import Regulation
+
+    with transaction.atomic():
+        _apply_delta(
+            Regulation.allowed_users.through, regulation, 'user_id',
+            plan['add_users'], plan['remove_users'],
+        )
+        _apply_delta(
+            Regulation.allowed_departments.through, regulation, 'department_id',
+            plan['add_departments'], plan['remove_departments'],
+        )
+        if plan['access_level'] != regulation.access_level:
+            regulation.access_level = plan['access_level']
+            regulation.save(update_fields=['access_level', 'updated_at'])
@@ -4,7 +4,10 @@
 
 from django.contrib import admin
 from django.utils.safestring import mark_safe
-from .models import Regulation, RegulationVersion, RegulationTag, RegulationDownloadLog, Favorite, CommonCode
+from .models import (
+    Regulation, RegulationVersion, RegulationTag, RegulationDownloadLog, RegulationViewLog,
+    Favorite, CommonCode, ExtractedText, FileBlob, RegulationVersionBody,
+)
 
 
 class RegulationVersionInline(admin.TabularInline):
@@ -28,8 +31,10 @@ class RegulationAdmin(admin.ModelAdmin):
     """사규 관리"""
     list_display = [
         'code', 'title', 'category', 'group', 'status', 'is_public',
-        'responsible_dept', 'manager', 'current_version', 'effective_date', 'has_file'
+        'responsible_dept', 'manager', 'current_version', 'effective_date', 'has_file',
+        'version_count', 'favorite_count', 'view_count', 'download_count',
     ]
+    list_select_related = ['responsible_dept', 'stats']
     list_filter = ['category', 'status', 'is_mandatory', 'is_public', 'access_level', 'group', 'responsible_dept']
     search_fields = ['code', 'title', 'description', 'manager', 'manager_primary', 'group']
     ordering = ['category', 'code']
@@ -78,6 +83,30 @@ class RegulationAdmin(admin.ModelAdmin):
         return mark_safe('<span style="color: gray;">○</span> 없음')
     has_file.short_description = '원본파일'
 
+    # 사규 집계값 (RegulationStats, 집계 행이 없으면 0)
+    def _stat(self, obj, name):
+        return getattr(getattr(obj, 'stats', None), name, 0)
+
+    def version_count(self, obj):
+        return self._stat(obj, 'version_count')
+    version_count.short_description = '버전'
+    version_count.admin_order_field = 'stats__version_count'
+
+    def favorite_count(self, obj):
+        return self._stat(obj, 'favorite_count')
+    favorite_count.short_description = '즐겨찾기'
+    favorite_count.admin_order_field = 'stats__favorite_count'
+
+    def view_count(self, obj):
+        return self._stat(obj, 'view_count')
+    view_count.short_description = '조회'
+    view_count.admin_order_field = 'stats__view_count'
+
+    def download_count(self, obj):
+        return self._stat(obj, 'download_count')
+    download_count.short_description = '다운로드'
+    download_count.admin_order_field = 'stats__download_count'
+
 
 @admin.register(RegulationVersion)
 class RegulationVersionAdmin(admin.ModelAdmin):
@@ -96,13 +125,10 @@ class RegulationVersionAdmin(admin.ModelAdmin):
 @admin.register(RegulationTag)
 class RegulationTagAdmin(admin.ModelAdmin):
     """태그 관리"""
-    list_display = ['name', 'get_regulation_count', 'created_at']
+    list_display = ['name', 'regulation_count', 'created_at']
     search_fields = ['name']
     filter_horizontal = ['regulations']
-
-    def get_regulation_count(self, obj):
-        return obj.regulations.count()
-    get_regulation_count.short_description = '사규 수'
+    readonly_fields = ['regulation_count']
 
 
 @admin.register(RegulationDownloadLog)
@@ -116,6 +142,51 @@ class RegulationDownloadLogAdmin(admin.ModelAdmin):
     readonly_fields = ['regulation', 'version', 'user', 'ip_address', 'downloaded_at']
 
 
+@admin.register(RegulationViewLog)
+class RegulationViewLogAdmin(admin.ModelAdmin):
+    """조회 로그"""
+    list_display = ['regulation', 'user', 'source', 'ip_address', 'viewed_at']
+    list_filter = ['source', 'viewed_at']
+    search_fields = ['regulation__code', 'user__username']
+    ordering = ['-viewed_at']
+    date_hierarchy = 'viewed_at'
+    readonly_fields = ['regulation', 'user', 'source', 'ip_address', 'viewed_at']
+
+
+@admin.register(ExtractedText)
+class ExtractedTextAdmin(admin.ModelAdmin):
+    """첨부파일 추출 텍스트"""
+    list_display = ['sha256', 'file_type', 'file_size', 'status', 'char_count', 'created_at']
+    list_filter = ['status', 'file_type']
+    search_fields = ['sha256']
+    ordering = ['-created_at']
+    readonly_fields = ['sha256', 'file_type', 'file_size', 'status', 'text', 'char_count', 'error', 'created_at']
+
+
+@admin.register(RegulationVersionBody)
+class RegulationVersionBodyAdmin(admin.ModelAdmin):
+    """버전별 규정 본문"""
+    list_display = ['version', 'storage', 'length', 'base', 'created_at']
+    list_filter = ['storage']
+    search_fields = ['version__regulation__code']
+    list_select_related = ['version__regulation']
+    readonly_fields = ['version', 'storage', 'base', 'sha256', 'length', 'created_at']
+    exclude = ['data']
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(FileBlob)
+class FileBlobAdmin(admin.ModelAdmin):
+    """첨부파일 저장 파일"""
+    list_display = ['name', 'size', 'ref_count', 'created_at', 'updated_at']
+    list_filter = ['created_at']
+    search_fields = ['name', 'sha256']
+    ordering = ['-created_at']
+    readonly_fields = ['sha256', 'name', 'size', 'ref_count', 'created_at', 'updated_at']
+
+
 @admin.register(Favorite)
 class FavoriteAdmin(admin.ModelAdmin):
     """즐겨찾기 관리"""
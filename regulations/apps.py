@@ -6,4 +6,7 @@ class RegulationsConfig(AppConfig):
     name = 'regulations'
     verbose_name = '사규 관리'
 
+    def ready(self):
+        from . import signals  # noqa: F401
+
 
@@ -0,0 +1,213 @@
+"""
+사규 조문 구조 분석
+규정 본문(Regulation.content)을 장/절/조/항/호 단위로 나누어 RegulationArticle로 저장
+
+- 장/절: "제N장 총칙", "제N절 ..." 줄
+- 조: "제N조(제목)", "제N조의M(제목)" 줄 (regulations.hwp.ARTICLE_PATTERN)
+- 항: ①~⑳ (한 줄에 이어진 항도 나눔)
+- 호: 조 또는 항 안에서 "1." "2." 로 시작하는 줄
+- 부칙: "부칙" 줄 이후의 조문은 부칙 조문으로 구분 (조문 번호가 본문과 겹치므로 조회 시 구분)
+
+조문 단위 조회/표시에는 전문, 장, 절, 부칙, 조 노드(PIECE_KINDS)를 순서대로 사용하며,
+각 노드의 text는 해당 노드에만 속한 본문(조는 항/호 포함 전체)입니다.
+"""
+
+import re
+from collections import namedtuple
+
+from django.db import transaction
+
+from .hwp import ARTICLE_PATTERN
+
+
+CHAPTER_PATTERN = re.compile(r'^제\s*(\d+)\s*장(?![가-힣])\s*(.*)$')
+SECTION_PATTERN = re.compile(r'^제\s*(\d+)\s*절(?![가-힣])\s*(.*)$')
+ADDENDA_PATTERN = re.compile(r'^부\s*칙(?:\s*[<(（\[].*)?$')
+# "제5조에 따라 ..."처럼 조문 번호를 인용하며 시작하는 줄 (조문 시작이 아님)
+ARTICLE_REFERENCE_PATTERN = re.compile(r'^제\s*\d+\s*조(?:(?!\s*의\s*\d)[가-힣]|\s*의\s*\d+[가-힣])')
+ITEM_PATTERN = re.compile(r'^(\d+)\.\s*')
+PARAGRAPH_SPLIT = re.compile(r'(?<=\S)\s+(?=[①-⑳])')
+CIRCLED_NUMBERS = '①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮⑯⑰⑱⑲⑳'
+
+# 조문 단위 조회/표시에 사용하는 노드 종류
+PIECE_KINDS = ['PREAMBLE', 'CHAPTER', 'SECTION', 'ADDENDA', 'ARTICLE']
+
+# 분석 결과 노드 (parent는 노드 목록의 위치)
+ArticleNode = namedtuple('ArticleNode', [
+    'kind', 'number', 'branch', 'label', 'title', 'anchor', 'parent', 'depth', 'in_addenda', 'lines',
+])
+
+
+class _Parser:
+    def __init__(self):
+        self.nodes = []
+        self.lines = []         # (노드 위치, 줄) 문서 순서, 줄마다 가장 하위 노드
+        self.anchors = set()
+        self.container = None   # 장/절/부칙/전문
+        self.chapter = None
+        self.article = None
+        self.paragraph = None
+        self.item = None
+        self.addenda_count = 0
+
+    def add(self, kind, label, anchor, parent, number=None, branch=None, title=''):
+        candidate = anchor
+        suffix = 1
+        while candidate in self.anchors:
+            suffix += 1
+            candidate = f"{anchor}-{suffix}"
+        self.anchors.add(candidate)
+        depth = self.nodes[parent].depth + 1 if parent is not None else 0
+        self.nodes.append(ArticleNode(
+            kind, number, branch, label, title, candidate, parent, depth,
+            self.addenda_count > 0, [],
+        ))
+        return len(self.nodes) - 1
+
+    def append(self, index, text):
+        """노드와 상위 조문에 본문 줄 추가"""
+        self.lines.append((index, text))
+        self.nodes[index].lines.append(text)
+        if self.article is not None and index != self.article:
+            self.nodes[self.article].lines.append(text)
+        if self.paragraph is not None and index == self.item:
+            self.nodes[self.paragraph].lines.append(text)
+
+    def _prefix(self):
+        return f"add{self.addenda_count}-" if self.addenda_count else ''
+
+    def start_container(self, kind, line, number=None, title=''):
+        self.article = self.paragraph = self.item = None
+        if kind == 'ADDENDA':
+            self.addenda_count += 1
+            self.chapter = None
+            index = self.add(kind, '부칙', f"add{self.addenda_count}", None, title=title)
+        elif kind == 'CHAPTER':
+            self.chapter = self.add(
+                kind, f"제{number}장", f"{self._prefix()}ch{number}", None, number=number, title=title
+            )
+            index = self.chapter
+        else:
+            anchor = f"{self.nodes[self.chapter].anchor}-sec{number}" if self.chapter is not None \
+                else f"{self._prefix()}sec{number}"
+            index = self.add(kind, f"제{number}절", anchor, self.chapter, number=number, title=title)
+        self.container = index
+        self.lines.append((index, line))
+        self.nodes[index].lines.append(line)
+
+    def start_article(self, match, line):
+        number = int(match.group(1))
+        branch = int(match.group(2)) if match.group(2) else None
+        label = f"제{number}조" + (f"의{branch}" if branch else '')
+        anchor = f"{self._prefix()}art{number}" + (f"-{branch}" if branch else '')
+        parent = self.container if self.container is not None and \
+            self.nodes[self.container].kind != 'PREAMBLE' else None
+        self.article = self.add(
+            'ARTICLE', label, anchor, parent, number=number, branch=branch,
+            title=(match.group(3) or '').strip(),
+        )
+        self.paragraph = self.item = None
+
+        pieces = PARAGRAPH_SPLIT.split(line)
+        self.lines.append((self.article, pieces[0]))
+        self.nodes[self.article].lines.append(pieces[0])
+        for piece in pieces[1:]:
+            self.body_piece(piece)
+
+    def body_piece(self, text):
+        """조문 안의 본문 조각 (항 시작, 호 시작 또는 이어지는 본문)"""
+        article_anchor = self.nodes[self.article].anchor
+        if text[0] in CIRCLED_NUMBERS:
+            number = CIRCLED_NUMBERS.index(text[0]) + 1
+            self.paragraph = self.add(
+                'PARAGRAPH', text[0], f"{article_anchor}-p{number}", self.article, number=number
+            )
+            self.item = None
+            self.append(self.paragraph, text)
+            return
+        match = ITEM_PATTERN.match(text)
+        if match:
+            number = int(match.group(1))
+            parent = self.paragraph if self.paragraph is not None else self.article
+            self.item = self.add(
+                'ITEM', f"{number}.", f"{self.nodes[parent].anchor}-i{number}", parent, number=number
+            )
+            self.append(self.item, text)
+            return
+        current = self.item if self.item is not None else self.paragraph
+        self.append(current if current is not None else self.article, text)
+
+    def feed(self, line):
+        match = ARTICLE_PATTERN.match(line)
+        if match and not ARTICLE_REFERENCE_PATTERN.match(line):
+            self.start_article(match, line)
+            return
+        if ADDENDA_PATTERN.match(line):
+            self.start_container('ADDENDA', line)
+            return
+        for kind, pattern in (('CHAPTER', CHAPTER_PATTERN), ('SECTION', SECTION_PATTERN)):
+            match = pattern.match(line)
+            if match:
+                self.start_container(kind, line, int(match.group(1)), match.group(2).strip())
+                return
+
+        if self.article is not None:
+            for piece in PARAGRAPH_SPLIT.split(line):
+                self.body_piece(piece)
+        else:
+            if self.container is None:
+                self.container = self.add('PREAMBLE', '전문', 'preamble', None)
+            self.lines.append((self.container, line))
+            self.nodes[self.container].lines.append(line)
+
+
+def parse_document(text):
+    """
+    본문을 조문 구조로 분석
+    Returns:
+        (ArticleNode 목록, (노드 위치, 줄) 목록) - 모두 문서 순서
+    """
+    parser = _Parser()
+    for raw in (text or '').splitlines():
+        line = raw.strip()
+        if line:
+            parser.feed(line)
+    return parser.nodes, parser.lines
+
+
+def parse_articles(text):
+    """본문을 조문 구조로 분석하여 ArticleNode 목록 반환 (문서 순서)"""
+    return parse_document(text)[0]
+
+
+def rebuild_articles(regulation):
+    """사규 본문을 분석하여 조문 테이블 다시 저장"""
+    from .models import RegulationArticle
+
+    nodes = parse_articles(regulation.content)
+    with transaction.atomic():
+        RegulationArticle.objects.filter(regulation=regulation).delete()
+        created = [None] * len(nodes)
+        # 상위 노드의 ID가 있어야 하므로 깊이별로 나누어 저장
+        for depth in sorted({node.depth for node in nodes}):
+            batch = []
+            for position, node in enumerate(nodes):
+                if node.depth != depth:
+                    continue
+                created[position] = RegulationArticle(
+                    regulation=regulation,
+                    parent=created[node.parent] if node.parent is not None else None,
+                    kind=node.kind,
+                    number=node.number,
+                    branch=node.branch,
+                    label=node.label,
+                    title=node.title[:200],
+                    text='\n'.join(node.lines),
+                    anchor=node.anchor,
+                    position=position,
+                    depth=node.depth,
+                    in_addenda=node.in_addenda,
+                )
+                batch.append(created[position])
+            RegulationArticle.objects.bulk_create(batch, batch_size=500)
+    return len(nodes)
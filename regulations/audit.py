@@ -0,0 +1,333 @@
+"""
+사규 감사 로그 기록
+다운로드/조회 이벤트를 메모리 대기열에 넣고 백그라운드 스레드가 모아서 bulk_create로 저장
+(사규별 다운로드/조회 수(RegulationStats)도 함께 증가)
+
+- 요청 처리 중에는 대기열에 넣기만 하므로 다운로드/조회가 DB 쓰기를 기다리지 않습니다.
+- FLUSH_SIZE건이 모이거나 FLUSH_INTERVAL_MS가 지나면 한 트랜잭션으로 저장합니다.
+  (SQLite의 DB 쓰기 잠금을 이벤트마다 잡지 않음)
+- 저장에 실패하거나 대기열이 가득 차면 이벤트를 스풀 파일(JSON Lines)에 덧붙이고,
+  다음 저장 성공 시 또는 flush_audit_spool 명령어/주기 작업에서 다시 저장합니다.
+- 프로세스 종료 시(atexit) 대기열에 남은 이벤트를 저장합니다.
+
+유실 범위: 프로세스가 강제 종료(SIGKILL, 전원 차단 등)되면 아직 저장/스풀되지 않은 이벤트,
+즉 최대 FLUSH_SIZE건 또는 FLUSH_INTERVAL_MS 동안 발생한 이벤트(대기열에 쌓인 분량)가 유실될 수 있습니다.
+스풀 파일에 기록된 이벤트는 유실되지 않습니다.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .stats import add_usage
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    # False이면 요청 처리 중에 바로 저장 (디버깅용)
+    'BUFFERED': True,
+    'FLUSH_SIZE': 100,
+    'FLUSH_INTERVAL_MS': 500,
+    'QUEUE_SIZE': 10000,
+    'SPOOL_PATH': os.path.join(settings.BASE_DIR, 'var', 'audit_spool.jsonl'),
+}
+
+
+def get_audit_settings():
+    """AUDIT_SETTINGS 설정값 반환 (미설정 항목은 기본값 사용)"""
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'AUDIT_SETTINGS', {}))
+    return config
+
+
+def _client_ip(request):
+    return request.META.get('REMOTE_ADDR')
+
+
+def _build_objects(events):
+    """
+    이벤트 목록을 모델 객체 목록으로 변환
+    기록 후 삭제된 사규/버전의 이벤트는 제외하고, 삭제된 사용자는 비움
+    """
+    from accounts.models import User
+    from .models import Regulation, RegulationDownloadLog, RegulationVersion, RegulationViewLog
+
+    regulation_ids = set(Regulation.objects.filter(
+        pk__in={e['regulation_id'] for e in events}
+    ).values_list('pk', flat=True))
+    version_ids = set(RegulationVersion.objects.filter(
+        pk__in={e['version_id'] for e in events if e.get('version_id')}
+    ).values_list('pk', flat=True))
+    user_ids = set(User.objects.filter(
+        pk__in={e['user_id'] for e in events if e.get('user_id')}
+    ).values_list('pk', flat=True))
+
+    downloads, views = [], []
+    for event in events:
+        if event['regulation_id'] not in regulation_ids:
+            continue
+        user_id = event.get('user_id') if event.get('user_id') in user_ids else None
+        at = parse_datetime(event['at'])
+        if event['type'] == 'download':
+            if event['version_id'] not in version_ids:
+                continue
+            downloads.append(RegulationDownloadLog(
+                regulation_id=event['regulation_id'],
+                version_id=event['version_id'],
+                user_id=user_id,
+                ip_address=event.get('ip_address'),
+                downloaded_at=at,
+            ))
+        else:
+            views.append(RegulationViewLog(
+                regulation_id=event['regulation_id'],
+                user_id=user_id,
+                source=event.get('source', 'DETAIL'),
+                ip_address=event.get('ip_address'),
+                viewed_at=at,
+            ))
+    return downloads, views
+
+
+def save_events(events):
+    """이벤트 일괄 저장 (한 트랜잭션)"""
+    from .models import RegulationDownloadLog, RegulationViewLog
+
+    if not events:
+        return 0
+    downloads, views = _build_objects(events)
+    with transaction.atomic():
+        RegulationDownloadLog.objects.bulk_create(downloads, batch_size=500)
+        RegulationViewLog.objects.bulk_create(views, batch_size=500)
+        # 사규별 다운로드/조회 수도 같은 트랜잭션에서 증가
+        add_usage(
+            download_count=Counter(log.regulation_id for log in downloads),
+            view_count=Counter(log.regulation_id for log in views),
+        )
+    return len(downloads) + len(views)
+
+
+def spool_events(events, path=None):
+    """이벤트를 스풀 파일에 덧붙임 (한 번의 write로 기록)"""
+    if not events:
+        return
+    path = path or get_audit_settings()['SPOOL_PATH']
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = ''.join(json.dumps(event, ensure_ascii=False) + '\n' for event in events)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def replay_spool(path=None):
+    """
+    스풀 파일의 이벤트를 DB에 저장하고 저장한 건수를 반환
+    여러 프로세스가 동시에 실행해도 파일을 이름 변경으로 선점하므로 중복 저장되지 않음
+    """
+    path = path or get_audit_settings()['SPOOL_PATH']
+    claimed = f"{path}.{os.getpid()}.{uuid.uuid4().hex[:8]}.replay"
+    try:
+        os.rename(path, claimed)
+    except FileNotFoundError:
+        return 0
+
+    events = []
+    with open(claimed, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                # 강제 종료로 마지막 줄이 잘린 경우
+                logger.warning("감사 로그 스풀의 손상된 줄을 건너뜁니다: %s", line[:100])
+
+    try:
+        saved = save_events(events)
+    except DatabaseError:
+        # 저장 실패 시 다시 스풀로 되돌림
+        spool_events(events, path)
+        os.remove(claimed)
+        raise
+    os.remove(claimed)
+    return saved
+
+
+# 저장 스레드 종료 요청
+_STOP = object()
+
+
+class AuditBuffer:
+    """감사 이벤트 대기열과 저장 스레드"""
+
+    def __init__(self):
+        self.queue = None
+        self.thread = None
+        self.pid = None
+        self.lock = threading.Lock()
+
+    def _ensure_started(self):
+        # fork 이후(gunicorn 작업자 등)에는 새 프로세스에서 스레드를 다시 시작
+        if self.thread is not None and self.pid == os.getpid() and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread is not None and self.pid == os.getpid() and self.thread.is_alive():
+                return
+            config = get_audit_settings()
+            self.queue = queue.Queue(maxsize=config['QUEUE_SIZE'])
+            self.pid = os.getpid()
+            self.thread = threading.Thread(
+                target=self._run, name='audit-writer', daemon=True
+            )
+            self.thread.start()
+
+    def put(self, event):
+        """이벤트 추가 (대기열이 가득 차면 스풀 파일에 기록)"""
+        self._ensure_started()
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            spool_events([event])
+
+    def _collect(self, flush_size, interval):
+        """
+        FLUSH_SIZE건이 모이거나 FLUSH_INTERVAL_MS가 지날 때까지 이벤트 수집
+        Returns:
+            (이벤트 목록, 종료 요청 여부)
+        """
+        item = self.queue.get()
+        if item is _STOP:
+            return [], True
+        events = [item]
+        deadline = time.monotonic() + interval
+        while len(events) < flush_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return events, True
+            events.append(item)
+        return events, False
+
+    def _flush(self, events):
+        close_old_connections()
+        try:
+            save_events(events)
+        except Exception:
+            logger.exception("감사 로그 저장 실패 - %d건을 스풀 파일에 기록합니다.", len(events))
+            spool_events(events)
+            return
+        # 저장이 가능한 상태이므로 이전에 스풀된 이벤트도 저장
+        try:
+            replay_spool()
+        except Exception:
+            logger.exception("감사 로그 스풀 저장 실패")
+
+    def _run(self):
+        config = get_audit_settings()
+        flush_size = config['FLUSH_SIZE']
+        interval = config['FLUSH_INTERVAL_MS'] / 1000
+        while True:
+            events, stop = self._collect(flush_size, interval)
+            if events:
+                self._flush(events)
+            # 종료 요청 항목까지 완료 처리
+            for _ in range(len(events) + stop):
+                self.queue.task_done()
+            if stop:
+                return
+
+    def drain(self, timeout=5):
+        """저장 스레드에 종료를 요청하고 대기열에 남은 이벤트가 저장될 때까지 대기 (프로세스 종료 시)"""
+        if self.thread is None or self.pid != os.getpid() or not self.thread.is_alive():
+            return
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self.thread.join(timeout)
+
+    def wait(self):
+        """대기열의 이벤트가 모두 저장될 때까지 대기"""
+        if self.queue is not None and self.pid == os.getpid():
+            self.queue.join()
+
+
+_buffer = AuditBuffer()
+atexit.register(_buffer.drain)
+
+
+def record_events(events):
+    """감사 이벤트 여러 건 기록"""
+    at = timezone.now().isoformat()
+    for event in events:
+        event['at'] = at
+    if get_audit_settings()['BUFFERED']:
+        for event in events:
+            _buffer.put(event)
+    else:
+        save_events(events)
+
+
+def record_event(event):
+    """감사 이벤트 기록"""
+    record_events([event])
+
+
+def record_download(request, version):
+    """첨부파일 다운로드 기록"""
+    record_event({
+        'type': 'download',
+        'regulation_id': version.regulation_id,
+        'version_id': version.pk,
+        'user_id': request.user.pk,
+        'ip_address': _client_ip(request),
+    })
+
+
+def record_downloads(request, versions):
+    """첨부파일 여러 건 다운로드 기록 (묶음 다운로드)"""
+    record_events([
+        {
+            'type': 'download',
+            'regulation_id': version.regulation_id,
+            'version_id': version.pk,
+            'user_id': request.user.pk,
+            'ip_address': _client_ip(request),
+        }
+        for version in versions
+    ])
+
+
+def record_view(request, regulation, source='DETAIL'):
+    """사규 조회 기록"""
+    record_event({
+        'type': 'view',
+        'regulation_id': regulation.pk,
+        'user_id': request.user.pk,
+        'source': source,
+        'ip_address': _client_ip(request),
+    })
+
+
+def flush():
+    """대기열의 이벤트가 모두 저장될 때까지 대기"""
+    _buffer.wait()
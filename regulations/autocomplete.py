@@ -0,0 +1,92 @@
+"""
+자동완성 검색 (사규 등록/수정 폼의 사규/법인/부서/직원 선택)
+전체 목록을 폼에 내려보내지 않고, 입력한 검색어로 시작하는 항목만 페이지 단위로 조회합니다.
+
+- 응답: {"results": [{"id": ..., "text": ...}, ...], "more": 다음 페이지 여부}
+- 다음 페이지 여부는 PAGE_SIZE + 1건을 조회하여 판단 (전체 건수를 세지 않음)
+"""
+
+from collections import namedtuple
+
+from django.db.models import Q
+from django.db.models.functions import Concat
+
+from accounts.models import Company, Department, User
+
+
+# 한 페이지 항목 수
+PAGE_SIZE = 20
+
+# 자동완성 대상: 기본 쿼리셋, 검색(앞부분 일치) 필드, 정렬, 조회 필드, 표시명
+Source = namedtuple('Source', ['queryset', 'search_fields', 'ordering', 'fields', 'label'])
+
+
+def _regulations(request):
+    from .models import Regulation
+
+    queryset = Regulation.objects.accessible_to(request.user)
+    # 사규 폼의 분류 선택값, 수정 중인 사규 제외
+    category = request.GET.get('category', '')
+    if category:
+        queryset = queryset.filter(category=category)
+    exclude = request.GET.get('exclude', '')
+    if exclude.isdigit():
+        queryset = queryset.exclude(pk=exclude)
+    return queryset
+
+
+def _users(request):
+    return User.objects.filter(is_active=True).annotate(
+        full_name=Concat('last_name', 'first_name')
+    )
+
+
+SOURCES = {
+    'regulations': Source(
+        _regulations, ['code', 'title'], ['code'], ['code', 'title'],
+        lambda code, title: f'[{code}] {title}',
+    ),
+    'companies': Source(
+        lambda request: Company.objects.filter(is_active=True),
+        ['code', 'name'], ['code'], ['name'], lambda name: name,
+    ),
+    'departments': Source(
+        lambda request: Department.objects.filter(is_active=True),
+        ['code', 'name'], ['code'], ['name'], lambda name: name,
+    ),
+    'users': Source(
+        _users, ['username', 'employee_id', 'full_name', 'first_name'],
+        ['last_name', 'first_name', 'username'],
+        ['username', 'last_name', 'first_name', 'department__name'],
+        lambda username, last_name, first_name, department:
+            _user_label(username, f'{last_name}{first_name}'.strip(), department),
+    ),
+}
+
+
+def _user_label(username, full_name, department):
+    """User.__str__과 같은 표시명 (부서를 따로 조회하지 않음)"""
+    full_name = full_name or username
+    return f'{full_name} ({department})' if department else full_name
+
+
+def search(source, request, term, page=1):
+    """
+    자동완성 검색
+    Returns:
+        (결과 목록, 다음 페이지 여부)
+    """
+    queryset = source.queryset(request)
+    if term:
+        condition = Q()
+        for field in source.search_fields:
+            condition |= Q(**{f'{field}__istartswith': term})
+        queryset = queryset.filter(condition)
+
+    offset = (page - 1) * PAGE_SIZE
+    rows = list(
+        queryset.order_by(*source.ordering)
+        .values_list('pk', *source.fields)[offset:offset + PAGE_SIZE + 1]
+    )
+    results = [{'id': row[0], 'text': source.label(*row[1:])} for row in rows[:PAGE_SIZE]]
+    return results, len(rows) > PAGE_SIZE
@@ -0,0 +1,196 @@
+"""
+사규 첨부파일 묶음(ZIP) 다운로드
+ZIP 파일을 메모리나 디스크에 만들지 않고, 파일을 읽는 대로 압축 스트림으로 응답
+
+- 이미 압축된 형식(PDF, DOCX, HWPX 등)은 다시 압축하지 않고 저장(STORED)
+- 파일별로 접근 권한을 확인하고, 권한이 없거나 파일이 없어 제외된 항목은 목록 파일(목록.txt)에 기록
+- 응답 중 메모리 사용량은 전송 단위(DOWNLOAD_SETTINGS['BLOCK_SIZE'])로 일정
+- 다운로드 로그는 전송이 끝난 뒤 한 번에 기록 (전송 중 연결이 끊기면 기록하지 않음)
+
+주의: 전송 중에는 파일 크기/CRC를 미리 쓸 수 없으므로 항목마다 데이터 디스크립터를 사용합니다.
+(압축 프로그램과 브라우저는 모두 지원하며, 중앙 디렉터리에는 크기와 CRC가 기록됨)
+"""
+
+import io
+import os
+import zipfile
+from collections import namedtuple
+
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from .downloads import get_download_settings
+from .models import Regulation, RegulationVersion
+
+
+# 압축해도 크기가 거의 줄지 않는 형식 (그대로 저장)
+STORED_EXTENSIONS = {
+    '.pdf', '.docx', '.xlsx', '.pptx', '.hwpx', '.hwp',
+    '.zip', '.jpg', '.jpeg', '.png', '.gif',
+}
+
+MANIFEST_NAME = '목록.txt'
+
+# 묶음 항목: ZIP 내 파일명, FieldFile, 수정일시, 다운로드 로그 대상 버전(원본 파일은 None)
+BundleEntry = namedtuple('BundleEntry', ['arcname', 'field_file', 'modified', 'version'])
+
+
+class _StreamSink(io.RawIOBase):
+    """ZipFile이 쓴 데이터를 모아 두었다가 꺼내는 쓰기 전용 스트림 (seek 불가)"""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def take(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _unique_name(name, used):
+    """ZIP 내 파일명 중복 시 ' (2)' 등을 붙임"""
+    base, ext = os.path.splitext(name)
+    candidate = name
+    number = 1
+    while candidate in used:
+        number += 1
+        candidate = f"{base} ({number}){ext}"
+    used.add(candidate)
+    return candidate
+
+
+def _zip_info(arcname, modified, size):
+    info = zipfile.ZipInfo(arcname, date_time=timezone.localtime(modified).timetuple()[:6])
+    # 크기를 알려주면 4GB 이상 파일은 ZIP64 헤더로 기록
+    info.file_size = size
+    if os.path.splitext(arcname)[1].lower() in STORED_EXTENSIONS:
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def iter_bundle(entries, skipped=None, on_complete=None, block_size=None):
+    """
+    묶음 항목을 ZIP 스트림으로 변환하는 제너레이터
+    skipped: 목록 파일에 기록할 제외 사유 목록
+    on_complete: 전송이 끝나면 포함된 항목 목록으로 호출
+    """
+    block_size = block_size or get_download_settings()['BLOCK_SIZE']
+    skipped = list(skipped or [])
+    included = []
+    used = set()
+    sink = _StreamSink()
+    archive = zipfile.ZipFile(sink, mode='w', compression=zipfile.ZIP_DEFLATED)
+
+    for entry in entries:
+        try:
+            source = entry.field_file.open('rb')
+            size = entry.field_file.size
+        except OSError:
+            skipped.append(f"{entry.arcname}: 파일 없음")
+            continue
+
+        arcname = _unique_name(entry.arcname, used)
+        with source, archive.open(_zip_info(arcname, entry.modified, size), mode='w') as target:
+            for chunk in source.chunks(block_size):
+                target.write(chunk)
+                data = sink.take()
+                if data:
+                    yield data
+        included.append(entry)
+        yield sink.take()
+
+    lines = [f"포함된 파일: {len(included)}건"]
+    lines += [f"  {entry.arcname}" for entry in included]
+    if skipped:
+        lines.append(f"제외된 파일: {len(skipped)}건")
+        lines += [f"  {reason}" for reason in skipped]
+    archive.writestr(
+        _zip_info(_unique_name(MANIFEST_NAME, used), timezone.now(), 0),
+        '\r\n'.join(lines) + '\r\n',
+    )
+    archive.close()
+    yield sink.take()
+
+    if on_complete:
+        on_complete(included)
+
+
+def category_bundle(user, category):
+    """
+    분류의 시행중 사규별 현재 첨부파일 (최신 버전 파일, 버전 파일이 없으면 원본 파일)
+    Returns:
+        (항목 목록, 제외 사유 목록)
+    """
+    latest = RegulationVersion.objects.filter(
+        regulation=OuterRef('pk')
+    ).exclude(content_file='').order_by('-created_at').values('pk')[:1]
+
+    regulations = list(
+        Regulation.objects.accessible_to(user)
+        .filter(category=category, status='ACTIVE')
+        .annotate(latest_version_id=Subquery(latest))
+        .order_by('code')
+    )
+    versions = RegulationVersion.objects.in_bulk(
+        [regulation.latest_version_id for regulation in regulations if regulation.latest_version_id]
+    )
+
+    entries = []
+    denied = 0
+    missing = []
+    for regulation in regulations:
+        # 다운로드 화면과 같은 권한 기준 (법인 확인 포함)
+        if not regulation.can_user_access(user):
+            denied += 1
+            continue
+        version = versions.get(regulation.latest_version_id)
+        if version:
+            version.regulation = regulation
+            entries.append(BundleEntry(
+                version.get_download_filename(), version.content_file, version.created_at, version
+            ))
+        elif regulation.original_file:
+            entries.append(BundleEntry(
+                f"{regulation.code}_{regulation.get_download_filename()}",
+                regulation.original_file, regulation.updated_at, None,
+            ))
+        else:
+            missing.append(f"{regulation.code} {regulation.title}: 첨부파일 없음")
+
+    skipped = missing
+    if denied:
+        # 권한이 없는 사규는 사규명을 노출하지 않고 건수만 기록
+        skipped.append(f"접근 권한이 없는 사규 {denied}건")
+    return entries, skipped
+
+
+def version_bundle(regulation):
+    """사규의 모든 버전 첨부파일과 원본 파일 (접근 권한은 호출 측에서 확인)"""
+    entries = []
+    if regulation.original_file:
+        entries.append(BundleEntry(
+            f"원본_{regulation.get_download_filename()}",
+            regulation.original_file, regulation.updated_at, None,
+        ))
+    for version in regulation.versions.exclude(content_file='').order_by('created_at'):
+        version.regulation = regulation
+        entries.append(BundleEntry(
+            version.get_download_filename(), version.content_file, version.created_at, version
+        ))
+    return entries
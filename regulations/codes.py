@@ -0,0 +1,111 @@
+"""
+공통코드 조회 (프로세스별 캐시)
+공통코드 전체를 쿼리 한 번으로 불러와 프로세스 메모리에 두고, 이후 조회는 딕셔너리에서 찾습니다.
+
+- 공통코드 저장/삭제 시 프로세스 공용 캐시(CACHES['shared'])의 버전 값(CODE_CACHE_KEY)을 바꾸고(regulations.signals),
+  각 프로세스는 조회 시 버전 값이 바뀐 경우에만 다시 불러오므로 모든 워커가 같은 코드를 사용합니다.
+- 공통코드에 없는 값은 모델 choices의 표시명을 사용합니다. (분류/상태 등 시스템 코드)
+"""
+
+import uuid
+from collections import namedtuple
+
+from django.core.cache import caches
+
+
+CODE_CACHE_KEY = 'regulations:common_codes'
+
+# 공통코드: 코드, 코드명, 정렬순서, 사용여부, 상위코드(코드 값)
+Code = namedtuple('Code', ['code', 'name', 'sort_order', 'is_active', 'parent'])
+
+
+class CodeRegistry:
+    """코드유형별 공통코드 (정렬순서, 코드명 순)"""
+
+    def __init__(self, rows):
+        self.codes = {}
+        self.lookup = {}
+        for code_type, code, name, sort_order, is_active, parent in rows:
+            entry = Code(code, name, sort_order, is_active, parent)
+            self.codes.setdefault(code_type, []).append(entry)
+            self.lookup[(code_type, code)] = entry
+
+    def get_codes(self, code_type, active_only=True):
+        return [
+            entry for entry in self.codes.get(code_type, [])
+            if entry.is_active or not active_only
+        ]
+
+
+_registry = None
+_registry_stamp = None
+
+
+def invalidate_codes():
+    """공통코드 변경 시 호출 (모든 프로세스의 공통코드 다시 불러오기)"""
+    caches['shared'].set(CODE_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def get_registry():
+    """공통코드 목록 (버전이 바뀐 경우에만 다시 불러옴)"""
+    global _registry, _registry_stamp
+    from .models import CommonCode
+
+    shared = caches['shared']
+    stamp = shared.get(CODE_CACHE_KEY)
+    if stamp is None:
+        shared.add(CODE_CACHE_KEY, uuid.uuid4().hex, None)
+        stamp = shared.get(CODE_CACHE_KEY)
+    if _registry is None or stamp != _registry_stamp:
+        rows = CommonCode.objects.order_by('code_type', 'sort_order', 'name').values_list(
+            'code_type', 'code', 'name', 'sort_order', 'is_active', 'parent__code'
+        )
+        _registry, _registry_stamp = CodeRegistry(rows), stamp
+    return _registry
+
+
+def get_codes(code_type, active_only=True):
+    """특정 유형의 코드 목록 (Code 목록)"""
+    return get_registry().get_codes(code_type, active_only)
+
+
+def get_choices(code_type, active_only=True):
+    """특정 유형의 코드를 choices 형식으로 반환"""
+    return [(entry.code, entry.name) for entry in get_codes(code_type, active_only)]
+
+
+def get_label(code_type, code, default=None):
+    """코드 표시명 (공통코드에 없으면 default, default도 없으면 코드 값)"""
+    entry = get_registry().lookup.get((code_type, code))
+    if entry is not None:
+        return entry.name
+    return code if default is None else default
+
+
+def get_model_choices(code_type, choices):
+    """
+    모델 choices를 공통코드 순서/표시명으로 반환
+    (모델에 정의된 값만 사용하고, 비활성 코드는 제외, 공통코드에 없는 값은 뒤에 붙임)
+    """
+    labels = dict(choices)
+    registry = get_registry()
+    ordered = [
+        (entry.code, entry.name) for entry in registry.get_codes(code_type, active_only=False)
+        if entry.code in labels and entry.is_active
+    ]
+    listed = {entry.code for entry in registry.get_codes(code_type, active_only=False)}
+    return ordered + [(value, label) for value, label in choices if value not in listed]
+
+
+def get_labels(code_type, choices):
+    """모델 choices의 {값: 표시명} (공통코드에 있는 값은 코드명, 비활성 코드 포함)"""
+    labels = dict(choices)
+    for entry in get_registry().get_codes(code_type, active_only=False):
+        if entry.code in labels:
+            labels[entry.code] = entry.name
+    return labels
+
+
+def get_order(code_type):
+    """코드별 정렬 순위 {코드: 순위} (활성 코드만)"""
+    return {entry.code: index for index, entry in enumerate(get_codes(code_type))}
@@ -0,0 +1,214 @@
+"""
+규정 본문 비교
+조문 단위로 먼저 맞춘 뒤, 바뀐 조문 안에서 항/호(줄) 단위로, 바뀐 줄은 글자 단위로 비교
+
+- 조문은 "제N조" 줄에서 시작하고, 장/절 제목("제N장", "제N절" 등)은 별도 구역으로 비교합니다.
+- 조문은 번호가 아닌 제목(괄호 안)으로 맞추므로 조문이 추가/삭제되어 번호가 밀려도 내용끼리 비교합니다.
+- 한 줄에 이어진 항(①, ② ...)은 나누어 비교합니다.
+- 조문 번호만 바뀐 구역은 내용 변경과 구분하여 표시합니다.
+- 버전 간 비교 결과는 (이전 버전, 이후 버전, 본문 해시)별로 캐시합니다.
+"""
+
+import re
+from collections import namedtuple
+from difflib import SequenceMatcher
+
+from django.core.cache import cache
+
+from .history import get_version_texts
+from .hwp import ARTICLE_PATTERN
+
+
+HEADING_PATTERN = re.compile(r'^제\s*\d+\s*[편장절관]')
+NUMBER_PATTERN = re.compile(r'^제\s*\d+\s*(?:조(?:\s*의\s*\d+)?|[편장절관])')
+CLAUSE_SPLIT = re.compile(r'(?<=\S)\s+(?=[①-⑳])')
+# 이보다 긴 줄은 글자 단위 비교를 생략 (줄 전체를 바뀐 것으로 표시)
+CHAR_DIFF_LIMIT = 3000
+# 비교 키(제목)가 다른 조문을 같은 조문으로 볼 최소 내용 유사도
+SIMILARITY_THRESHOLD = 0.5
+# 같은 조문을 찾을 범위 (조문 수)
+MATCH_WINDOW = 3
+
+CACHE_TIMEOUT = 60 * 60 * 24 * 7
+CACHE_KEY_VERSION = 1
+
+Section = namedtuple('Section', ['key', 'heading', 'units'])
+
+
+def _section_key(line, match):
+    """구역 비교 키 (조문은 제목, 장/절은 번호를 뺀 제목)"""
+    if match:
+        title = (match.group(3) or '').strip()
+        return f"A:{title}" if title else f"A#{match.group(1)}-{match.group(2) or ''}"
+    return "H:" + HEADING_PATTERN.sub('', line).strip()
+
+
+def split_sections(text):
+    """본문을 조문/장절 구역으로 분리 (첫 조문 앞부분은 key가 ''인 구역)"""
+    sections = []
+    current = Section('', '', [])
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        match = ARTICLE_PATTERN.match(line)
+        if match or HEADING_PATTERN.match(line):
+            if current.units:
+                sections.append(current)
+            current = Section(_section_key(line, match), line, [])
+        current.units.extend(CLAUSE_SPLIT.split(line))
+    if current.units:
+        sections.append(current)
+    return sections
+
+
+def _char_segments(old, new):
+    """글자 단위 비교 (변경 여부, 글자열) 목록 쌍"""
+    if len(old) + len(new) > CHAR_DIFF_LIMIT:
+        return [(True, old)], [(True, new)]
+    old_segments, new_segments = [], []
+    matcher = SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if i2 > i1:
+            old_segments.append((tag != 'equal', old[i1:i2]))
+        if j2 > j1:
+            new_segments.append((tag != 'equal', new[j1:j2]))
+    return old_segments, new_segments
+
+
+def diff_units(old_units, new_units):
+    """항/호(줄) 단위 비교"""
+    lines = []
+    matcher = SequenceMatcher(None, old_units, new_units, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            lines.extend({'op': 'equal', 'text': unit} for unit in old_units[i1:i2])
+            continue
+        old_part, new_part = old_units[i1:i2], new_units[j1:j2]
+        paired = min(len(old_part), len(new_part)) if tag == 'replace' else 0
+        for old, new in zip(old_part[:paired], new_part[:paired]):
+            old_segments, new_segments = _char_segments(old, new)
+            lines.append({
+                'op': 'replace',
+                'old_segments': old_segments,
+                'new_segments': new_segments,
+            })
+        lines.extend({'op': 'delete', 'text': unit} for unit in old_part[paired:])
+        lines.extend({'op': 'insert', 'text': unit} for unit in new_part[paired:])
+    return lines
+
+
+def _section_result(op, old=None, new=None):
+    result = {
+        'op': op,
+        'old_heading': old.heading if old else '',
+        'new_heading': new.heading if new else '',
+    }
+    if op == 'changed':
+        result['lines'] = diff_units(old.units, new.units)
+    elif op == 'removed':
+        result['lines'] = [{'op': 'delete', 'text': unit} for unit in old.units]
+    elif op == 'added':
+        result['lines'] = [{'op': 'insert', 'text': unit} for unit in new.units]
+    return result
+
+
+def _without_number(section):
+    """조문/장절 번호를 뺀 구역 내용 (번호만 바뀐 구역 판별용)"""
+    first = NUMBER_PATTERN.sub('', section.units[0], count=1)
+    return [first] + section.units[1:]
+
+
+def _similar(old, new):
+    """두 구역의 내용이 비슷한지 여부 (빠른 상한 비교 후 정밀 비교)"""
+    matcher = SequenceMatcher(None, '\n'.join(old.units), '\n'.join(new.units))
+    return (
+        matcher.real_quick_ratio() >= SIMILARITY_THRESHOLD
+        and matcher.quick_ratio() >= SIMILARITY_THRESHOLD
+        and matcher.ratio() >= SIMILARITY_THRESHOLD
+    )
+
+
+def diff_texts(old_text, new_text):
+    """
+    두 본문 비교
+    Returns:
+        {'sections': 구역별 비교 결과 목록,
+         'summary': {'added', 'removed', 'changed', 'renumbered', 'unchanged'}}
+        구역별 op: equal, changed, renumbered(번호만 변경), added, removed
+    """
+    old_sections = split_sections(old_text)
+    new_sections = split_sections(new_text)
+    sections = []
+
+    def compare(old, new):
+        if old.units == new.units:
+            op = 'equal'
+        elif _without_number(old) == _without_number(new):
+            op = 'renumbered'
+        else:
+            op = 'changed'
+        sections.append(_section_result(op, old, new))
+
+    matcher = SequenceMatcher(
+        None, [s.key for s in old_sections], [s.key for s in new_sections], autojunk=False
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        old_part, new_part = old_sections[i1:i2], new_sections[j1:j2]
+        if tag == 'equal':
+            for old, new in zip(old_part, new_part):
+                compare(old, new)
+            continue
+        # 제목이 바뀐 조문 등은 가까운 위치에 내용이 비슷한 조문이 있으면 같은 조문으로 비교
+        index = 0
+        for old in old_part:
+            match = next(
+                (k for k in range(index, min(index + MATCH_WINDOW, len(new_part)))
+                 if _similar(old, new_part[k])),
+                None,
+            )
+            if match is None:
+                sections.append(_section_result('removed', old=old))
+                continue
+            for new in new_part[index:match]:
+                sections.append(_section_result('added', new=new))
+            compare(old, new_part[match])
+            index = match + 1
+        for new in new_part[index:]:
+            sections.append(_section_result('added', new=new))
+
+    summary = {'added': 0, 'removed': 0, 'changed': 0, 'renumbered': 0, 'unchanged': 0}
+    names = {
+        'added': 'added', 'removed': 'removed', 'changed': 'changed',
+        'renumbered': 'renumbered', 'equal': 'unchanged',
+    }
+    for section in sections:
+        summary[names[section['op']]] += 1
+    return {'sections': sections, 'summary': summary}
+
+
+def get_version_diff(from_version, to_version):
+    """
+    두 버전의 본문 비교 결과 (캐시 사용)
+    본문이 저장되지 않은 버전이 있으면 None
+    """
+    from .models import RegulationVersionBody
+
+    hashes = dict(
+        RegulationVersionBody.objects.filter(
+            version__in=[from_version.pk, to_version.pk]
+        ).values_list('version_id', 'sha256')
+    )
+    if from_version.pk not in hashes or to_version.pk not in hashes:
+        return None
+
+    key = 'regulations:diff:{}:{}:{}:{}'.format(
+        from_version.pk, to_version.pk,
+        hashes[from_version.pk][:16], hashes[to_version.pk][:16],
+    )
+    result = cache.get(key, version=CACHE_KEY_VERSION)
+    if result is None:
+        texts = get_version_texts(from_version.regulation_id, {from_version.pk, to_version.pk})
+        result = diff_texts(texts[from_version.pk], texts[to_version.pk])
+        cache.set(key, result, CACHE_TIMEOUT, version=CACHE_KEY_VERSION)
+    return result
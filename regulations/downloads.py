@@ -0,0 +1,177 @@
+"""
+첨부파일 다운로드 응답
+권한 확인과 다운로드 로그는 뷰에서 처리하고, 파일 전송은 웹 서버 또는 sendfile에 맡김
+
+- 오프로드 모드 (DOWNLOAD_SETTINGS['OFFLOAD']):
+    X-Accel-Redirect(nginx) 또는 X-Sendfile(Apache/lighttpd) 헤더만 응답하고
+    실제 전송(Range 처리 포함)은 웹 서버가 담당
+- 기본 모드:
+    FileResponse로 응답하며, WSGI 서버가 wsgi.file_wrapper를 제공하면(gunicorn 등) os.sendfile로 전송
+    HTTP Range(단일 구간), If-None-Match, If-Range 지원
+
+내용 주소 저장소의 파일은 경로가 내용 해시이므로 ETag로 해시를 쓰고, 변경되지 않는 파일로 캐시합니다.
+"""
+
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+from django.utils.encoding import escape_uri_path
+from django.utils.http import content_disposition_header, parse_etags
+
+from .storage import is_blob_name
+
+
+DEFAULTS = {
+    # '' (기본 모드), 'X-Accel-Redirect', 'X-Sendfile'
+    'OFFLOAD': '',
+    # X-Accel-Redirect 사용 시 nginx internal location 경로 (MEDIA_ROOT에 매핑)
+    'OFFLOAD_PREFIX': '/protected-media/',
+    # 변경되지 않는 파일(내용 주소 저장소)의 캐시 유지 시간(초)
+    'CACHE_MAX_AGE': 60 * 60 * 24 * 365,
+    # 기본 모드 전송 단위 (sendfile을 쓸 수 없는 서버에서 사용)
+    'BLOCK_SIZE': 64 * 1024,
+}
+
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def get_download_settings():
+    """DOWNLOAD_SETTINGS 설정값 반환 (미설정 항목은 기본값 사용)"""
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'DOWNLOAD_SETTINGS', {}))
+    return config
+
+
+class RangeFile:
+    """
+    파일의 지정 구간만 읽는 파일 객체
+    fileno()/tell()을 제공하므로 gunicorn 등은 Content-Length 구간만 os.sendfile로 전송
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.file.seek(start)
+        self.remaining = length
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def tell(self):
+        return self.file.tell()
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def get_etag(field_file):
+    """파일 ETag (내용 주소 저장소 파일은 내용 해시, 그 외는 크기와 수정 시각)"""
+    name = field_file.name
+    if is_blob_name(name):
+        return '"%s"' % os.path.splitext(os.path.basename(name))[0]
+    stat = os.stat(field_file.path)
+    return '"%x-%x"' % (stat.st_size, int(stat.st_mtime))
+
+
+def parse_range(header, size):
+    """
+    Range 헤더 해석
+    Returns:
+        (시작, 길이) - 헤더가 없거나 해석할 수 없으면 None, 만족할 수 없는 구간이면 False
+    """
+    match = RANGE_PATTERN.match(header.strip()) if header else None
+    if not match:
+        # 다중 구간 등은 전체 파일로 응답
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # 마지막 N바이트
+        length = min(int(last), size)
+        return (size - length, length) if length else False
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        return False
+    return start, end - start + 1
+
+
+def _set_cache_headers(response, etag, immutable, max_age):
+    response['ETag'] = etag
+    if immutable:
+        response['Cache-Control'] = f'private, max-age={max_age}, immutable'
+    else:
+        response['Cache-Control'] = 'private, no-cache'
+
+
+def serve_file(request, field_file, filename):
+    """
+    첨부파일 다운로드 응답 생성
+    field_file: FieldFile, filename: 다운로드 파일명
+    """
+    config = get_download_settings()
+    etag = get_etag(field_file)
+    immutable = is_blob_name(field_file.name)
+    max_age = config['CACHE_MAX_AGE']
+
+    # 브라우저 캐시가 같은 파일이면 본문 없이 응답
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match and (etag in parse_etags(if_none_match) or if_none_match.strip() == '*'):
+        response = HttpResponseNotModified()
+        _set_cache_headers(response, etag, immutable, max_age)
+        return response
+
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    offload = config['OFFLOAD']
+
+    if offload:
+        response = HttpResponse(content_type=content_type)
+        if offload == 'X-Accel-Redirect':
+            response['X-Accel-Redirect'] = escape_uri_path(
+                config['OFFLOAD_PREFIX'].rstrip('/') + '/' + field_file.name
+            )
+        else:
+            response[offload] = field_file.path
+        response['Content-Disposition'] = content_disposition_header(True, filename)
+        _set_cache_headers(response, etag, immutable, max_age)
+        return response
+
+    size = field_file.size
+    byte_range = None
+    if_range = request.META.get('HTTP_IF_RANGE')
+    # If-Range가 현재 ETag와 다르면 파일이 바뀐 것이므로 전체 파일로 응답
+    if not if_range or if_range.strip() == etag:
+        byte_range = parse_range(request.META.get('HTTP_RANGE'), size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    start, length = byte_range or (0, size)
+    response = FileResponse(
+        RangeFile(open(field_file.path, 'rb'), start, length),
+        as_attachment=True,
+        filename=filename,
+        content_type=content_type,
+    )
+    response.block_size = config['BLOCK_SIZE']
+    response['Content-Length'] = str(length)
+    response['Accept-Ranges'] = 'bytes'
+    if byte_range:
+        response.status_code = 206
+        response['Content-Range'] = f'bytes {start}-{start + length - 1}/{size}'
+    _set_cache_headers(response, etag, immutable, max_age)
+    return response
@@ -0,0 +1,149 @@
+"""
+첨부파일 텍스트 추출
+PDF, DOCX, HWP, HWPX 파일에서 본문 텍스트를 추출하고 정규화
+
+- 파일 해시와 텍스트 추출은 청크/스트리밍 방식으로 처리하여 대용량 파일도 메모리에 한 번에 올리지 않습니다.
+- 이 모듈은 모델을 import하지 않으므로 프로세스 풀의 작업 프로세스에서도 바로 사용할 수 있습니다.
+  추출 결과의 저장은 regulations.services에서 처리합니다.
+- 한글 문서(HWP/HWPX) 해석은 regulations.hwp에서 처리합니다.
+"""
+
+import hashlib
+import os
+import re
+import unicodedata
+import zipfile
+
+from .hwp import HwpError, iter_paragraphs
+
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_INLINE_SPACE = re.compile(r'[^\S\n]+')
+_BLANK_LINES = re.compile(r'\n{3,}')
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+
+class ExtractionError(Exception):
+    """텍스트 추출 실패"""
+
+
+def file_sha256(fileobj):
+    """파일 객체의 SHA-256 해시 (청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: fileobj.read(HASH_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest()
+
+
+def normalize_text(text):
+    """
+    추출 텍스트 정규화
+    - 유니코드 NFC 정규화 (자모 분리 문자 결합)
+    - 제어문자 제거, 줄 안의 연속 공백을 하나로
+    - 연속 빈 줄은 하나로
+    """
+    text = unicodedata.normalize('NFC', text)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = _CONTROL_CHARS.sub('', text)
+    lines = (_INLINE_SPACE.sub(' ', line).strip() for line in text.split('\n'))
+    text = '\n'.join(lines)
+    return _BLANK_LINES.sub('\n\n', text).strip()
+
+
+def get_file_type(filename):
+    """파일 확장자(소문자, 점 제외)"""
+    return os.path.splitext(filename)[1].lower().lstrip('.')
+
+
+def extract_pdf(fileobj):
+    """PDF 페이지별 텍스트"""
+    from PyPDF2 import PdfReader
+    from PyPDF2.errors import PdfReadError
+
+    try:
+        reader = PdfReader(fileobj)
+        for page in reader.pages:
+            yield page.extract_text() or ''
+    except PdfReadError as e:
+        raise ExtractionError(f"PDF 파일을 읽을 수 없습니다: {e}") from e
+
+
+def extract_docx(fileobj):
+    """DOCX 문단 및 표 텍스트"""
+    from docx import Document
+
+    try:
+        document = Document(fileobj)
+    except (zipfile.BadZipFile, KeyError, ValueError) as e:
+        raise ExtractionError(f"DOCX 파일을 읽을 수 없습니다: {e}") from e
+
+    for paragraph in document.paragraphs:
+        yield paragraph.text
+    for table in document.tables:
+        for row in table.rows:
+            yield '\t'.join(cell.text for cell in row.cells)
+
+
+def extract_hangul(file_type):
+    """한글 문서(HWP/HWPX) 문단 텍스트"""
+    def extract(fileobj):
+        try:
+            for paragraph in iter_paragraphs(fileobj, file_type):
+                yield paragraph.text
+        except HwpError as e:
+            raise ExtractionError(str(e)) from e
+    return extract
+
+
+# 확장자별 추출 함수 (파일 객체를 받아 텍스트 조각을 순서대로 반환)
+EXTRACTORS = {
+    'pdf': extract_pdf,
+    'docx': extract_docx,
+    'hwp': extract_hangul('hwp'),
+    'hwpx': extract_hangul('hwpx'),
+}
+
+
+def is_supported(filename):
+    """텍스트 추출 지원 파일 여부"""
+    return get_file_type(filename) in EXTRACTORS
+
+
+def extract_text(fileobj, file_type):
+    """파일 객체에서 정규화된 본문 텍스트 추출"""
+    extractor = EXTRACTORS.get(file_type)
+    if extractor is None:
+        raise ExtractionError(f"지원하지 않는 파일 형식입니다: {file_type}")
+    return normalize_text('\n'.join(extractor(fileobj)))
+
+
+def extract_path(path, known_hashes=()):
+    """
+    파일 경로 기준 해시 계산 및 텍스트 추출 (프로세스 풀 작업 단위)
+    해시가 known_hashes에 있으면 추출을 건너뜀
+
+    Returns:
+        dict(sha256, file_type, file_size, text, error) - 건너뛴 경우 text는 None
+    """
+    file_type = get_file_type(path)
+    with open(path, 'rb') as f:
+        sha256 = file_sha256(f)
+        result = {
+            'sha256': sha256,
+            'file_type': file_type,
+            'file_size': os.path.getsize(path),
+            'text': None,
+            'error': '',
+        }
+        if sha256 in known_hashes:
+            return result
+        try:
+            result['text'] = extract_text(f, file_type)
+        except ExtractionError as e:
+            result['error'] = str(e)
+        except Exception as e:
+            # 손상 파일 등 라이브러리 내부 오류도 실패로 기록
+            result['error'] = f"{type(e).__name__}: {e}"
+    return result
@@ -4,33 +4,21 @@
 
 from django import forms
 from django.conf import settings
-from .models import Regulation, RegulationVersion, RegulationTag
+from . import acl
+from .codes import get_choices, get_label, get_model_choices
+from .models import Regulation, RegulationVersion
+from .tags import parse_tags, sync_tags
+from .widgets import AutocompleteSelect, AutocompleteSelectMultiple
 from accounts.models import Company, Department, User
 
 
 class RegulationForm(forms.ModelForm):
     """사규 등록/수정 폼"""
     
-    # 그룹 선택 필드 (필수)
-    GROUP_CHOICES = [
-        ('', '-- 그룹 선택 --'),
-        ('이사회', '이사회'),
-        ('HR', 'HR'),
-        ('재무', '재무'),
-        ('구매', '구매'),
-        ('준법', '준법'),
-        ('반부패', '반부패'),
-        ('정보보호', '정보보호'),
-        ('개인정보보호', '개인정보보호'),
-        ('안전보건', '안전보건'),
-        ('ESG', 'ESG'),
-        ('컴플라이언스', '컴플라이언스'),
-        ('기타', '기타'),
-    ]
-    
+    # 그룹 선택 필드 (필수, 공통코드 GROUP)
     group = forms.ChoiceField(
         label='그룹',
-        choices=GROUP_CHOICES,
+        choices=lambda: [('', '-- 그룹 선택 --')] + get_choices('GROUP'),
         required=True,
         widget=forms.Select(attrs={'class': 'form-select'}),
         help_text='사규가 속하는 그룹을 선택하세요.'
@@ -89,24 +77,15 @@ class RegulationForm(forms.ModelForm):
                 'class': 'form-control',
                 'type': 'date'
             }),
-            'parent_regulation': forms.Select(attrs={'class': 'form-select'}),
-            'related_regulations': forms.SelectMultiple(attrs={
-                'class': 'form-select',
-                'size': 5
-            }),
+            # 사규/법인/부서/직원은 자동완성으로 검색 (선택된 값만 렌더링)
+            'parent_regulation': AutocompleteSelect('regulations', forward={'category': 'id_category'}),
+            'related_regulations': AutocompleteSelectMultiple(
+                'regulations', forward={'category': 'id_category'}
+            ),
             'access_level': forms.Select(attrs={'class': 'form-select'}),
-            'allowed_companies': forms.SelectMultiple(attrs={
-                'class': 'form-select',
-                'size': 5
-            }),
-            'allowed_departments': forms.SelectMultiple(attrs={
-                'class': 'form-select',
-                'size': 5
-            }),
-            'allowed_users': forms.SelectMultiple(attrs={
-                'class': 'form-select',
-                'size': 5
-            }),
+            'allowed_companies': AutocompleteSelectMultiple('companies'),
+            'allowed_departments': AutocompleteSelectMultiple('departments'),
+            'allowed_users': AutocompleteSelectMultiple('users'),
             'original_file': forms.FileInput(attrs={
                 'class': 'form-control',
                 'accept': '.pdf,.docx,.doc,.hwp,.hwpx'
@@ -149,14 +128,29 @@ class RegulationForm(forms.ModelForm):
         self.fields['related_regulations'].queryset = Regulation.objects.exclude(
             pk=self.instance.pk if self.instance.pk else None
         )
+        self.fields['allowed_users'].queryset = User.objects.select_related('department')
+        # 자동완성 검색 결과에서 수정 중인 사규 제외
+        for name in ('parent_regulation', 'related_regulations'):
+            self.fields[name].widget.extra = {'exclude': self.instance.pk}
         
         # 기존 태그 로드
         if self.instance.pk:
             tags = self.instance.tags.values_list('name', flat=True)
             self.initial['tags'] = ', '.join(tags)
-            # 기존 그룹 값 로드
+            # 기존 그룹 값 로드 (사용 중지된 그룹도 선택 목록에 유지)
             if self.instance.group:
                 self.initial['group'] = self.instance.group
+                choices = list(self.fields['group'].choices)
+                if self.instance.group not in dict(choices):
+                    self.fields['group'].choices = choices + [
+                        (self.instance.group, get_label('GROUP', self.instance.group))
+                    ]
+
+        # 분류는 공통코드(CATEGORY) 순서/표시명으로 표시 (현재 분류는 사용 중지되어도 유지)
+        category_choices = get_model_choices('CATEGORY', Regulation.CATEGORY_CHOICES)
+        if self.instance.category and self.instance.category not in dict(category_choices):
+            category_choices.append((self.instance.category, self.instance.get_category_display()))
+        self.fields['category'].choices = [('', '---------')] + category_choices
         
         # 수정 모드일 때는 코드 필드를 읽기 전용으로 표시
         if self.instance.pk:
@@ -172,6 +166,12 @@ class RegulationForm(forms.ModelForm):
             )
             self.fields['code'].initial = self.instance.code
 
+    def clean_tags(self):
+        tags = self.cleaned_data.get('tags', '')
+        if any(len(name) > 50 for name in parse_tags(tags)):
+            raise forms.ValidationError('태그는 50자 이내로 입력하세요.')
+        return tags
+
     def save(self, commit=True):
         # 코드가 없으면 자동 생성 (등록 모드)
         if not self.instance.pk and not self.instance.code:
@@ -180,16 +180,8 @@ class RegulationForm(forms.ModelForm):
         instance = super().save(commit=commit)
         
         if commit:
-            # 태그 처리
-            tag_names = [t.strip() for t in self.cleaned_data.get('tags', '').split(',') if t.strip()]
-            
-            # 기존 태그 제거
-            instance.tags.clear()
-            
-            # 새 태그 추가
-            for name in tag_names:
-                tag, _ = RegulationTag.objects.get_or_create(name=name)
-                tag.regulations.add(instance)
+            # 태그 처리 (바뀐 태그만 추가/삭제)
+            sync_tags(instance, parse_tags(self.cleaned_data.get('tags', '')))
         
         return instance
 
@@ -252,7 +244,7 @@ class RegulationSearchForm(forms.Form):
     category = forms.ChoiceField(
         label='분류',
         required=False,
-        choices=[('', '전체')] + Regulation.CATEGORY_CHOICES,
+        choices=lambda: [('', '전체')] + get_model_choices('CATEGORY', Regulation.CATEGORY_CHOICES),
         widget=forms.Select(attrs={'class': 'form-select'})
     )
     status = forms.ChoiceField(
@@ -274,7 +266,74 @@ class RegulationSearchForm(forms.Form):
     )
 
 
+class RegulationAclForm(forms.Form):
+    """사규 접근 권한 일괄 지정 폼 (사번 목록, 부서, 법인)"""
 
+    employee_ids = forms.CharField(
+        label='사번 목록',
+        required=False,
+        widget=forms.Textarea(attrs={
+            'class': 'form-control',
+            'rows': 6,
+            'placeholder': '사번을 줄바꿈, 쉼표 또는 공백으로 구분하여 입력'
+        })
+    )
+    employee_file = forms.FileField(
+        label='사번 파일',
+        required=False,
+        widget=forms.FileInput(attrs={'class': 'form-control', 'accept': '.txt,.csv,.xlsx'}),
+        help_text='txt/csv 파일 또는 첫 번째 열에 사번이 있는 엑셀(xlsx) 파일'
+    )
+    department_codes = forms.CharField(
+        label='부서 코드',
+        required=False,
+        widget=forms.TextInput(attrs={'class': 'form-control', 'placeholder': '예: HR, FIN'})
+    )
+    include_children = forms.BooleanField(
+        label='하위부서 포함',
+        required=False,
+        initial=True,
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'})
+    )
+    company_codes = forms.CharField(
+        label='법인 코드',
+        required=False,
+        widget=forms.TextInput(attrs={'class': 'form-control', 'placeholder': '법인 소속 부서 전체'})
+    )
+    mode = forms.ChoiceField(
+        label='적용 방식',
+        choices=acl.MODE_CHOICES,
+        initial='ADD',
+        widget=forms.Select(attrs={'class': 'form-select'}),
+        help_text='교체는 입력한 항목(직원 또는 부서)의 목록만 바꿉니다.'
+    )
+    access_level = forms.ChoiceField(
+        label='접근 권한',
+        choices=Regulation.ACCESS_LEVEL_CHOICES,
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
 
+    def clean_employee_file(self):
+        file = self.cleaned_data.get('employee_file')
+        if file:
+            ext = file.name.split('.')[-1].lower()
+            if ext not in ('txt', 'csv', 'xlsx'):
+                raise forms.ValidationError('txt, csv, xlsx 파일만 업로드할 수 있습니다.')
+            if file.size > 5 * 1024 * 1024:
+                raise forms.ValidationError('파일 크기는 5MB를 초과할 수 없습니다.')
+        return file
 
-
+    def clean(self):
+        cleaned_data = super().clean()
+        employee_ids = acl.parse_codes(cleaned_data.get('employee_ids'))
+        if cleaned_data.get('employee_file'):
+            try:
+                employee_ids = list(dict.fromkeys(
+                    employee_ids + acl.read_employee_file(cleaned_data['employee_file'])
+                ))
+            except Exception:
+                self.add_error('employee_file', '사번 파일을 읽을 수 없습니다.')
+        cleaned_data['employee_list'] = employee_ids
+        cleaned_data['department_list'] = acl.parse_codes(cleaned_data.get('department_codes'))
+        cleaned_data['company_list'] = acl.parse_codes(cleaned_data.get('company_codes'))
+        return cleaned_data
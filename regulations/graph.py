@@ -0,0 +1,129 @@
+"""
+사규 관계 그래프 조회
+상위사규(parent_regulation), 본문 인용(RegulationReference), 관련사규(related_regulations)를
+재귀 CTE(WITH RECURSIVE) 한 번으로 조회 (단계 수와 무관하게 쿼리 1회)
+
+- ancestors: 상위사규 사슬 (바로 위부터 최상위까지)
+- subtree: 하위사규 전체 (방침 → 규정 → 지침 ...)
+- affected_by: 개정 시 검토가 필요한 사규 (하위사규, 인용한 사규, 관련사규로 지정한 사규를 거듭 따라감)
+
+재귀 부분은 사규 ID만 모으고(UNION으로 중복 제거) 단계 수는 조회한 관계로 계산하므로,
+경로가 많거나 데이터 입력 오류로 순환이 있어도 사규 수만큼만 조회합니다.
+"""
+
+from collections import deque, namedtuple
+
+from django.db import connection
+
+from .models import Regulation, RegulationReference
+
+
+# 영향 관계 종류
+EDGE_KINDS = {
+    'CHILD': '하위사규',
+    'REFERENCE': '본문 인용',
+    'RELATED': '관련사규',
+}
+
+# 그래프 노드: 사규 ID, 기준 사규와의 단계 수, 바로 앞 사규 ID, 관계 종류
+GraphNode = namedtuple('GraphNode', ['id', 'depth', 'via', 'kind'])
+
+
+def _tables():
+    related = Regulation.related_regulations.through
+    return {
+        'regulation': connection.ops.quote_name(Regulation._meta.db_table),
+        'reference': connection.ops.quote_name(RegulationReference._meta.db_table),
+        'related': connection.ops.quote_name(related._meta.db_table),
+    }
+
+
+def _fetch(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _walk(start, edges):
+    """
+    관계 목록 (앞 사규, 뒤 사규, 종류)을 start부터 너비 우선으로 따라간 노드 목록
+    (가장 가까운 경로 기준, 가까운 순)
+    """
+    following = {}
+    for source, target, kind in sorted(edges, key=lambda edge: (edge[0], edge[1], edge[2])):
+        following.setdefault(source, []).append((target, kind))
+
+    nodes = []
+    visited = {start}
+    queue = deque([(start, 0)])
+    while queue:
+        current, depth = queue.popleft()
+        for target, kind in following.get(current, []):
+            if target in visited:
+                continue
+            visited.add(target)
+            nodes.append(GraphNode(target, depth + 1, current, kind))
+            queue.append((target, depth + 1))
+    return nodes
+
+
+def ancestors(regulation_id):
+    """상위사규 사슬 (가까운 순, via는 바로 아래 사규 ID)"""
+    sql = """
+        WITH RECURSIVE chain(id, parent) AS (
+            SELECT id, parent_regulation_id FROM {regulation} WHERE id = %s
+            UNION
+            SELECT r.id, r.parent_regulation_id
+            FROM {regulation} r JOIN chain c ON r.id = c.parent
+        )
+        SELECT id, parent, 'PARENT' FROM chain WHERE parent IS NOT NULL
+    """.format(**_tables())
+    return _walk(regulation_id, _fetch(sql, [regulation_id]))
+
+
+def subtree(regulation_id):
+    """하위사규 전체 (via는 상위사규 ID)"""
+    sql = """
+        WITH RECURSIVE tree(id, parent) AS (
+            SELECT id, parent_regulation_id FROM {regulation} WHERE parent_regulation_id = %s
+            UNION
+            SELECT r.id, r.parent_regulation_id
+            FROM {regulation} r JOIN tree t ON r.parent_regulation_id = t.id
+        )
+        SELECT parent, id, 'CHILD' FROM tree
+    """.format(**_tables())
+    return _walk(regulation_id, _fetch(sql, [regulation_id]))
+
+
+def affected_by(regulation_id):
+    """
+    개정 시 영향을 받는 사규 (via는 영향을 전달한 사규 ID, kind는 EDGE_KINDS)
+    """
+    sql = """
+        WITH RECURSIVE edges(source, target, kind) AS (
+            SELECT parent_regulation_id, id, 'CHILD'
+            FROM {regulation} WHERE parent_regulation_id IS NOT NULL
+            UNION ALL
+            SELECT target_id, source_id, 'REFERENCE' FROM {reference}
+            UNION ALL
+            SELECT to_regulation_id, from_regulation_id, 'RELATED' FROM {related}
+        ),
+        affected(id) AS (
+            SELECT %s
+            UNION
+            SELECT e.target FROM edges e JOIN affected a ON e.source = a.id
+        )
+        SELECT DISTINCT e.source, e.target, e.kind
+        FROM edges e
+        WHERE e.source IN (SELECT id FROM affected) AND e.target IN (SELECT id FROM affected)
+    """.format(**_tables())
+    return _walk(regulation_id, _fetch(sql, [regulation_id]))
+
+
+def build_tree(root_id, nodes):
+    """subtree 결과를 {사규 ID: [하위사규 ID, ...]} 형태로 변환"""
+    children = {root_id: []}
+    for node in nodes:
+        children.setdefault(node.via, []).append(node.id)
+        children.setdefault(node.id, [])
+    return children
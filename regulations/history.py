@@ -0,0 +1,202 @@
+"""
+버전별 규정 본문 이력
+버전 등록 시점의 규정 본문(Regulation.content)을 역방향 차이(reverse delta)로 저장
+
+- 최신 버전은 전체 본문(FULL)을 저장합니다.
+- 새 버전이 등록되면 직전 최신 버전은 새 버전 본문에 대한 차이(DELTA)로 바뀝니다.
+  따라서 이력 전체의 저장 용량은 최신 본문 + 버전별 변경분입니다.
+- 이전 버전 본문은 최신 본문에서 차이를 차례로 적용하여 복원하고, SHA-256으로 검증합니다.
+
+차이 형식 (JSON 목록, 기준 본문의 줄 단위):
+    양수 n: 기준 본문의 다음 n줄 복사
+    음수 -n: 기준 본문의 다음 n줄 건너뜀
+    문자열 목록: 해당 줄 삽입
+"""
+
+import hashlib
+import json
+from difflib import SequenceMatcher
+
+from django.db import transaction
+
+
+class VersionBodyError(Exception):
+    """버전 본문 복원 실패 (차이 사슬 손상 등)"""
+
+
+def text_sha256(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _split_lines(text):
+    return text.splitlines(keepends=True)
+
+
+def compute_delta(text, base):
+    """
+    base 본문을 text 본문으로 바꾸는 차이 계산
+    앞뒤 공통 줄을 먼저 잘라내어 큰 본문의 일부만 바뀐 경우에도 빠르게 계산
+    """
+    old = _split_lines(base)
+    new = _split_lines(text)
+
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+
+    delta = []
+
+    def copy(count):
+        if count:
+            if delta and isinstance(delta[-1], int) and delta[-1] > 0:
+                delta[-1] += count
+            else:
+                delta.append(count)
+
+    copy(prefix)
+    old_middle = old[prefix:len(old) - suffix]
+    new_middle = new[prefix:len(new) - suffix]
+    matcher = SequenceMatcher(None, old_middle, new_middle)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            copy(i2 - i1)
+            continue
+        if i2 > i1:
+            delta.append(-(i2 - i1))
+        if j2 > j1:
+            delta.append(new_middle[j1:j2])
+    copy(suffix)
+    return delta
+
+
+def apply_delta(base, delta):
+    """base 본문에 차이를 적용한 본문"""
+    old = _split_lines(base)
+    position = 0
+    parts = []
+    for op in delta:
+        if isinstance(op, list):
+            parts.extend(op)
+        elif op > 0:
+            parts.extend(old[position:position + op])
+            position += op
+        else:
+            position -= op
+    if position != len(old):
+        raise VersionBodyError("차이가 기준 본문과 맞지 않습니다.")
+    return ''.join(parts)
+
+
+def _encode_delta(text, base):
+    """차이 JSON (전체 본문보다 크면 None)"""
+    data = json.dumps(compute_delta(text, base), ensure_ascii=False, separators=(',', ':'))
+    return data if len(data) < len(text) else None
+
+
+def snapshot_version_body(version, text=None):
+    """
+    버전 본문 저장 (기본값: 현재 규정 본문)
+    새 버전은 전체 본문으로, 직전 최신 버전은 새 본문에 대한 역방향 차이로 저장
+    """
+    from .models import RegulationVersionBody
+
+    text = (version.regulation.content or '') if text is None else text
+    with transaction.atomic():
+        # 직전 최신 버전 본문
+        previous = (
+            RegulationVersionBody.objects.select_for_update()
+            .filter(version__regulation_id=version.regulation_id)
+            .exclude(version=version)
+            .order_by('-version__created_at', '-version_id')
+            .first()
+        )
+        body = RegulationVersionBody.objects.create(
+            version=version,
+            storage='FULL',
+            data=text,
+            sha256=text_sha256(text),
+            length=len(text),
+        )
+        if previous is not None and previous.storage == 'FULL':
+            # 차이가 전체 본문보다 크면(전면 개정 등) 전체 본문으로 유지
+            data = _encode_delta(previous.data, text)
+            if data is not None:
+                previous.storage = 'DELTA'
+                previous.base = body
+                previous.data = data
+                previous.save(update_fields=['storage', 'base', 'data'])
+    return body
+
+
+def _load_bodies(regulation_id):
+    from .models import RegulationVersionBody
+
+    return {
+        body.pk: body
+        for body in RegulationVersionBody.objects.filter(version__regulation_id=regulation_id)
+    }
+
+
+def _resolve(body, bodies, resolved):
+    """본문 복원 (기준 본문부터 차례로 적용, 복원 결과는 resolved에 보관)"""
+    chain = []
+    current = body
+    while current.pk not in resolved and current.storage == 'DELTA':
+        chain.append(current)
+        current = bodies.get(current.base_id)
+        if current is None or len(chain) > len(bodies):
+            raise VersionBodyError(f"{body.version_id}번 버전 본문의 기준 본문이 없습니다.")
+    if current.pk not in resolved:
+        resolved[current.pk] = current.data
+
+    text = resolved[current.pk]
+    for item in reversed(chain):
+        text = apply_delta(text, json.loads(item.data))
+        if text_sha256(text) != item.sha256:
+            raise VersionBodyError(f"{item.version_id}번 버전 본문 검증에 실패했습니다.")
+        resolved[item.pk] = text
+    return resolved[body.pk]
+
+
+def get_version_texts(regulation_id, version_ids):
+    """
+    버전별 본문 복원
+    Returns:
+        {버전 ID: 본문} (본문이 저장되지 않은 버전은 제외)
+    """
+    bodies = _load_bodies(regulation_id)
+    resolved = {}
+    texts = {}
+    for body in bodies.values():
+        if body.version_id in version_ids:
+            texts[body.version_id] = _resolve(body, bodies, resolved)
+    return texts
+
+
+def detach_version_body(version):
+    """
+    버전 삭제 전 처리
+    삭제할 본문을 기준으로 하는 이전 버전 본문을, 삭제할 본문의 기준 본문(없으면 전체 본문)으로 다시 저장
+    """
+    from .models import RegulationVersionBody
+
+    body = RegulationVersionBody.objects.filter(version=version).first()
+    if body is None or not body.dependents.exists():
+        return
+
+    bodies = _load_bodies(version.regulation_id)
+    resolved = {}
+    base = bodies.get(body.base_id)
+    base_text = _resolve(base, bodies, resolved) if base else None
+    for dependent in list(body.dependents.all()):
+        text = _resolve(bodies[dependent.pk], bodies, resolved)
+        data = _encode_delta(text, base_text) if base else None
+        if data is None:
+            dependent.storage, dependent.base, dependent.data = 'FULL', None, text
+        else:
+            dependent.storage, dependent.base, dependent.data = 'DELTA', base, data
+        dependent.save(update_fields=['storage', 'base', 'data'])
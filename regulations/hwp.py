@@ -0,0 +1,310 @@
+"""
+한글(HWP/HWPX) 문서 텍스트 추출
+문서를 문단 단위로 순차 처리하여 100쪽 이상 문서도 일정한 메모리 안에서 읽음
+
+- HWPX: zip 안의 Contents/section*.xml을 iterparse로 읽고, 처리한 문단 요소는 바로 해제
+- HWP 5.x: OLE 복합 파일의 BodyText/Section* 스트림을 raw deflate로 조금씩 풀면서
+  레코드(HWPTAG_PARA_TEXT)를 하나씩 해석
+
+문단마다 구역 번호, 문단 순번, 중첩 깊이(표/글상자 안 문단이면 1 이상)를 함께 반환하고,
+split_articles()로 "제N조" 기준 조문 경계를 구할 수 있습니다.
+"""
+
+import re
+import struct
+import zipfile
+import zlib
+from collections import namedtuple
+from xml.etree import ElementTree
+
+
+class HwpError(Exception):
+    """한글 문서 해석 실패"""
+
+
+# 문단: 구역 번호, 구역 내 문단 순번, 중첩 깊이, 텍스트
+Paragraph = namedtuple('Paragraph', ['section', 'index', 'depth', 'text'])
+
+# 조문: 조 번호, 가지 번호(제N조의M), 조 제목, 시작 문단 위치(구역, 순번), 조문 문단 목록
+Article = namedtuple('Article', ['number', 'branch', 'title', 'start', 'paragraphs'])
+
+ARTICLE_PATTERN = re.compile(r'^제\s*(\d+)\s*조(?:\s*의\s*(\d+))?\s*(?:[(（]([^)）]*)[)）])?')
+
+
+# ---------------------------------------------------------------------------
+# HWPX
+# ---------------------------------------------------------------------------
+
+HWPX_SECTION_PATTERN = re.compile(r'^Contents/section(\d+)\.xml$')
+HWPX_PARAGRAPH_TAG = 'p'
+HWPX_TEXT_TAG = 't'
+# 텍스트 요소 안의 제어 요소 (탭, 줄바꿈)
+HWPX_INLINE_TEXT = {'tab': '\t', 'lineBreak': '\n'}
+
+
+def _local_name(tag):
+    """네임스페이스를 제외한 XML 태그명"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def iter_hwpx_paragraphs(fileobj):
+    """HWPX 문단 순차 반환"""
+    try:
+        archive = zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile as e:
+        raise HwpError(f"HWPX 파일을 읽을 수 없습니다: {e}") from e
+
+    with archive:
+        sections = sorted(
+            (int(match.group(1)), name)
+            for name in archive.namelist()
+            if (match := HWPX_SECTION_PATTERN.match(name))
+        )
+        if not sections:
+            raise HwpError("HWPX 본문(Contents/section*.xml)이 없습니다.")
+
+        for section_number, name in sections:
+            with archive.open(name) as section:
+                yield from _iter_hwpx_section(section, section_number)
+
+
+def _iter_hwpx_section(section, section_number):
+    """HWPX 구역 XML 1개의 문단 반환 (중첩 문단은 바깥 문단보다 먼저 끝나므로 스택으로 관리)"""
+    stack = []
+    index = 0
+    try:
+        for event, element in ElementTree.iterparse(section, events=('start', 'end')):
+            tag = _local_name(element.tag)
+            if tag == HWPX_PARAGRAPH_TAG:
+                if event == 'start':
+                    stack.append([])
+                    continue
+                text = ''.join(stack.pop())
+                yield Paragraph(section_number, index, len(stack), text)
+                index += 1
+                if not stack:
+                    element.clear()
+            elif tag == HWPX_TEXT_TAG and event == 'end' and stack:
+                buffer = stack[-1]
+                buffer.append(element.text or '')
+                for child in element:
+                    buffer.append(HWPX_INLINE_TEXT.get(_local_name(child.tag), ''))
+                    buffer.append(child.tail or '')
+    except ElementTree.ParseError as e:
+        raise HwpError(f"HWPX 본문을 해석할 수 없습니다: {e}") from e
+
+
+# ---------------------------------------------------------------------------
+# HWP 5.x
+# ---------------------------------------------------------------------------
+
+HWP_SIGNATURE = b'HWP Document File'
+HWP_SECTION_PATTERN = re.compile(r'^Section(\d+)$')
+
+# FileHeader 속성 비트
+HWP_FLAG_COMPRESSED = 0x01
+HWP_FLAG_PASSWORD = 0x02
+HWP_FLAG_DISTRIBUTION = 0x04
+
+# 레코드 태그 (HWPTAG_BEGIN = 0x10)
+HWPTAG_PARA_HEADER = 0x10 + 50
+HWPTAG_PARA_TEXT = 0x10 + 51
+
+# PARA_TEXT 제어 문자: 문자 컨트롤은 1글자, 인라인/확장 컨트롤은 8글자(16바이트) 차지
+HWP_CHAR_CONTROLS = {
+    10: '\n',    # 줄바꿈
+    13: '',      # 문단 끝
+    24: '-',     # 하이픈
+    30: ' ',     # 묶음 빈칸
+    31: ' ',     # 고정폭 빈칸
+}
+HWP_INLINE_CONTROLS = {4, 5, 6, 7, 8, 9, 19, 20}
+HWP_EXTENDED_CONTROLS = {1, 2, 3, 11, 12, 14, 15, 16, 17, 18, 21, 22, 23}
+HWP_TAB = 9
+_HWP_CONTROL_CHAR = re.compile('[\x00-\x1f]')
+
+DEFLATE_CHUNK_SIZE = 64 * 1024
+
+
+class _DeflateReader:
+    """raw deflate 스트림을 필요한 만큼만 풀어서 읽는 파일 객체"""
+
+    def __init__(self, stream, compressed=True):
+        self.stream = stream
+        self.decompressor = zlib.decompressobj(-zlib.MAX_WBITS) if compressed else None
+        self.buffer = bytearray()
+        self.position = 0
+        self.eof = False
+
+    def _next_chunk(self):
+        """다음 데이터 조각 (압축 해제 시 출력 크기를 제한하여 한 번에 모두 풀리지 않도록 함)"""
+        if self.decompressor is None:
+            data = self.stream.read(DEFLATE_CHUNK_SIZE)
+            self.eof = not data
+            return data
+
+        data = self.decompressor.unconsumed_tail or self.stream.read(DEFLATE_CHUNK_SIZE)
+        if not data or self.decompressor.eof:
+            self.eof = True
+            return self.decompressor.flush()
+        try:
+            return self.decompressor.decompress(data, DEFLATE_CHUNK_SIZE)
+        except zlib.error as e:
+            raise HwpError(f"HWP 본문 압축을 풀 수 없습니다: {e}") from e
+
+    def read(self, size):
+        while len(self.buffer) - self.position < size and not self.eof:
+            # 이미 읽은 앞부분은 버퍼에서 제거
+            if self.position:
+                del self.buffer[:self.position]
+                self.position = 0
+            self.buffer += self._next_chunk()
+        data = bytes(self.buffer[self.position:self.position + size])
+        self.position += len(data)
+        return data
+
+
+def _iter_records(reader):
+    """HWP 레코드 (태그, 레벨, 데이터) 순차 반환"""
+    while True:
+        header = reader.read(4)
+        if not header:
+            return
+        if len(header) < 4:
+            raise HwpError("HWP 레코드 헤더가 손상되었습니다.")
+        (value,) = struct.unpack('<I', header)
+        tag = value & 0x3FF
+        level = (value >> 10) & 0x3FF
+        size = (value >> 20) & 0xFFF
+        if size == 0xFFF:
+            extended = reader.read(4)
+            if len(extended) < 4:
+                raise HwpError("HWP 레코드 헤더가 손상되었습니다.")
+            (size,) = struct.unpack('<I', extended)
+        data = reader.read(size)
+        if len(data) < size:
+            raise HwpError("HWP 레코드가 중간에 끝났습니다.")
+        yield tag, level, data
+
+
+def decode_para_text(data):
+    """HWPTAG_PARA_TEXT 레코드를 텍스트로 변환 (제어 문자 처리)"""
+    # surrogatepass로 풀면 UTF-16 코드 단위 1개가 글자 1개에 대응하므로 컨트롤 길이(8단위)를 그대로 건너뛸 수 있음
+    units = data[:len(data) // 2 * 2].decode('utf-16-le', 'surrogatepass')
+    pieces = []
+    position = 0
+    while True:
+        match = _HWP_CONTROL_CHAR.search(units, position)
+        if match is None:
+            pieces.append(units[position:])
+            break
+        start = match.start()
+        pieces.append(units[position:start])
+        code = ord(units[start])
+        if code in HWP_INLINE_CONTROLS or code in HWP_EXTENDED_CONTROLS:
+            if code == HWP_TAB:
+                pieces.append('\t')
+            position = start + 8
+        else:
+            pieces.append(HWP_CHAR_CONTROLS.get(code, ''))
+            position = start + 1
+    # UTF-16 서로게이트 쌍 결합
+    return ''.join(pieces).encode('utf-16-le', 'surrogatepass').decode('utf-16-le', 'replace')
+
+
+def _read_file_header(ole):
+    """FileHeader 스트림 확인 후 속성 비트 반환"""
+    if not ole.exists('FileHeader'):
+        raise HwpError("HWP 문서가 아닙니다. (FileHeader 없음)")
+    header = ole.openstream('FileHeader').read(256)
+    if not header.startswith(HWP_SIGNATURE):
+        raise HwpError("HWP 문서가 아닙니다. (서명 불일치)")
+    (flags,) = struct.unpack('<I', header[36:40])
+    if flags & HWP_FLAG_PASSWORD:
+        raise HwpError("암호가 설정된 HWP 문서입니다.")
+    if flags & HWP_FLAG_DISTRIBUTION:
+        raise HwpError("배포용 HWP 문서는 본문을 추출할 수 없습니다.")
+    return flags
+
+
+def iter_hwp_paragraphs(fileobj):
+    """
+    HWP 5.x 문단 순차 반환
+    구역 스트림을 조금씩 풀면서 레코드를 해석하므로 문서 크기와 관계없이 메모리 사용량이 일정함
+    (OLE 스트림 자체는 olefile이 압축된 상태로 읽음)
+    """
+    import olefile
+
+    try:
+        ole = olefile.OleFileIO(fileobj)
+    except (OSError, olefile.olefile.NotOleFileError) as e:
+        raise HwpError(f"HWP 파일을 읽을 수 없습니다: {e}") from e
+
+    with ole:
+        flags = _read_file_header(ole)
+        compressed = bool(flags & HWP_FLAG_COMPRESSED)
+
+        sections = sorted(
+            (int(match.group(1)), entry)
+            for entry in ole.listdir()
+            if len(entry) == 2 and entry[0] == 'BodyText'
+            and (match := HWP_SECTION_PATTERN.match(entry[1]))
+        )
+        if not sections:
+            raise HwpError("HWP 본문(BodyText)이 없습니다.")
+
+        for section_number, entry in sections:
+            reader = _DeflateReader(ole.openstream(entry), compressed)
+            index = 0
+            base_level = None
+            pending = None
+            for tag, level, data in _iter_records(reader):
+                if tag == HWPTAG_PARA_HEADER:
+                    if pending is not None:
+                        yield pending
+                        index += 1
+                    if base_level is None:
+                        base_level = level
+                    # 본문 문단은 레벨 0, 표/글상자 안 문단은 더 깊은 레벨
+                    pending = Paragraph(section_number, index, level - base_level, '')
+                elif tag == HWPTAG_PARA_TEXT and pending is not None:
+                    pending = pending._replace(text=decode_para_text(data))
+            if pending is not None:
+                yield pending
+
+
+# ---------------------------------------------------------------------------
+# 공통
+# ---------------------------------------------------------------------------
+
+def iter_paragraphs(fileobj, file_type):
+    """파일 형식(hwp/hwpx)에 맞는 문단 순차 반환"""
+    if file_type == 'hwpx':
+        return iter_hwpx_paragraphs(fileobj)
+    if file_type == 'hwp':
+        return iter_hwp_paragraphs(fileobj)
+    raise HwpError(f"한글 문서가 아닙니다: {file_type}")
+
+
+def split_articles(paragraphs):
+    """
+    문단 목록을 "제N조" 기준 조문으로 분리하여 순차 반환
+    첫 조문 앞의 문단(제목, 장 제목 등)은 number=None인 조문으로 반환
+    표 안의 문단 등 중첩 문단은 조문 시작으로 보지 않음
+    """
+    current = Article(None, None, '', None, [])
+    for paragraph in paragraphs:
+        match = ARTICLE_PATTERN.match(paragraph.text.strip()) if paragraph.depth == 0 else None
+        if match:
+            if current.paragraphs:
+                yield current
+            current = Article(
+                int(match.group(1)),
+                int(match.group(2)) if match.group(2) else None,
+                (match.group(3) or '').strip(),
+                (paragraph.section, paragraph.index),
+                [],
+            )
+        current.paragraphs.append(paragraph)
+    if current.paragraphs:
+        yield current
@@ -0,0 +1,123 @@
+"""
+첨부파일 텍스트 추출 성능 측정 명령어
+지정한 파일/폴더의 문서를 추출하여 파일별 처리 시간, 처리량, 최대 메모리 사용량을 출력
+"""
+
+import os
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+
+from regulations.extraction import ExtractionError, extract_text, get_file_type, is_supported
+from regulations.hwp import HwpError, iter_paragraphs, split_articles
+
+
+class Command(BaseCommand):
+    help = '문서 텍스트 추출 처리량과 메모리 사용량을 측정합니다. (PDF/DOCX/HWP/HWPX)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths',
+            nargs='+',
+            help='측정할 파일 또는 폴더 경로 (폴더는 하위 폴더까지 검색)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=1,
+            help='파일별 반복 횟수 (기본값: 1, 가장 빠른 시간을 사용)'
+        )
+        parser.add_argument(
+            '--memory',
+            action='store_true',
+            help='최대 메모리 사용량을 측정합니다. (tracemalloc 사용으로 처리 속도는 느려짐)'
+        )
+
+    def collect_files(self, paths):
+        """측정 대상 파일 목록"""
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for root, _, names in os.walk(path):
+                    files.extend(
+                        os.path.join(root, name) for name in sorted(names) if is_supported(name)
+                    )
+            elif os.path.isfile(path):
+                if is_supported(path):
+                    files.append(path)
+                else:
+                    self.stdout.write(self.style.WARNING(f'지원하지 않는 형식: {path}'))
+            else:
+                raise CommandError(f'파일 또는 폴더가 없습니다: {path}')
+        return files
+
+    def measure(self, path, repeat, memory):
+        """파일 1건 추출 측정 (소요 시간, 글자 수, 문단 수, 조문 수, 최대 메모리)"""
+        file_type = get_file_type(path)
+        best = None
+        peak = None
+        for _ in range(repeat):
+            if memory:
+                tracemalloc.start()
+            started = time.perf_counter()
+            with open(path, 'rb') as f:
+                text = extract_text(f, file_type)
+            elapsed = time.perf_counter() - started
+            if memory:
+                _, current_peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                peak = max(peak or 0, current_peak)
+            best = elapsed if best is None else min(best, elapsed)
+
+        paragraphs = articles = None
+        if file_type in ('hwp', 'hwpx'):
+            with open(path, 'rb') as f:
+                paragraph_list = list(iter_paragraphs(f, file_type))
+            paragraphs = len(paragraph_list)
+            articles = sum(1 for article in split_articles(paragraph_list) if article.number)
+
+        return best, len(text), paragraphs, articles, peak
+
+    def handle(self, *args, **options):
+        files = self.collect_files(options['paths'])
+        if not files:
+            raise CommandError('측정할 문서가 없습니다.')
+
+        repeat = max(1, options['repeat'])
+        total_bytes = total_seconds = total_chars = 0
+        failed = 0
+
+        self.stdout.write(f'문서 {len(files)}건 측정 (반복 {repeat}회)\n')
+        for path in files:
+            size = os.path.getsize(path)
+            try:
+                seconds, chars, paragraphs, articles, peak = self.measure(
+                    path, repeat, options['memory']
+                )
+            except (ExtractionError, HwpError) as e:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f'  실패 {path}: {e}'))
+                continue
+
+            total_bytes += size
+            total_seconds += seconds
+            total_chars += chars
+
+            line = (
+                f'  {os.path.basename(path)}: {size / 1024:,.0f}KB, {chars:,}자, '
+                f'{seconds * 1000:,.1f}ms ({size / 1024 / 1024 / seconds if seconds else 0:,.2f}MB/s)'
+            )
+            if paragraphs is not None:
+                line += f', 문단 {paragraphs:,}개, 조문 {articles:,}개'
+            if peak is not None:
+                line += f', 최대 메모리 {peak / 1024 / 1024:,.1f}MB'
+            self.stdout.write(line)
+
+        if total_seconds:
+            self.stdout.write(self.style.SUCCESS(
+                f'\n합계: {len(files) - failed}건 {total_bytes / 1024 / 1024:,.1f}MB, '
+                f'{total_chars:,}자, {total_seconds:,.2f}초 '
+                f'({total_bytes / 1024 / 1024 / total_seconds:,.2f}MB/s, '
+                f'{(len(files) - failed) / total_seconds:,.1f}건/s), 실패 {failed}건'
+            ))
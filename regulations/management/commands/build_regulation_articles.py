@@ -0,0 +1,39 @@
+"""
+사규 조문 색인 생성 명령어
+기존 사규 본문을 장/절/조/항/호 단위로 분석하여 조문 색인(RegulationArticle)을 다시 만듦
+(본문 저장 시에는 자동으로 갱신되므로 최초 적용 또는 분석 규칙 변경 시 사용)
+"""
+
+from django.core.management.base import BaseCommand
+
+from regulations.articles import rebuild_articles
+from regulations.models import Regulation
+
+
+class Command(BaseCommand):
+    help = '사규 본문으로 조문 색인을 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--code',
+            action='append',
+            default=[],
+            help='대상 사규 코드 (여러 번 지정 가능, 기본값: 전체 사규)'
+        )
+
+    def handle(self, *args, **options):
+        queryset = Regulation.objects.only('pk', 'code', 'content').order_by('pk')
+        if options['code']:
+            queryset = queryset.filter(code__in=options['code'])
+
+        regulation_count = article_count = 0
+        for regulation in queryset.iterator(chunk_size=100):
+            count = rebuild_articles(regulation)
+            regulation_count += 1
+            article_count += count
+            if options['verbosity'] > 1:
+                self.stdout.write(f'  {regulation.code}: {count}건')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'사규 {regulation_count}건, 조문 {article_count}건 색인 완료'
+        ))
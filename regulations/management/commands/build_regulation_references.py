@@ -0,0 +1,42 @@
+"""
+사규 인용 색인 생성 명령어
+전체 사규 본문에서 다른 사규 인용을 찾아 인용 관계(RegulationReference)를 다시 만듦
+(본문/사규명 변경 시에는 자동으로 갱신되므로 최초 적용 또는 분석 규칙 변경 시 사용)
+"""
+
+from django.core.management.base import BaseCommand
+
+from regulations.models import Regulation
+from regulations.references import get_automaton, invalidate_patterns, rebuild_references
+
+
+class Command(BaseCommand):
+    help = '사규 본문으로 사규 간 인용 색인을 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--code',
+            action='append',
+            default=[],
+            help='대상 사규 코드 (여러 번 지정 가능, 기본값: 전체 사규)'
+        )
+
+    def handle(self, *args, **options):
+        invalidate_patterns()
+        automaton = get_automaton()
+
+        queryset = Regulation.objects.only('pk', 'code', 'content').order_by('pk')
+        if options['code']:
+            queryset = queryset.filter(code__in=options['code'])
+
+        regulation_count = reference_count = 0
+        for regulation in queryset.iterator(chunk_size=100):
+            count = rebuild_references(regulation, automaton)
+            regulation_count += 1
+            reference_count += count
+            if options['verbosity'] > 1 and count:
+                self.stdout.write(f'  {regulation.code}: {count}건')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'사규 {regulation_count}건, 인용 {reference_count}건 색인 완료'
+        ))
@@ -0,0 +1,27 @@
+"""
+유사 사규 계산 명령어
+사규명/설명/본문의 TF-IDF 유사도로 사규별 유사 사규를 계산
+(주기 작업 regulations.update_similarities가 바뀐 사규만 증분 갱신하므로 최초 적용 또는 설정 변경 시 사용)
+"""
+
+from django.core.management.base import BaseCommand
+
+from regulations.similarity import update_similarities
+
+
+class Command(BaseCommand):
+    help = '사규별 유사 사규를 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='저장된 벡터를 버리고 전체 사규를 다시 계산'
+        )
+
+    def handle(self, *args, **options):
+        result = update_similarities(rebuild=options['rebuild'])
+        self.stdout.write(self.style.SUCCESS(
+            f"벡터화 {result['vectorized']}건, 유사 사규 계산 {result['recomputed']}건, "
+            f"저장 {result['pairs']}건 완료"
+        ))
@@ -0,0 +1,41 @@
+"""
+사규 시행 구간 생성 명령어
+시행일/폐지일과 버전 등록일로 사규별 시행 구간(RegulationValidity)을 다시 만듦
+(버전 등록/삭제, 시행일/폐지일 변경 시에는 자동으로 갱신되므로 최초 적용 시 사용)
+"""
+
+from django.core.management.base import BaseCommand
+
+from regulations.models import Regulation, RegulationValidity
+from regulations.validity import rebuild_validity
+
+
+class Command(BaseCommand):
+    help = '사규별 시행 구간(시점 조회용)을 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--code',
+            action='append',
+            default=[],
+            help='대상 사규 코드 (여러 번 지정 가능, 기본값: 전체 사규)'
+        )
+
+    def handle(self, *args, **options):
+        queryset = Regulation.objects.only(
+            'pk', 'code', 'effective_date', 'abolished_date', 'created_at'
+        ).order_by('pk')
+        if options['code']:
+            queryset = queryset.filter(code__in=options['code'])
+
+        regulation_count = 0
+        for regulation in queryset.iterator(chunk_size=100):
+            rebuild_validity(regulation)
+            regulation_count += 1
+
+        interval_count = RegulationValidity.objects.filter(
+            regulation__in=queryset.values('pk')
+        ).count()
+        self.stdout.write(self.style.SUCCESS(
+            f'사규 {regulation_count}건, 시행 구간 {interval_count}건 생성 완료'
+        ))
@@ -0,0 +1,93 @@
+"""
+기존 첨부파일 텍스트 일괄 추출 명령어
+추출 텍스트가 없는 사규 원본 파일/버전 첨부파일을 프로세스 풀에서 병렬로 추출
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.core.management.base import BaseCommand
+
+from regulations.extraction import extract_path, is_supported
+from regulations.models import ExtractedText
+from regulations.services import ATTACHMENTS, link_extracted_text, save_extracted_text
+from regulations.storage import get_attachment_storage
+
+
+class Command(BaseCommand):
+    help = '추출 텍스트가 없는 기존 첨부파일(PDF/DOCX/HWP/HWPX)의 텍스트를 일괄 추출합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='추출 프로세스 수 (기본값: CPU 수)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='이미 추출된 첨부파일도 다시 추출합니다.'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=0,
+            help='처리할 최대 파일 수 (0이면 전체)'
+        )
+
+    def collect_targets(self, force, limit):
+        """추출 대상 (종류, pk, 파일 경로) 목록"""
+        storage = get_attachment_storage()
+        targets = []
+        for kind, (model, file_field, text_field) in ATTACHMENTS.items():
+            queryset = model.objects.exclude(**{file_field: ''}).exclude(**{f'{file_field}__isnull': True})
+            if not force:
+                queryset = queryset.filter(**{f'{text_field}__isnull': True})
+            for pk, name in queryset.order_by('pk').values_list('pk', file_field).iterator():
+                if not is_supported(name):
+                    continue
+                path = storage.path(name)
+                if not os.path.exists(path):
+                    self.stdout.write(self.style.WARNING(f'  파일 없음: {name}'))
+                    continue
+                targets.append((kind, pk, path))
+        return targets[:limit] if limit else targets
+
+    def handle(self, *args, **options):
+        targets = self.collect_targets(options['force'], options['limit'])
+        if not targets:
+            self.stdout.write('추출할 첨부파일이 없습니다.')
+            return
+
+        # 이미 추출된 해시는 작업 프로세스에서 해시 계산 후 추출을 건너뜀
+        known_hashes = frozenset() if options['force'] else frozenset(
+            ExtractedText.objects.values_list('sha256', flat=True)
+        )
+        workers = max(1, options['workers'])
+        self.stdout.write(f'첨부파일 {len(targets)}건 추출 시작 (프로세스 {workers}개)')
+
+        extracted_count = reused_count = failed_count = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                partial(extract_path, known_hashes=known_hashes),
+                [path for _, _, path in targets],
+                chunksize=8,
+            )
+            for (kind, pk, path), result in zip(targets, results):
+                if result['text'] is None and not result['error']:
+                    extracted = ExtractedText.objects.filter(sha256=result['sha256']).first()
+                    reused_count += 1
+                else:
+                    extracted = save_extracted_text(**result, replace=options['force'])
+                    if result['error']:
+                        failed_count += 1
+                        self.stdout.write(self.style.WARNING(f'  추출 실패: {path} - {result["error"]}'))
+                    else:
+                        extracted_count += 1
+                link_extracted_text(kind, pk, extracted)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'완료: 추출 {extracted_count}건, 재사용 {reused_count}건, 실패 {failed_count}건'
+        ))
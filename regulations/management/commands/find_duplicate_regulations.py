@@ -0,0 +1,50 @@
+"""
+유사 중복 사규 탐지 명령어
+본문 MinHash 서명의 LSH 후보 쌍에서 Jaccard 유사도 추정값이 기준 이상인 사규 묶음을 출력
+(서명은 본문 저장 시 계산되므로 최초 적용 또는 DUPLICATE_SETTINGS 변경 시 --rebuild)
+"""
+
+from django.core.management.base import BaseCommand
+
+from regulations.minhash import find_clusters, rebuild_minhashes
+from regulations.models import Regulation
+
+
+class Command(BaseCommand):
+    help = '본문이 거의 같은 사규 묶음을 찾습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=None,
+            help='최소 Jaccard 유사도 추정값 (기본값: DUPLICATE_SETTINGS THRESHOLD)'
+        )
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='전체 사규의 MinHash 서명을 다시 계산'
+        )
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            count = rebuild_minhashes()
+            self.stdout.write(f'MinHash 서명 {count}건 계산')
+
+        clusters = find_clusters(options['threshold'])
+        names = dict(
+            Regulation.objects.filter(
+                pk__in={pk for cluster in clusters for pk in cluster['ids']}
+            ).values_list('pk', 'code')
+        )
+        for number, cluster in enumerate(clusters, start=1):
+            self.stdout.write(
+                f"[{number}] {len(cluster['ids'])}건 "
+                f"(유사도 {cluster['min_score']:.2f}~{cluster['max_score']:.2f}): "
+                + ', '.join(names[pk] for pk in cluster['ids'])
+            )
+            if options['verbosity'] > 1:
+                for left, right, score in cluster['pairs']:
+                    self.stdout.write(f'    {names[left]} ~ {names[right]}: {score:.3f}')
+
+        self.stdout.write(self.style.SUCCESS(f'유사 중복 묶음 {len(clusters)}건'))
@@ -0,0 +1,25 @@
+"""
+감사 로그 스풀 재저장 명령어
+DB 저장에 실패하여 스풀 파일에 기록된 다운로드/조회 이벤트를 DB에 저장
+"""
+
+from django.core.management.base import BaseCommand
+
+from regulations.audit import get_audit_settings, replay_spool
+
+
+class Command(BaseCommand):
+    help = '스풀 파일에 남은 감사 로그(다운로드/조회 기록)를 DB에 저장합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            type=str,
+            default=None,
+            help='스풀 파일 경로 (기본값: AUDIT_SETTINGS의 SPOOL_PATH)'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path'] or get_audit_settings()['SPOOL_PATH']
+        saved = replay_spool(path)
+        self.stdout.write(self.style.SUCCESS(f'감사 로그 {saved}건 저장 ({path})'))
@@ -0,0 +1,105 @@
+"""
+첨부파일 저장 파일 정리 명령어
+참조가 없는 저장 파일(FileBlob)과 등록되지 않은 파일을 삭제
+"""
+
+import os
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from regulations.models import FileBlob, Regulation, RegulationVersion
+from regulations.storage import BLOB_PREFIX, get_attachment_storage, is_blob_name
+
+
+class Command(BaseCommand):
+    help = '참조가 없는 첨부파일 저장 파일을 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace-hours',
+            type=int,
+            default=24,
+            help='참조가 없어진 후 삭제까지 유예 시간 (기본값: 24시간, 업로드 중인 파일 보호)'
+        )
+        parser.add_argument(
+            '--recount',
+            action='store_true',
+            help='사규/버전의 실제 첨부파일 기준으로 참조 수를 다시 계산합니다.'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='실제로 삭제하지 않고 대상만 확인합니다.'
+        )
+
+    def recount(self, dry_run):
+        """참조 수 재계산"""
+        counts = Counter(
+            name
+            for model, field in ((Regulation, 'original_file'), (RegulationVersion, 'content_file'))
+            for name in model.objects.values_list(field, flat=True).iterator()
+            if is_blob_name(name)
+        )
+        changed = []
+        for blob in FileBlob.objects.iterator():
+            actual = counts.pop(blob.name, 0)
+            if blob.ref_count != actual:
+                self.stdout.write(f'  참조 수 보정: {blob.name} {blob.ref_count} → {actual}')
+                blob.ref_count = actual
+                changed.append(blob)
+        if counts:
+            self.stdout.write(self.style.WARNING(
+                f'  FileBlob에 없는 첨부파일 경로 {len(counts)}건: ' + ', '.join(list(counts)[:5])
+            ))
+        if changed and not dry_run:
+            FileBlob.objects.bulk_update(changed, ['ref_count'], batch_size=500)
+        return len(changed)
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        storage = get_attachment_storage()
+        cutoff = timezone.now() - timedelta(hours=options['grace_hours'])
+
+        if options['recount']:
+            self.stdout.write(f'참조 수 보정: {self.recount(dry_run)}건')
+
+        # 1. 참조가 없고 유예 시간이 지난 저장 파일
+        deleted_count = deleted_bytes = 0
+        for blob in FileBlob.objects.filter(ref_count=0, updated_at__lt=cutoff).iterator():
+            self.stdout.write(f'  삭제: {blob.name} ({blob.size:,}B)')
+            deleted_count += 1
+            deleted_bytes += blob.size
+            if dry_run:
+                continue
+            # 조회 이후 다시 참조되었으면 건너뜀
+            deleted, _ = FileBlob.objects.filter(
+                pk=blob.pk, ref_count=0, updated_at__lt=cutoff
+            ).delete()
+            if deleted:
+                storage.delete(blob.name)
+
+        # 2. FileBlob에 등록되지 않은 파일과 남은 업로드 임시 파일
+        orphan_count = 0
+        root = storage.path(BLOB_PREFIX)
+        known = set(FileBlob.objects.values_list('name', flat=True))
+        cutoff_timestamp = time.mktime(cutoff.timetuple())
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, storage.location).replace(os.sep, '/')
+                if name in known or os.path.getmtime(path) >= cutoff_timestamp:
+                    continue
+                self.stdout.write(f'  미등록 파일 삭제: {name}')
+                orphan_count += 1
+                if not dry_run:
+                    os.remove(path)
+
+        prefix = '[DRY RUN] ' if dry_run else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}저장 파일 {deleted_count}건 ({deleted_bytes / 1024 / 1024:,.1f}MB), '
+            f'미등록 파일 {orphan_count}건 삭제'
+        ))
@@ -14,6 +14,7 @@ from openpyxl.utils import get_column_letter
 
 from accounts.models import Department, User
 from regulations.models import Regulation, RegulationVersion
+from regulations.tags import add_tags, parse_tags
 
 
 class Command(BaseCommand):
@@ -31,6 +32,11 @@ class Command(BaseCommand):
             action='store_true',
             help='실제로 데이터를 저장하지 않고 확인만 합니다.'
         )
+        parser.add_argument(
+            '--background',
+            action='store_true',
+            help='백그라운드 작업으로 적재하고 바로 종료합니다. (runworker가 실행)'
+        )
 
     def handle(self, *args, **options):
         file_path = options['file']
@@ -40,6 +46,12 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f'파일을 찾을 수 없습니다: {file_path}'))
             return
         
+        if options['background'] and not dry_run:
+            from regulations.tasks import import_naver_regulations
+            task = import_naver_regulations.delay(os.path.abspath(file_path))
+            self.stdout.write(self.style.SUCCESS(f'백그라운드 작업으로 적재되었습니다. (작업 #{task.pk})'))
+            return
+        
         self.stdout.write(f'엑셀 파일 읽기: {file_path}')
         
         try:
@@ -54,6 +66,7 @@ class Command(BaseCommand):
             # 엑셀 컬럼 구조:
             # 0: No, 1: 의무여부, 2: 그룹, 3: 유형, 4: 규정/가이드명
             # 5: 공개여부, 6: 담당부서, 7: 담당자, 8: 제/개정일, 9: 규정본문, 10: 링크
+            # 11: 태그 (선택, 콤마로 구분)
             regulations_data = []
             for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
                 if not row[0] or str(row[0]).strip() == '':
@@ -72,6 +85,7 @@ class Command(BaseCommand):
                     'last_revision_date': row[8] if len(row) > 8 else '',  # 제/개정일
                     'content': row[9] if len(row) > 9 else '',  # 규정본문
                     'link': row[10] if len(row) > 10 else '',  # 링크
+                    'tags': row[11] if len(row) > 11 else '',  # 태그
                 }
                 
                 if not data['title']:
@@ -117,6 +131,8 @@ class Command(BaseCommand):
         
         # 부서 매핑 딕셔너리 생성
         dept_mapping = self.get_or_create_departments(regulations_data)
+        # 사규별 태그 (마지막에 일괄 추가)
+        tag_assignments = {}
         
         for idx, data in enumerate(regulations_data, 1):
             try:
@@ -186,6 +202,9 @@ class Command(BaseCommand):
                 else:
                     updated_count += 1
                 
+                if data['tags']:
+                    tag_assignments[regulation.pk] = parse_tags(str(data['tags']))
+                
                 if idx % 50 == 0:
                     self.stdout.write(f'  진행 중... {idx}/{len(regulations_data)}')
                     
@@ -193,7 +212,10 @@ class Command(BaseCommand):
                 error_count += 1
                 self.stdout.write(self.style.WARNING(f'  오류 (행 {idx}): {data.get("title", "N/A")} - {e}'))
         
+        tagged = add_tags(tag_assignments)
         self.stdout.write(f'  생성: {created_count}개, 업데이트: {updated_count}개, 오류: {error_count}개')
+        if tagged:
+            self.stdout.write(f'  태그 연결: {tagged}건')
 
     def get_or_create_departments(self, regulations_data):
         """부서 매핑 딕셔너리를 생성합니다."""
@@ -9,6 +9,7 @@ from datetime import timedelta
 
 from accounts.models import User, Department
 from regulations.models import Regulation, RegulationVersion, RegulationTag
+from regulations.tags import add_tags, ensure_tags
 
 
 class Command(BaseCommand):
@@ -141,14 +142,9 @@ class Command(BaseCommand):
         return users
 
     def create_tags(self):
-        tags = []
         tag_names = ['인사', '재무', '보안', '윤리', '구매', '개인정보', 'IT', '내부통제', '감사', '준법']
-        
-        for name in tag_names:
-            tag, created = RegulationTag.objects.get_or_create(name=name)
-            tags.append(tag)
-        
-        return tags
+        ensure_tags(tag_names)
+        return list(RegulationTag.objects.filter(name__in=tag_names))
 
     def create_regulations(self, departments, users, tags):
         regulations = []
@@ -255,6 +251,7 @@ class Command(BaseCommand):
         ]
         
         created_regs = {}
+        tag_assignments = {}
         admin_user = users[0]
         
         for data in reg_data:
@@ -282,11 +279,9 @@ class Command(BaseCommand):
             
             created_regs[data['code']] = reg
             
-            # 태그 연결
+            # 태그 연결 (마지막에 일괄 처리)
             if 'tags' in data:
-                for tag_name in data['tags']:
-                    tag = RegulationTag.objects.get(name=tag_name)
-                    tag.regulations.add(reg)
+                tag_assignments[reg.pk] = data['tags']
             
             # 버전 생성
             if created:
@@ -302,6 +297,7 @@ class Command(BaseCommand):
             
             regulations.append(reg)
         
+        add_tags(tag_assignments)
         return regulations
 
 
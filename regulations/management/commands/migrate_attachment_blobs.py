@@ -0,0 +1,88 @@
+"""
+기존 첨부파일 저장소 이전 명령어
+regulations/<사규코드>/, regulations/original/에 저장된 기존 첨부파일을 내용 주소 저장소로 옮김
+"""
+
+import os
+
+from django.core.files import File
+from django.core.management.base import BaseCommand
+
+from regulations.models import Regulation, RegulationVersion
+from regulations.storage import get_attachment_storage, is_blob_name, retain_blob
+
+
+class Command(BaseCommand):
+    help = '기존 첨부파일을 내용 주소 저장소(blobs/)로 옮기고 중복 파일을 정리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='실제로 옮기지 않고 대상만 확인합니다.'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        storage = get_attachment_storage()
+
+        targets = [
+            (Regulation, 'original_file', pk, name)
+            for pk, name in Regulation.objects.exclude(original_file='')
+            .exclude(original_file__isnull=True).values_list('pk', 'original_file')
+            if not is_blob_name(name)
+        ] + [
+            (RegulationVersion, 'content_file', pk, name)
+            for pk, name in RegulationVersion.objects.exclude(content_file='')
+            .exclude(content_file__isnull=True).values_list('pk', 'content_file')
+            if not is_blob_name(name)
+        ]
+        if not targets:
+            self.stdout.write('옮길 첨부파일이 없습니다.')
+            return
+
+        moved = missing = 0
+        before_bytes = 0
+        new_names = set()
+        old_names = set()
+        for model, field, pk, name in targets:
+            if not storage.exists(name):
+                missing += 1
+                self.stdout.write(self.style.WARNING(f'  파일 없음: {name}'))
+                continue
+
+            before_bytes += storage.size(name)
+            if dry_run:
+                moved += 1
+                continue
+
+            with storage.open(name, 'rb') as f:
+                new_name = storage.save(name, File(f, name=name))
+
+            values = {field: new_name}
+            if model is Regulation:
+                values['original_file_name'] = os.path.basename(name)
+            # save()를 거치지 않으므로 참조 수는 직접 증가
+            model.objects.filter(pk=pk).update(**values)
+            retain_blob(new_name)
+
+            new_names.add(new_name)
+            old_names.add(name)
+            moved += 1
+            self.stdout.write(f'  {name} → {new_name}')
+
+        # 기존 파일 삭제 (옮긴 뒤에는 어떤 사규/버전도 참조하지 않음)
+        for name in old_names:
+            storage.delete(name)
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f'[DRY RUN] 대상 {moved}건 ({before_bytes / 1024 / 1024:,.1f}MB), 파일 없음 {missing}건'
+            ))
+            return
+
+        after_bytes = sum(storage.size(name) for name in new_names)
+        self.stdout.write(self.style.SUCCESS(
+            f'완료: {moved}건 이전, 파일 없음 {missing}건, '
+            f'사용량 {before_bytes / 1024 / 1024:,.1f}MB → {after_bytes / 1024 / 1024:,.1f}MB'
+        ))
@@ -0,0 +1,37 @@
+"""
+사규 집계값 복구 명령어
+최신 버전, 버전/즐겨찾기/다운로드/조회 수(RegulationStats)와 태그별 사규 수를 원본 데이터에서 다시 계산
+(등록/삭제 시 자동으로 증감되므로 최초 적용 또는 값이 어긋났을 때 사용)
+"""
+
+from django.core.management.base import BaseCommand
+
+from regulations.models import Regulation, RegulationTag
+from regulations.stats import repair_stats
+from regulations.tags import refresh_counts
+
+
+class Command(BaseCommand):
+    help = '사규별 집계값(버전/즐겨찾기/다운로드/조회 수)과 태그별 사규 수를 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--code',
+            action='append',
+            default=[],
+            help='대상 사규 코드 (여러 번 지정 가능, 기본값: 전체 사규)'
+        )
+
+    def handle(self, *args, **options):
+        regulation_ids = None
+        if options['code']:
+            regulation_ids = list(
+                Regulation.objects.filter(code__in=options['code']).values_list('pk', flat=True)
+            )
+
+        count = repair_stats(regulation_ids)
+        tag_ids = None
+        if regulation_ids is not None:
+            tag_ids = RegulationTag.objects.filter(regulations__in=regulation_ids).values_list('pk', flat=True)
+        tag_count = refresh_counts(tag_ids)
+        self.stdout.write(self.style.SUCCESS(f'사규 집계값 {count}건, 태그 사규 수 {tag_count}건 복구 완료'))
@@ -0,0 +1,43 @@
+# Generated by Django 6.0 on 2026-10-19 05:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0013_commoncode'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExtractedText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='파일 해시')),
+                ('file_type', models.CharField(max_length=10, verbose_name='파일 형식')),
+                ('file_size', models.PositiveBigIntegerField(default=0, verbose_name='파일 크기')),
+                ('status', models.CharField(choices=[('DONE', '추출완료'), ('FAILED', '추출실패')], default='DONE', max_length=10, verbose_name='상태')),
+                ('text', models.TextField(blank=True, verbose_name='추출 텍스트')),
+                ('char_count', models.PositiveIntegerField(default=0, verbose_name='글자 수')),
+                ('error', models.TextField(blank=True, verbose_name='오류 내용')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='추출일시')),
+            ],
+            options={
+                'verbose_name': '추출 텍스트',
+                'verbose_name_plural': '추출 텍스트',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='regulation',
+            name='original_text',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='regulations.extractedtext', verbose_name='원본 파일 추출 텍스트'),
+        ),
+        migrations.AddField(
+            model_name='regulationversion',
+            name='content_text',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='regulations.extractedtext', verbose_name='첨부파일 추출 텍스트'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 6.0 on 2026-10-19 06:04
+
+import regulations.models
+import regulations.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0014_extracted_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='regulation',
+            name='original_file_name',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='원본 파일명'),
+        ),
+        migrations.AlterField(
+            model_name='regulation',
+            name='original_file',
+            field=models.FileField(blank=True, help_text='사규 원본 파일 (PDF, Word, HWP 등)', null=True, storage=regulations.storage.get_attachment_storage, upload_to='regulations/original/', verbose_name='사규 원본 파일'),
+        ),
+        migrations.AlterField(
+            model_name='regulationversion',
+            name='content_file',
+            field=models.FileField(blank=True, null=True, storage=regulations.storage.get_attachment_storage, upload_to=regulations.models.regulation_file_path, verbose_name='첨부파일'),
+        ),
+        migrations.CreateModel(
+            name='FileBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(db_index=True, max_length=64, verbose_name='파일 해시')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='저장 경로')),
+                ('size', models.PositiveBigIntegerField(default=0, verbose_name='파일 크기')),
+                ('ref_count', models.PositiveIntegerField(default=0, verbose_name='참조 수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='저장일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='참조 변경일시')),
+            ],
+            options={
+                'verbose_name': '첨부파일 저장 파일',
+                'verbose_name_plural': '첨부파일 저장 파일',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['ref_count', 'updated_at'], name='fileblob_gc_idx')],
+            },
+        ),
+    ]
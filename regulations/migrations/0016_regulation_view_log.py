@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-10-19 06:06
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0015_file_blob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='regulationdownloadlog',
+            name='downloaded_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='다운로드일시'),
+        ),
+        migrations.CreateModel(
+            name='RegulationViewLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('DETAIL', '사규 상세'), ('CONTENT', '사규 본문')], default='DETAIL', max_length=10, verbose_name='조회 화면')),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True, verbose_name='IP 주소')),
+                ('viewed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='조회일시')),
+                ('regulation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_logs', to='regulations.regulation', verbose_name='사규')),
+                ('user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='regulation_view_logs', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '조회 로그',
+                'verbose_name_plural': '조회 로그',
+                'ordering': ['-viewed_at'],
+                'indexes': [models.Index(fields=['regulation', 'viewed_at'], name='viewlog_regulation_idx'), models.Index(fields=['viewed_at'], name='viewlog_viewed_at_idx')],
+            },
+        ),
+    ]
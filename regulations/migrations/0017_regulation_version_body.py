@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-19 06:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0016_regulation_view_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegulationVersionBody',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('storage', models.CharField(choices=[('FULL', '전체 본문'), ('DELTA', '역방향 차이')], default='FULL', max_length=10, verbose_name='저장 방식')),
+                ('data', models.TextField(blank=True, verbose_name='본문 또는 차이')),
+                ('sha256', models.CharField(max_length=64, verbose_name='본문 해시')),
+                ('length', models.PositiveIntegerField(default=0, verbose_name='본문 글자 수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('base', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='dependents', to='regulations.regulationversionbody', verbose_name='기준 본문')),
+                ('version', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='body', to='regulations.regulationversion', verbose_name='버전')),
+            ],
+            options={
+                'verbose_name': '버전 본문',
+                'verbose_name_plural': '버전 본문',
+            },
+        ),
+    ]
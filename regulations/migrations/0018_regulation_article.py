@@ -0,0 +1,38 @@
+# Generated by Django 6.0 on 2026-10-19 06:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0017_regulation_version_body'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegulationArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('PREAMBLE', '전문'), ('CHAPTER', '장'), ('SECTION', '절'), ('ADDENDA', '부칙'), ('ARTICLE', '조'), ('PARAGRAPH', '항'), ('ITEM', '호')], max_length=10, verbose_name='구분')),
+                ('number', models.PositiveIntegerField(blank=True, null=True, verbose_name='번호')),
+                ('branch', models.PositiveIntegerField(blank=True, null=True, verbose_name='가지번호')),
+                ('label', models.CharField(max_length=30, verbose_name='표시 번호')),
+                ('title', models.CharField(blank=True, max_length=200, verbose_name='제목')),
+                ('text', models.TextField(blank=True, verbose_name='본문')),
+                ('anchor', models.CharField(max_length=50, verbose_name='앵커')),
+                ('position', models.PositiveIntegerField(verbose_name='순서')),
+                ('depth', models.PositiveSmallIntegerField(default=0, verbose_name='깊이')),
+                ('in_addenda', models.BooleanField(default=False, verbose_name='부칙 여부')),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='children', to='regulations.regulationarticle', verbose_name='상위 조문')),
+                ('regulation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='articles', to='regulations.regulation', verbose_name='사규')),
+            ],
+            options={
+                'verbose_name': '사규 조문',
+                'verbose_name_plural': '사규 조문',
+                'ordering': ['regulation', 'position'],
+                'indexes': [models.Index(fields=['regulation', 'kind', 'number', 'branch'], name='article_number_idx'), models.Index(fields=['regulation', 'position'], name='article_position_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-19 06:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0018_regulation_article'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='regulation',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='본문 HTML'),
+        ),
+        migrations.AddField(
+            model_name='regulation',
+            name='content_html_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64, verbose_name='본문 HTML 해시'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0 on 2026-10-19 06:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0019_regulation_content_html'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegulationReference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_anchor', models.CharField(blank=True, max_length=50, verbose_name='인용한 조문 앵커')),
+                ('source_label', models.CharField(blank=True, max_length=30, verbose_name='인용한 조문')),
+                ('target_number', models.PositiveIntegerField(blank=True, null=True, verbose_name='인용된 조번호')),
+                ('target_branch', models.PositiveIntegerField(blank=True, null=True, verbose_name='인용된 가지번호')),
+                ('matched_text', models.CharField(max_length=200, verbose_name='인용 문구')),
+                ('excerpt', models.CharField(blank=True, max_length=200, verbose_name='인용 부분')),
+                ('occurrences', models.PositiveIntegerField(default=1, verbose_name='인용 횟수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outgoing_references', to='regulations.regulation', verbose_name='인용한 사규')),
+                ('target', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='incoming_references', to='regulations.regulation', verbose_name='인용된 사규')),
+            ],
+            options={
+                'verbose_name': '사규 인용',
+                'verbose_name_plural': '사규 인용',
+                'ordering': ['source', 'pk'],
+                'indexes': [models.Index(fields=['target', 'target_number'], name='reference_target_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-19 06:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0020_regulation_reference'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegulationSimilarity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(verbose_name='유사도')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='순위')),
+                ('computed_at', models.DateTimeField(verbose_name='계산일')),
+                ('regulation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similarities', to='regulations.regulation', verbose_name='사규')),
+                ('similar', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='regulations.regulation', verbose_name='유사 사규')),
+            ],
+            options={
+                'verbose_name': '유사 사규',
+                'verbose_name_plural': '유사 사규',
+                'ordering': ['regulation', 'rank'],
+                'unique_together': {('regulation', 'similar')},
+            },
+        ),
+    ]
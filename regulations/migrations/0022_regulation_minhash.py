@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-19 06:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0021_regulation_similarity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegulationMinHash',
+            fields=[
+                ('regulation', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='minhash', serialize=False, to='regulations.regulation', verbose_name='사규')),
+                ('signature', models.BinaryField(verbose_name='서명')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='계산일')),
+            ],
+            options={
+                'verbose_name': '사규 MinHash 서명',
+                'verbose_name_plural': '사규 MinHash 서명',
+            },
+        ),
+        migrations.CreateModel(
+            name='RegulationMinHashBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band', models.PositiveSmallIntegerField(verbose_name='구간')),
+                ('bucket', models.BigIntegerField(verbose_name='구간 해시')),
+                ('regulation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='minhash_bands', to='regulations.regulation', verbose_name='사규')),
+            ],
+            options={
+                'verbose_name': '사규 MinHash 구간',
+                'verbose_name_plural': '사규 MinHash 구간',
+                'indexes': [models.Index(fields=['band', 'bucket'], name='minhash_band_bucket_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-19 06:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0022_regulation_minhash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegulationValidity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('valid_from', models.DateField(verbose_name='시작일')),
+                ('valid_to', models.DateField(blank=True, null=True, verbose_name='종료일')),
+                ('regulation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='validity_intervals', to='regulations.regulation', verbose_name='사규')),
+                ('version', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='validity_intervals', to='regulations.regulationversion', verbose_name='버전')),
+            ],
+            options={
+                'verbose_name': '사규 시행 구간',
+                'verbose_name_plural': '사규 시행 구간',
+                'ordering': ['regulation', 'valid_from'],
+                'indexes': [models.Index(fields=['valid_from', 'valid_to'], name='validity_interval_idx'), models.Index(fields=['regulation', 'valid_from'], name='validity_regulation_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,89 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+
+
+def _counts(queryset, total):
+    return dict(queryset.values_list('regulation_id').annotate(total=total).order_by())
+
+
+def _usage_counts(apps, name, model, field):
+    """사규별 다운로드/조회 건수 (원본 로그가 삭제된 일자는 이용 현황 일별 집계로 계산)"""
+    DailyRegulationUsage = apps.get_model('reports', 'DailyRegulationUsage')
+    RollupWatermark = apps.get_model('reports', 'RollupWatermark')
+
+    watermark = RollupWatermark.objects.filter(name=name).first()
+    logs = model.objects.all()
+    counts = {}
+    if watermark and watermark.pruned_before:
+        logs = logs.exclude(**{
+            f'{field}__date__lt': watermark.pruned_before, 'pk__lte': watermark.last_id,
+        })
+        counts = _counts(
+            DailyRegulationUsage.objects.filter(date__lt=watermark.pruned_before),
+            Sum(f'{name}_count'),
+        )
+    for regulation_id, total in _counts(logs, Count('pk')).items():
+        counts[regulation_id] = (counts.get(regulation_id) or 0) + total
+    return counts
+
+
+def fill_stats(apps, schema_editor):
+    """기존 사규의 집계값을 원본 데이터에서 계산 (이 시점의 모델만 사용)"""
+    Favorite = apps.get_model('regulations', 'Favorite')
+    Regulation = apps.get_model('regulations', 'Regulation')
+    RegulationDownloadLog = apps.get_model('regulations', 'RegulationDownloadLog')
+    RegulationStats = apps.get_model('regulations', 'RegulationStats')
+    RegulationVersion = apps.get_model('regulations', 'RegulationVersion')
+    RegulationViewLog = apps.get_model('regulations', 'RegulationViewLog')
+
+    latest = RegulationVersion.objects.filter(
+        regulation=OuterRef('pk')
+    ).order_by('-created_at', '-pk').values('pk')[:1]
+    rows = Regulation.objects.annotate(
+        latest_version_id=Subquery(latest),
+        version_count=Count('versions', distinct=True),
+    ).values_list('pk', 'latest_version_id', 'version_count')
+
+    favorites = _counts(Favorite.objects.all(), Count('pk'))
+    downloads = _usage_counts(apps, 'download', RegulationDownloadLog, 'downloaded_at')
+    views = _usage_counts(apps, 'view', RegulationViewLog, 'viewed_at')
+
+    RegulationStats.objects.bulk_create([
+        RegulationStats(
+            regulation_id=pk,
+            latest_version_id=latest_version_id,
+            version_count=version_count,
+            favorite_count=favorites.get(pk, 0),
+            download_count=downloads.get(pk, 0),
+            view_count=views.get(pk, 0),
+        )
+        for pk, latest_version_id, version_count in rows.iterator()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0023_regulation_validity'),
+        ('reports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegulationStats',
+            fields=[
+                ('regulation', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='regulations.regulation', verbose_name='사규')),
+                ('version_count', models.PositiveIntegerField(default=0, verbose_name='버전 수')),
+                ('favorite_count', models.PositiveIntegerField(default=0, verbose_name='즐겨찾기 수')),
+                ('download_count', models.PositiveIntegerField(default=0, verbose_name='다운로드 수')),
+                ('view_count', models.PositiveIntegerField(default=0, verbose_name='조회 수')),
+                ('latest_version', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='regulations.regulationversion', verbose_name='최신 버전')),
+            ],
+            options={
+                'verbose_name': '사규 집계',
+                'verbose_name_plural': '사규 집계',
+            },
+        ),
+        migrations.RunPython(fill_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 6.0 on 2026-10-19 09:12
+
+from django.db import migrations
+
+
+# 사규 등록 폼/대시보드에 하드코딩되어 있던 그룹 목록과 사규 분류
+GROUPS = [
+    '이사회', 'HR', '재무', '구매', '준법', '반부패',
+    '정보보호', '개인정보보호', '안전보건', 'ESG', '컴플라이언스', '기타',
+]
+CATEGORIES = [
+    ('POLICY', '정책/방침'),
+    ('REGULATION', '규정'),
+    ('GUIDELINE', '지침'),
+    ('MANUAL', '매뉴얼/가이드라인'),
+]
+
+
+def seed_codes(apps, schema_editor):
+    """그룹/분류 공통코드 등록 (이미 있는 코드는 그대로 둠)"""
+    CommonCode = apps.get_model('regulations', 'CommonCode')
+    for index, name in enumerate(GROUPS, start=1):
+        CommonCode.objects.get_or_create(
+            code_type='GROUP', code=name,
+            defaults={'name': name, 'sort_order': index * 10},
+        )
+    for index, (code, name) in enumerate(CATEGORIES, start=1):
+        CommonCode.objects.get_or_create(
+            code_type='CATEGORY', code=code,
+            defaults={'name': name, 'sort_order': index * 10, 'is_system': True},
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0024_regulation_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_codes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-19 06:53
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_counts(apps, schema_editor):
+    """기존 태그의 사규 수 채우기"""
+    RegulationTag = apps.get_model('regulations', 'RegulationTag')
+    through = RegulationTag.regulations.through
+    counted = through.objects.filter(regulationtag_id=OuterRef('pk')).values(
+        'regulationtag_id'
+    ).annotate(total=Count('pk')).values('total')
+    RegulationTag.objects.update(regulation_count=Coalesce(Subquery(counted), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0025_seed_common_codes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='regulationtag',
+            name='regulation_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='사규 수'),
+        ),
+        migrations.RunPython(fill_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,238 @@
+"""
+유사 중복 사규 탐지 (MinHash / LSH)
+법인별로 거의 같은 본문을 조금씩 고쳐 쓴 사규를 찾기 위해
+사규 본문의 글자 shingle 집합에 대한 MinHash 서명을 저장 시 계산하고,
+서명을 BANDS개 구간으로 나눈 해시(RegulationMinHashBand)가 하나라도 같은 사규 쌍만 후보로 비교합니다.
+(전체 쌍 비교 없이 사규 수에 거의 비례하는 비용으로 후보를 찾음)
+
+- 두 사규의 Jaccard 유사도 추정값은 서명 값이 같은 비율입니다.
+- 구간당 서명 수 r = NUM_PERM / BANDS일 때 Jaccard s인 쌍이 후보가 될 확률은 1 - (1 - s^r)^BANDS 입니다.
+  (기본값 128/32: s=0.6에서 약 98%, s=0.3에서 약 23%)
+- NUM_PERM, BANDS, SHINGLE_SIZE를 바꾸면 find_duplicate_regulations --rebuild로 서명을 다시 계산해야 합니다.
+"""
+
+import re
+from collections import defaultdict
+
+import numpy as np
+
+from django.conf import settings
+from django.db import transaction
+
+
+DEFAULTS = {
+    # 서명 길이 (해시 함수 수)
+    'NUM_PERM': 128,
+    # LSH 구간 수 (NUM_PERM의 약수)
+    'BANDS': 32,
+    # shingle 글자 수
+    'SHINGLE_SIZE': 5,
+    # 보고서에 표시할 최소 Jaccard 유사도 추정값
+    'THRESHOLD': 0.8,
+    # 한 구간 해시에 이보다 많은 사규가 모이면 첫 사규와의 쌍만 후보로 비교
+    'MAX_BUCKET_SIZE': 50,
+}
+
+# 해시 함수 계수 난수 시드 (바꾸면 기존 서명과 비교할 수 없음)
+SEED = 20240101
+# 2^32보다 작은 가장 큰 소수 (32비트 값끼리 곱해도 64비트를 넘지 않음)
+PRIME = np.uint64(4294967291)
+# 메모리 사용량을 제한하기 위해 shingle을 나누어 처리하는 단위
+CHUNK_SIZE = 4096
+
+WHITESPACE = re.compile(r'\s+')
+
+
+def get_duplicate_settings():
+    """DUPLICATE_SETTINGS 설정값 반환 (미설정 항목은 기본값 사용)"""
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'DUPLICATE_SETTINGS', {}))
+    return config
+
+
+def _permutations(num_perm):
+    """해시 함수 h(x) = (a * x + b) mod PRIME의 계수 (a, b)"""
+    generator = np.random.default_rng(SEED)
+    a = generator.integers(1, int(PRIME), size=num_perm, dtype=np.uint64)
+    b = generator.integers(0, int(PRIME), size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def shingle_hashes(text, size):
+    """본문(공백 정리, 소문자)의 글자 shingle 해시 (PRIME 미만, 중복 제거)"""
+    text = WHITESPACE.sub(' ', text or '').strip().lower()
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    count = len(codes) - size + 1
+    if count <= 0:
+        return np.zeros(0, dtype=np.uint64)
+    value = np.zeros(count, dtype=np.uint64)
+    for offset in range(size):
+        value = value * np.uint64(1000003) + codes[offset:offset + count]
+    return np.unique((value ^ (value >> np.uint64(32))) % PRIME)
+
+
+def signature(text, num_perm, shingle_size):
+    """
+    MinHash 서명 (uint32 배열)
+    shingle이 없으면(본문이 shingle 길이보다 짧으면) None
+    """
+    shingles = shingle_hashes(text, shingle_size)
+    if not len(shingles):
+        return None
+    a, b = _permutations(num_perm)
+    minimum = np.full(num_perm, PRIME, dtype=np.uint64)
+    for start in range(0, len(shingles), CHUNK_SIZE):
+        chunk = shingles[start:start + CHUNK_SIZE, np.newaxis]
+        minimum = np.minimum(minimum, ((chunk * a + b) % PRIME).min(axis=0))
+    return minimum.astype(np.uint32)
+
+
+def band_hashes(values, bands):
+    """서명 구간별 해시 (BigIntegerField에 저장할 수 있는 부호 있는 64비트)"""
+    rows = values.reshape(bands, -1).astype(np.uint64)
+    hashed = np.zeros(bands, dtype=np.uint64)
+    for column in range(rows.shape[1]):
+        hashed = hashed * np.uint64(1000003) + rows[:, column]
+    return hashed.view(np.int64).tolist()
+
+
+def estimate_jaccard(left, right):
+    """두 서명의 Jaccard 유사도 추정값"""
+    return float(np.mean(left == right))
+
+
+def update_minhash(regulation, config=None):
+    """사규 본문의 MinHash 서명과 LSH 구간 해시 다시 계산"""
+    from .models import RegulationMinHash, RegulationMinHashBand
+
+    config = config or get_duplicate_settings()
+    values = signature(regulation.content, config['NUM_PERM'], config['SHINGLE_SIZE'])
+    with transaction.atomic():
+        RegulationMinHashBand.objects.filter(regulation=regulation).delete()
+        if values is None:
+            RegulationMinHash.objects.filter(regulation=regulation).delete()
+            return None
+        RegulationMinHash.objects.update_or_create(
+            regulation=regulation, defaults={'signature': values.tobytes()}
+        )
+        RegulationMinHashBand.objects.bulk_create([
+            RegulationMinHashBand(regulation=regulation, band=band, bucket=bucket)
+            for band, bucket in enumerate(band_hashes(values, config['BANDS']))
+        ])
+    return values
+
+
+def rebuild_minhashes():
+    """전체 사규의 MinHash 서명과 LSH 구간 해시 다시 계산 (일괄 저장)"""
+    from .models import Regulation, RegulationMinHash, RegulationMinHashBand
+
+    config = get_duplicate_settings()
+    signatures, bands = [], []
+    for pk, content in Regulation.objects.values_list('pk', 'content').iterator(chunk_size=100):
+        values = signature(content, config['NUM_PERM'], config['SHINGLE_SIZE'])
+        if values is None:
+            continue
+        signatures.append(RegulationMinHash(regulation_id=pk, signature=values.tobytes()))
+        bands.extend(
+            RegulationMinHashBand(regulation_id=pk, band=band, bucket=bucket)
+            for band, bucket in enumerate(band_hashes(values, config['BANDS']))
+        )
+    with transaction.atomic():
+        RegulationMinHashBand.objects.all().delete()
+        RegulationMinHash.objects.all().delete()
+        RegulationMinHash.objects.bulk_create(signatures, batch_size=500)
+        RegulationMinHashBand.objects.bulk_create(bands, batch_size=2000)
+    return len(signatures)
+
+
+def candidate_pairs(max_bucket_size):
+    """구간 해시가 같은 사규 쌍 (작은 ID, 큰 ID)"""
+    from .models import RegulationMinHashBand
+
+    buckets = defaultdict(list)
+    for band, bucket, regulation_id in RegulationMinHashBand.objects.values_list(
+        'band', 'bucket', 'regulation_id'
+    ).order_by('band', 'bucket', 'regulation_id').iterator(chunk_size=5000):
+        buckets[(band, bucket)].append(regulation_id)
+
+    pairs = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        if len(members) > max_bucket_size:
+            # 모두 같은 구간 해시이므로 첫 사규와만 비교해도 묶음은 같아짐
+            pairs.update((members[0], other) for other in members[1:])
+        else:
+            pairs.update(
+                (left, right)
+                for index, left in enumerate(members)
+                for right in members[index + 1:]
+            )
+    return pairs
+
+
+def find_clusters(threshold=None, regulation_ids=None):
+    """
+    유사 중복 사규 묶음
+    Args:
+        threshold: 최소 Jaccard 유사도 추정값 (기본값: DUPLICATE_SETTINGS['THRESHOLD'])
+        regulation_ids: 대상 사규 ID (None이면 전체)
+    Returns:
+        [{'ids': [사규 ID, ...], 'pairs': [(ID, ID, 추정값), ...], 'min_score', 'max_score'}, ...]
+        (사규 수, 최대 유사도 순)
+    """
+    from .models import RegulationMinHash
+
+    config = get_duplicate_settings()
+    threshold = config['THRESHOLD'] if threshold is None else threshold
+    pairs = candidate_pairs(config['MAX_BUCKET_SIZE'])
+    if regulation_ids is not None:
+        allowed = set(regulation_ids)
+        pairs = {pair for pair in pairs if pair[0] in allowed and pair[1] in allowed}
+
+    ids = {regulation_id for pair in pairs for regulation_id in pair}
+    signatures = {
+        regulation_id: np.frombuffer(bytes(value), dtype=np.uint32)
+        for regulation_id, value in RegulationMinHash.objects.filter(
+            regulation_id__in=ids
+        ).values_list('regulation_id', 'signature').iterator(chunk_size=1000)
+    }
+
+    # 추정값이 기준 이상인 쌍으로 묶음 만들기 (union-find)
+    parent = {}
+
+    def find(node):
+        parent.setdefault(node, node)
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    matched = []
+    for left, right in sorted(pairs):
+        if left not in signatures or right not in signatures:
+            continue
+        if len(signatures[left]) != len(signatures[right]):
+            continue
+        score = estimate_jaccard(signatures[left], signatures[right])
+        if score >= threshold:
+            matched.append((left, right, round(score, 3)))
+            parent[find(left)] = find(right)
+
+    clusters = defaultdict(lambda: {'ids': set(), 'pairs': []})
+    for left, right, score in matched:
+        cluster = clusters[find(left)]
+        cluster['ids'].update((left, right))
+        cluster['pairs'].append((left, right, score))
+
+    result = []
+    for cluster in clusters.values():
+        scores = [score for _, _, score in cluster['pairs']]
+        result.append({
+            'ids': sorted(cluster['ids']),
+            'pairs': sorted(cluster['pairs'], key=lambda pair: -pair[2]),
+            'min_score': min(scores),
+            'max_score': max(scores),
+        })
+    result.sort(key=lambda cluster: (-len(cluster['ids']), -cluster['max_score'], cluster['ids'][0]))
+    return result
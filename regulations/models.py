@@ -6,6 +6,13 @@ Regulation models for nCompliance
 import os
 from django.db import models
 from django.conf import settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.safestring import mark_safe
+
+from . import codes
+from .rendering import refresh_content_html
+from .storage import get_attachment_storage
 
 
 def regulation_file_path(instance, filename):
@@ -44,6 +51,12 @@ class RegulationQuerySet(models.QuerySet):
 
         return self.filter(access_filter).distinct()
 
+    def as_of(self, date):
+        """해당 일자에 시행 중이던 사규 (RegulationValidity 구간 조회)"""
+        return self.filter(
+            pk__in=RegulationValidity.objects.as_of(date).values("regulation_id")
+        )
+
 
 class Regulation(models.Model):
     """
@@ -158,13 +171,31 @@ class Regulation(models.Model):
     content = models.TextField(
         "규정 본문", blank=True, help_text="사규의 본문 내용"
     )
+    # 본문을 변환한 HTML (regulations.rendering), 해시가 본문과 맞지 않으면 다시 변환
+    content_html = models.TextField("본문 HTML", blank=True, editable=False)
+    content_html_hash = models.CharField(
+        "본문 HTML 해시", max_length=64, blank=True, editable=False
+    )
     original_file = models.FileField(
         "사규 원본 파일",
         upload_to="regulations/original/",
+        storage=get_attachment_storage,
         null=True,
         blank=True,
         help_text="사규 원본 파일 (PDF, Word, HWP 등)"
     )
+    original_file_name = models.CharField(
+        "원본 파일명", max_length=255, blank=True, editable=False
+    )
+    original_text = models.ForeignKey(
+        "ExtractedText",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        verbose_name="원본 파일 추출 텍스트",
+    )
 
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -184,6 +215,34 @@ class Regulation(models.Model):
     def __str__(self):
         return f"[{self.code}] {self.title}"
 
+    def save(self, *args, **kwargs):
+        # 저장소에는 해시 파일명으로 저장되므로 업로드한 파일명을 따로 보관
+        if self.original_file and not self.original_file._committed:
+            self.original_file_name = os.path.basename(self.original_file.name)
+        elif not self.original_file:
+            self.original_file_name = ""
+        # 본문이 바뀌었으면 HTML도 다시 변환 (본문을 불러오지 않은(defer) 경우 제외)
+        if "content" in self.__dict__ and refresh_content_html(self):
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "content_html", "content_html_hash"}
+        super().save(*args, **kwargs)
+
+    def get_content_html(self):
+        """
+        본문 HTML 반환
+        저장 후 본문이 바뀌었거나(QuerySet.update 등) 변환 규칙이 바뀐 경우 다시 변환하여 저장
+        """
+        if refresh_content_html(self):
+            Regulation.objects.filter(pk=self.pk).update(
+                content_html=self.content_html, content_html_hash=self.content_html_hash
+            )
+        return mark_safe(self.content_html)
+
+    def get_download_filename(self):
+        """원본 파일 다운로드 파일명"""
+        return self.original_file_name or os.path.basename(self.original_file.name)
+
     def get_category_display_class(self):
         """카테고리에 따른 Bootstrap badge 클래스 반환"""
         category_classes = {
@@ -194,9 +253,30 @@ class Regulation(models.Model):
         }
         return category_classes.get(self.category, 'bg-secondary text-white')
 
+    def get_category_display(self):
+        """분류 표시명 (공통코드 CATEGORY 우선)"""
+        return codes.get_label(
+            "CATEGORY", self.category, dict(self.CATEGORY_CHOICES).get(self.category, self.category)
+        )
+
     def get_latest_version(self):
-        """최신 버전 객체 반환"""
-        return self.versions.order_by("-created_at").first()
+        """최신 버전 객체 반환 (RegulationStats.latest_version, select_related("stats__latest_version") 권장)"""
+        stats = getattr(self, "stats", None)
+        if stats is None:
+            return self.versions.order_by("-created_at").first()
+        return stats.latest_version
+
+    def get_article(self, number, branch=None):
+        """본문 조문 반환 (제N조, 제N조의M / 부칙 조문 제외)"""
+        return self.articles.filter(
+            kind="ARTICLE", number=number, branch=branch, in_addenda=False
+        ).first()
+
+    def get_similar_regulations(self, user):
+        """사용자가 접근할 수 있는 유사 사규 (RegulationSimilarity, 유사도 높은 순)"""
+        return self.similarities.filter(
+            similar__in=Regulation.objects.accessible_to(user)
+        ).select_related("similar", "similar__responsible_dept").order_by("rank")
 
     def can_user_access(self, user):
         """사용자의 사규 접근 권한 확인"""
@@ -284,7 +364,20 @@ class RegulationVersion(models.Model):
     change_reason = models.TextField("변경사유")
     change_summary = models.TextField("변경내용요약", blank=True)
     content_file = models.FileField(
-        "첨부파일", upload_to=regulation_file_path, null=True, blank=True
+        "첨부파일",
+        upload_to=regulation_file_path,
+        storage=get_attachment_storage,
+        null=True,
+        blank=True,
+    )
+    content_text = models.ForeignKey(
+        "ExtractedText",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        verbose_name="첨부파일 추출 텍스트",
     )
 
     approved_by = models.ForeignKey(
@@ -315,6 +408,11 @@ class RegulationVersion(models.Model):
     def __str__(self):
         return f"{self.regulation.code} v{self.version_number}"
 
+    def get_download_filename(self):
+        """첨부파일 다운로드 파일명 (사규코드_v버전.확장자)"""
+        ext = os.path.splitext(self.content_file.name)[1]
+        return f"{self.regulation.code}_v{self.version_number}{ext}"
+
 
 class RegulationTag(models.Model):
     """
@@ -325,6 +423,8 @@ class RegulationTag(models.Model):
     regulations = models.ManyToManyField(
         Regulation, blank=True, related_name="tags", verbose_name="사규"
     )
+    # 태그가 지정된 사규 수 (regulations.tags에서 증감)
+    regulation_count = models.PositiveIntegerField("사규 수", default=0)
     created_at = models.DateTimeField("생성일", auto_now_add=True)
 
     class Meta:
@@ -362,7 +462,8 @@ class RegulationDownloadLog(models.Model):
         verbose_name="사용자",
     )
     ip_address = models.GenericIPAddressField("IP 주소", null=True, blank=True)
-    downloaded_at = models.DateTimeField("다운로드일시", auto_now_add=True)
+    # 감사 로그는 모아서 저장하므로 저장 시각이 아닌 발생 시각을 기록
+    downloaded_at = models.DateTimeField("다운로드일시", default=timezone.now)
 
     class Meta:
         verbose_name = "다운로드 로그"
@@ -373,6 +474,49 @@ class RegulationDownloadLog(models.Model):
         return f"{self.user} download {self.regulation} at {self.downloaded_at}"
 
 
+class RegulationViewLog(models.Model):
+    """
+    사규 조회 로그
+    사규 상세/본문 조회 감사 추적용
+    """
+
+    SOURCE_CHOICES = [
+        ("DETAIL", "사규 상세"),
+        ("CONTENT", "사규 본문"),
+    ]
+
+    regulation = models.ForeignKey(
+        Regulation,
+        on_delete=models.CASCADE,
+        related_name="view_logs",
+        verbose_name="사규",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="regulation_view_logs",
+        verbose_name="사용자",
+    )
+    source = models.CharField(
+        "조회 화면", max_length=10, choices=SOURCE_CHOICES, default="DETAIL"
+    )
+    ip_address = models.GenericIPAddressField("IP 주소", null=True, blank=True)
+    viewed_at = models.DateTimeField("조회일시", default=timezone.now)
+
+    class Meta:
+        verbose_name = "조회 로그"
+        verbose_name_plural = "조회 로그"
+        ordering = ["-viewed_at"]
+        indexes = [
+            models.Index(fields=["regulation", "viewed_at"], name="viewlog_regulation_idx"),
+            models.Index(fields=["viewed_at"], name="viewlog_viewed_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} view {self.regulation} at {self.viewed_at}"
+
+
 class Approval(models.Model):
     """
     결재 모델
@@ -574,14 +718,415 @@ class CommonCode(models.Model):
 
     @classmethod
     def get_codes(cls, code_type, active_only=True):
-        """특정 유형의 코드 목록 반환"""
-        queryset = cls.objects.filter(code_type=code_type)
-        if active_only:
-            queryset = queryset.filter(is_active=True)
-        return queryset.order_by("sort_order", "name")
+        """특정 유형의 코드 목록 반환 (regulations.codes 캐시 조회)"""
+        return codes.get_codes(code_type, active_only)
 
     @classmethod
     def get_choices(cls, code_type, active_only=True):
-        """특정 유형의 코드를 choices 형식으로 반환"""
-        codes = cls.get_codes(code_type, active_only)
-        return [(c.code, c.name) for c in codes]
+        """특정 유형의 코드를 choices 형식으로 반환 (regulations.codes 캐시 조회)"""
+        return codes.get_choices(code_type, active_only)
+
+
+class ExtractedText(models.Model):
+    """
+    첨부파일 추출 텍스트
+    파일 내용의 SHA-256 해시를 키로 저장하여 같은 파일은 한 번만 추출
+    """
+
+    STATUS_CHOICES = [
+        ("DONE", "추출완료"),
+        ("FAILED", "추출실패"),
+    ]
+
+    sha256 = models.CharField("파일 해시", max_length=64, unique=True)
+    file_type = models.CharField("파일 형식", max_length=10)
+    file_size = models.PositiveBigIntegerField("파일 크기", default=0)
+    status = models.CharField(
+        "상태", max_length=10, choices=STATUS_CHOICES, default="DONE"
+    )
+    text = models.TextField("추출 텍스트", blank=True)
+    char_count = models.PositiveIntegerField("글자 수", default=0)
+    error = models.TextField("오류 내용", blank=True)
+    created_at = models.DateTimeField("추출일시", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "추출 텍스트"
+        verbose_name_plural = "추출 텍스트"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.file_type}, {self.char_count}자)"
+
+
+class FileBlob(models.Model):
+    """
+    첨부파일 저장 파일
+    내용 주소 저장소(regulations.storage)에 저장된 파일과 참조 수
+    """
+
+    sha256 = models.CharField("파일 해시", max_length=64, db_index=True)
+    name = models.CharField("저장 경로", max_length=255, unique=True)
+    size = models.PositiveBigIntegerField("파일 크기", default=0)
+    ref_count = models.PositiveIntegerField("참조 수", default=0)
+    created_at = models.DateTimeField("저장일시", auto_now_add=True)
+    updated_at = models.DateTimeField("참조 변경일시", auto_now=True)
+
+    class Meta:
+        verbose_name = "첨부파일 저장 파일"
+        verbose_name_plural = "첨부파일 저장 파일"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["ref_count", "updated_at"], name="fileblob_gc_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} (참조 {self.ref_count})"
+
+
+class RegulationVersionBody(models.Model):
+    """
+    버전별 규정 본문
+    최신 버전만 전체 본문을 저장하고, 이전 버전은 다음 버전 본문에 대한 역방향 차이(delta)로 저장
+    (regulations.history)
+    """
+
+    STORAGE_CHOICES = [
+        ("FULL", "전체 본문"),
+        ("DELTA", "역방향 차이"),
+    ]
+
+    version = models.OneToOneField(
+        RegulationVersion,
+        on_delete=models.CASCADE,
+        related_name="body",
+        verbose_name="버전",
+    )
+    storage = models.CharField(
+        "저장 방식", max_length=10, choices=STORAGE_CHOICES, default="FULL"
+    )
+    # DELTA인 경우 차이를 적용할 기준 본문 (다음 버전)
+    base = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="dependents",
+        verbose_name="기준 본문",
+    )
+    data = models.TextField("본문 또는 차이", blank=True)
+    sha256 = models.CharField("본문 해시", max_length=64)
+    length = models.PositiveIntegerField("본문 글자 수", default=0)
+    created_at = models.DateTimeField("생성일", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "버전 본문"
+        verbose_name_plural = "버전 본문"
+
+    def __str__(self):
+        return f"{self.version} ({self.get_storage_display()}, {self.length}자)"
+
+
+class RegulationArticle(models.Model):
+    """
+    사규 조문
+    규정 본문(Regulation.content)을 장/절/조/항/호 단위로 나눈 색인 (regulations.articles)
+    본문 저장 시 다시 만들어지므로 직접 수정하지 않습니다.
+    """
+
+    KIND_CHOICES = [
+        ("PREAMBLE", "전문"),
+        ("CHAPTER", "장"),
+        ("SECTION", "절"),
+        ("ADDENDA", "부칙"),
+        ("ARTICLE", "조"),
+        ("PARAGRAPH", "항"),
+        ("ITEM", "호"),
+    ]
+
+    regulation = models.ForeignKey(
+        Regulation,
+        on_delete=models.CASCADE,
+        related_name="articles",
+        verbose_name="사규",
+    )
+    parent = models.ForeignKey(
+        "self",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="children",
+        verbose_name="상위 조문",
+    )
+    kind = models.CharField("구분", max_length=10, choices=KIND_CHOICES)
+    number = models.PositiveIntegerField("번호", null=True, blank=True)
+    # 제N조의M의 M (가지번호)
+    branch = models.PositiveIntegerField("가지번호", null=True, blank=True)
+    label = models.CharField("표시 번호", max_length=30)
+    title = models.CharField("제목", max_length=200, blank=True)
+    text = models.TextField("본문", blank=True)
+    anchor = models.CharField("앵커", max_length=50)
+    position = models.PositiveIntegerField("순서")
+    depth = models.PositiveSmallIntegerField("깊이", default=0)
+    in_addenda = models.BooleanField("부칙 여부", default=False)
+
+    class Meta:
+        verbose_name = "사규 조문"
+        verbose_name_plural = "사규 조문"
+        ordering = ["regulation", "position"]
+        indexes = [
+            models.Index(
+                fields=["regulation", "kind", "number", "branch"], name="article_number_idx"
+            ),
+            models.Index(fields=["regulation", "position"], name="article_position_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.regulation.code} {self.label} {self.title}".strip()
+
+    def get_absolute_url(self):
+        """본문 조문은 조문 화면, 그 밖의 조문은 사규 상세 화면의 해당 위치"""
+        if self.kind == "ARTICLE" and not self.in_addenda:
+            if self.branch:
+                return reverse(
+                    "regulations:article_branch_detail",
+                    args=[self.regulation_id, self.number, self.branch],
+                )
+            return reverse("regulations:article_detail", args=[self.regulation_id, self.number])
+        return reverse("regulations:detail", args=[self.regulation_id]) + f"#{self.anchor}"
+
+    @property
+    def heading(self):
+        """표시 제목 (예: 제12조(휴가))"""
+        return f"{self.label}({self.title})" if self.kind == "ARTICLE" and self.title \
+            else f"{self.label} {self.title}".strip()
+
+
+class RegulationReference(models.Model):
+    """
+    사규 간 인용
+    규정 본문에서 찾은 다른 사규 인용 (regulations.references)
+    본문 또는 사규 코드/사규명 변경 시 다시 만들어지므로 직접 수정하지 않습니다.
+    """
+
+    source = models.ForeignKey(
+        Regulation,
+        on_delete=models.CASCADE,
+        related_name="outgoing_references",
+        verbose_name="인용한 사규",
+    )
+    target = models.ForeignKey(
+        Regulation,
+        on_delete=models.CASCADE,
+        related_name="incoming_references",
+        verbose_name="인용된 사규",
+    )
+    # 인용이 나온 조문 (조문 밖이면 빈 값)
+    source_anchor = models.CharField("인용한 조문 앵커", max_length=50, blank=True)
+    source_label = models.CharField("인용한 조문", max_length=30, blank=True)
+    # 인용된 조문 (사규 전체를 인용한 경우 빈 값)
+    target_number = models.PositiveIntegerField("인용된 조번호", null=True, blank=True)
+    target_branch = models.PositiveIntegerField("인용된 가지번호", null=True, blank=True)
+    matched_text = models.CharField("인용 문구", max_length=200)
+    excerpt = models.CharField("인용 부분", max_length=200, blank=True)
+    occurrences = models.PositiveIntegerField("인용 횟수", default=1)
+    created_at = models.DateTimeField("생성일", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "사규 인용"
+        verbose_name_plural = "사규 인용"
+        ordering = ["source", "pk"]
+        indexes = [
+            models.Index(fields=["target", "target_number"], name="reference_target_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.source.code} {self.source_label} → {self.target.code} {self.target_label}".strip()
+
+    @property
+    def target_label(self):
+        """인용된 조문 표시 (예: 제5조의2)"""
+        if self.target_number is None:
+            return ""
+        return f"제{self.target_number}조" + (f"의{self.target_branch}" if self.target_branch else "")
+
+    def get_source_url(self):
+        """인용한 위치 (사규 상세 화면의 해당 조문)"""
+        url = reverse("regulations:detail", args=[self.source_id])
+        return f"{url}#{self.source_anchor}" if self.source_anchor else url
+
+    def get_target_url(self):
+        """인용된 위치 (사규 상세 화면의 해당 조문)"""
+        url = reverse("regulations:detail", args=[self.target_id])
+        if self.target_number is None:
+            return url
+        return f"{url}#art{self.target_number}" + (f"-{self.target_branch}" if self.target_branch else "")
+
+
+class RegulationSimilarity(models.Model):
+    """
+    유사 사규
+    사규명/설명/본문의 TF-IDF 유사도 상위 사규 (regulations.similarity)
+    주기 작업으로 다시 계산되므로 직접 수정하지 않습니다.
+    """
+
+    regulation = models.ForeignKey(
+        Regulation,
+        on_delete=models.CASCADE,
+        related_name="similarities",
+        verbose_name="사규",
+    )
+    similar = models.ForeignKey(
+        Regulation,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="유사 사규",
+    )
+    score = models.FloatField("유사도")
+    rank = models.PositiveSmallIntegerField("순위")
+    computed_at = models.DateTimeField("계산일")
+
+    class Meta:
+        verbose_name = "유사 사규"
+        verbose_name_plural = "유사 사규"
+        ordering = ["regulation", "rank"]
+        unique_together = ["regulation", "similar"]
+
+    def __str__(self):
+        return f"{self.regulation.code} ~ {self.similar.code} ({self.score:.2f})"
+
+
+class RegulationMinHash(models.Model):
+    """
+    사규 본문 MinHash 서명
+    유사 중복 사규 탐지용 (regulations.minhash), 본문 변경 시 다시 계산
+    """
+
+    regulation = models.OneToOneField(
+        Regulation,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="minhash",
+        verbose_name="사규",
+    )
+    # uint32 배열 (NUM_PERM개)
+    signature = models.BinaryField("서명")
+    updated_at = models.DateTimeField("계산일", auto_now=True)
+
+    class Meta:
+        verbose_name = "사규 MinHash 서명"
+        verbose_name_plural = "사규 MinHash 서명"
+
+    def __str__(self):
+        return f"{self.regulation_id} MinHash"
+
+
+class RegulationMinHashBand(models.Model):
+    """
+    MinHash 서명 구간 해시 (LSH)
+    같은 구간에서 해시가 같은 사규 쌍만 유사 중복 후보로 비교
+    """
+
+    regulation = models.ForeignKey(
+        Regulation,
+        on_delete=models.CASCADE,
+        related_name="minhash_bands",
+        verbose_name="사규",
+    )
+    band = models.PositiveSmallIntegerField("구간")
+    bucket = models.BigIntegerField("구간 해시")
+
+    class Meta:
+        verbose_name = "사규 MinHash 구간"
+        verbose_name_plural = "사규 MinHash 구간"
+        indexes = [
+            models.Index(fields=["band", "bucket"], name="minhash_band_bucket_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.regulation_id} [{self.band}] {self.bucket}"
+
+
+class RegulationValidityQuerySet(models.QuerySet):
+    """사규 시행 구간 쿼리셋"""
+
+    def as_of(self, date):
+        """해당 일자를 포함하는 구간 (사규별 최대 1건)"""
+        return self.filter(valid_from__lte=date).filter(
+            models.Q(valid_to__isnull=True) | models.Q(valid_to__gt=date)
+        )
+
+
+class RegulationValidity(models.Model):
+    """
+    사규 시행 구간
+    사규가 [valid_from, valid_to) 기간에 version으로 시행 중이었음을 나타냄 (regulations.validity)
+    버전 등록/삭제, 시행일/폐지일 변경 시 다시 만들어지므로 직접 수정하지 않습니다.
+    """
+
+    objects = RegulationValidityQuerySet.as_manager()
+
+    regulation = models.ForeignKey(
+        Regulation,
+        on_delete=models.CASCADE,
+        related_name="validity_intervals",
+        verbose_name="사규",
+    )
+    # 첫 버전 등록 전 기간은 빈 값
+    version = models.ForeignKey(
+        RegulationVersion,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="validity_intervals",
+        verbose_name="버전",
+    )
+    valid_from = models.DateField("시작일")
+    # 종료일 당일은 포함하지 않음 (빈 값이면 현재 시행 중)
+    valid_to = models.DateField("종료일", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "사규 시행 구간"
+        verbose_name_plural = "사규 시행 구간"
+        ordering = ["regulation", "valid_from"]
+        indexes = [
+            models.Index(fields=["valid_from", "valid_to"], name="validity_interval_idx"),
+            models.Index(fields=["regulation", "valid_from"], name="validity_regulation_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.regulation.code} {self.valid_from} ~ {self.valid_to or ''}"
+
+
+class RegulationStats(models.Model):
+    """
+    사규 집계값
+    최신 버전과 버전/즐겨찾기/다운로드/조회 수 (regulations.stats)
+    등록/삭제 시 증감되므로 직접 수정하지 않습니다. (어긋나면 repair_regulation_stats)
+    """
+
+    regulation = models.OneToOneField(
+        Regulation,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+        verbose_name="사규",
+    )
+    latest_version = models.ForeignKey(
+        RegulationVersion,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="최신 버전",
+    )
+    version_count = models.PositiveIntegerField("버전 수", default=0)
+    favorite_count = models.PositiveIntegerField("즐겨찾기 수", default=0)
+    download_count = models.PositiveIntegerField("다운로드 수", default=0)
+    view_count = models.PositiveIntegerField("조회 수", default=0)
+
+    class Meta:
+        verbose_name = "사규 집계"
+        verbose_name_plural = "사규 집계"
+
+    def __str__(self):
+        return f"{self.regulation_id} (버전 {self.version_count}, 조회 {self.view_count})"
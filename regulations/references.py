@@ -0,0 +1,271 @@
+"""
+사규 간 인용 색인
+규정 본문에서 다른 사규의 코드나 사규명을 찾아 인용 관계(RegulationReference)로 저장
+
+- 전체 사규의 코드/사규명으로 Aho-Corasick 오토마톤을 만들어 본문을 한 번만 훑어 모든 인용을 찾습니다.
+  (본문 길이에 비례하며 사규 수와 무관)
+- 겹치는 후보는 먼저 시작하고 긴 쪽을 택합니다. (예: "인사규정"과 "인사규정 시행세칙")
+- 인용 바로 뒤의 "제N조", "제N조의M"은 인용된 조문으로, 인용이 나온 조문은 인용한 조문으로 기록합니다.
+- 코드/사규명이 바뀌면 오토마톤 버전(프로세스 공용 캐시 CACHES['shared'])을 올려 모든 프로세스가 다시 만들도록 하고,
+  바뀐 사규를 인용할 수 있는 사규만 다시 분석합니다. (rescan_references_to)
+"""
+
+import re
+import uuid
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Q
+
+from .articles import parse_document
+
+
+# 이보다 짧은 사규명은 「」, 『』 안에 쓴 경우만 인용으로 봄 (예: "정관")
+MIN_TITLE_LENGTH = 4
+TITLE_BRACKETS = '「『'
+# 코드/사규명 앞에 오면 다른 단어의 일부로 보는 글자
+WORD_CHAR = re.compile(r'[0-9A-Za-z가-힣]')
+# 인용 뒤의 조문 번호 (예: 「인사규정」 제5조의2)
+TARGET_ARTICLE_PATTERN = re.compile(r'^[」』"\'>\s]*제\s*(\d+)\s*조(?:\s*의\s*(\d+))?')
+EXCERPT_LENGTH = 120
+
+PATTERN_CACHE_KEY = 'regulations:reference_patterns'
+
+
+class Automaton:
+    """Aho-Corasick 다중 문자열 검색 (영문은 대소문자 구분 없음)"""
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [[]]
+        # 출력이 있는 가장 가까운 실패 노드 (출력 목록을 복사하지 않고 따라감)
+        self.output_link = [0]
+
+    @staticmethod
+    def _fold(char):
+        lowered = char.lower()
+        return lowered if len(lowered) == 1 else char
+
+    def add(self, pattern, value):
+        node = 0
+        for char in pattern:
+            char = self._fold(char)
+            following = self.goto[node].get(char)
+            if following is None:
+                following = len(self.goto)
+                self.goto[node][char] = following
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+                self.output_link.append(0)
+            node = following
+        self.outputs[node].append((len(pattern), value))
+
+    def build(self):
+        """실패 링크 계산 (너비 우선)"""
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for char, following in self.goto[node].items():
+                queue.append(following)
+                state = self.fail[node]
+                while state and char not in self.goto[state]:
+                    state = self.fail[state]
+                target = self.goto[state].get(char, 0)
+                self.fail[following] = target
+                self.output_link[following] = target if self.outputs[target] else self.output_link[target]
+        return self
+
+    def search(self, text):
+        """(시작 위치, 끝 위치, 값) 목록 (겹치는 결과 포함)"""
+        matches = []
+        state = 0
+        for index, char in enumerate(text):
+            char = self._fold(char)
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            node = state
+            while node:
+                for length, value in self.outputs[node]:
+                    matches.append((index + 1 - length, index + 1, value))
+                node = self.output_link[node]
+        return matches
+
+
+_automaton = None
+_automaton_stamp = None
+
+
+def invalidate_patterns():
+    """사규 코드/사규명 변경 시 호출 (모든 프로세스의 오토마톤 다시 만들기)"""
+    caches['shared'].set(PATTERN_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def get_automaton(refresh=False):
+    """
+    코드/사규명 오토마톤 (버전이 바뀐 경우에만 다시 만듦)
+    버전 값은 모든 프로세스가 함께 보는 캐시(CACHES['shared'])에 저장
+    refresh=True이면 버전과 관계없이 다시 만듦
+    """
+    global _automaton, _automaton_stamp
+    from .models import Regulation
+
+    shared = caches['shared']
+    stamp = shared.get(PATTERN_CACHE_KEY)
+    if stamp is None:
+        shared.add(PATTERN_CACHE_KEY, uuid.uuid4().hex, None)
+        stamp = shared.get(PATTERN_CACHE_KEY)
+    if refresh or _automaton is None or stamp != _automaton_stamp:
+        automaton = Automaton()
+        for pk, code, title in Regulation.objects.values_list('pk', 'code', 'title').iterator():
+            if code:
+                automaton.add(code, (pk, 'code'))
+            title = (title or '').strip()
+            if title:
+                automaton.add(title, (pk, 'title'))
+        _automaton, _automaton_stamp = automaton.build(), stamp
+    return _automaton
+
+
+def _accept(line, start, end, kind, pattern_length):
+    """단어 경계 확인 (코드는 앞뒤, 사규명은 앞만 / 짧은 사규명은 괄호 안만)"""
+    before = line[start - 1] if start else ''
+    if kind == 'title' and pattern_length < MIN_TITLE_LENGTH:
+        return before in TITLE_BRACKETS
+    if before and WORD_CHAR.match(before):
+        return False
+    if kind == 'code' and end < len(line) and re.match(r'[0-9A-Za-z]', line[end]):
+        return False
+    return True
+
+
+def find_references(regulation_id, content, automaton=None):
+    """
+    본문에서 다른 사규 인용 찾기
+    Returns:
+        {(대상 사규 ID, 인용한 조문 앵커, 인용된 조번호, 가지번호):
+            {'label', 'matched_text', 'excerpt', 'occurrences'}}
+    """
+    automaton = automaton or get_automaton()
+    nodes, lines = parse_document(content)
+
+    # 줄마다 속한 조문 (조문 밖이면 None)
+    article_of = {}
+    for position, node in enumerate(nodes):
+        if node.kind == 'ARTICLE':
+            article_of[position] = node
+        elif node.parent is not None:
+            article_of[position] = article_of.get(node.parent)
+
+    references = {}
+    for index, line in lines:
+        candidates = sorted(
+            automaton.search(line), key=lambda match: (match[0], -(match[1] - match[0]))
+        )
+        covered = 0
+        for start, end, (target_id, kind) in candidates:
+            if start < covered or not _accept(line, start, end, kind, end - start):
+                continue
+            covered = end
+            # 자기 사규명(예: "인사규정 시행세칙" 안의 "인사규정")은 인용이 아님
+            if target_id == regulation_id:
+                continue
+
+            article = TARGET_ARTICLE_PATTERN.match(line[end:])
+            number = int(article.group(1)) if article else None
+            branch = int(article.group(2)) if article and article.group(2) else None
+            source = article_of.get(index)
+            key = (target_id, source.anchor if source else '', number, branch)
+            if key in references:
+                references[key]['occurrences'] += 1
+                continue
+            excerpt_start = max(0, start - EXCERPT_LENGTH // 3)
+            references[key] = {
+                'label': source.label if source else '',
+                'matched_text': line[start:end + (article.end() if article else 0)].strip()[:200],
+                'excerpt': line[excerpt_start:excerpt_start + EXCERPT_LENGTH],
+                'occurrences': 1,
+            }
+    return references
+
+
+def rebuild_references(regulation, automaton=None):
+    """사규 본문의 인용 관계 다시 저장"""
+    from .models import RegulationReference
+
+    references = find_references(regulation.pk, regulation.content, automaton)
+    with transaction.atomic():
+        RegulationReference.objects.filter(source=regulation).delete()
+        RegulationReference.objects.bulk_create(
+            [
+                RegulationReference(
+                    source=regulation,
+                    target_id=target_id,
+                    source_anchor=anchor,
+                    source_label=values['label'],
+                    target_number=number,
+                    target_branch=branch,
+                    matched_text=values['matched_text'],
+                    excerpt=values['excerpt'],
+                    occurrences=values['occurrences'],
+                )
+                for (target_id, anchor, number, branch), values in references.items()
+            ],
+            batch_size=500,
+        )
+    return len(references)
+
+
+def rescan_references_to(regulation_id, old_values=()):
+    """
+    코드/사규명이 바뀌거나 새로 등록된 사규를 인용할 수 있는 사규 다시 분석
+    (현재 코드/사규명 또는 이전 값을 본문에 포함하거나, 이미 이 사규를 인용 중인 사규)
+    """
+    from .models import Regulation, RegulationReference
+
+    regulation = Regulation.objects.filter(pk=regulation_id).only('code', 'title').first()
+    values = {value for value in old_values if value}
+    if regulation:
+        values.update(value for value in (regulation.code, regulation.title.strip()) if value)
+    if not values:
+        return 0
+
+    condition = Q(pk__in=RegulationReference.objects.filter(target_id=regulation_id).values('source'))
+    for value in values:
+        condition |= Q(content__icontains=value)
+
+    # 새/바뀐 코드·사규명이 반드시 포함되도록 다시 만든 오토마톤으로 분석
+    automaton = get_automaton(refresh=True)
+    count = 0
+    sources = Regulation.objects.filter(condition).exclude(pk=regulation_id).only('pk', 'content')
+    for source in sources.iterator(chunk_size=100):
+        rebuild_references(source, automaton)
+        count += 1
+    return count
+
+
+def cited_by(regulation, user, number=None, branch=None):
+    """
+    사규(number 지정 시 해당 조문)를 인용하는 인용 관계 (사용자가 볼 수 있는 사규만)
+    개정 전 영향 범위 확인용
+    """
+    from .models import Regulation
+
+    references = regulation.incoming_references.filter(
+        source__in=Regulation.objects.accessible_to(user)
+    )
+    if number is not None:
+        references = references.filter(target_number=number, target_branch=branch)
+    return references.select_related('source').order_by('source__category', 'source__code', 'pk')
+
+
+def cites(regulation, user):
+    """사규가 인용하는 인용 관계 (사용자가 볼 수 있는 사규만)"""
+    from .models import Regulation
+
+    return (
+        regulation.outgoing_references.filter(target__in=Regulation.objects.accessible_to(user))
+        .select_related('target')
+        .order_by('target__category', 'target__code', 'target_number', 'target_branch')
+    )
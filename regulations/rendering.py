@@ -0,0 +1,85 @@
+"""
+규정 본문 HTML 변환
+규정 본문(Regulation.content)을 조문 구조(regulations.articles)에 따라 HTML로 변환하여
+Regulation.content_html에 저장
+
+- 본문 저장 시 변환하고, 본문 해시(content_html_hash)가 맞지 않으면 조회 시 다시 변환합니다.
+  (QuerySet.update 등으로 본문만 바뀐 경우, 변환 규칙(RENDER_VERSION)이 바뀐 경우)
+- 장/절/부칙/조/항/호의 첫 줄에는 조문 색인(RegulationArticle)과 같은 앵커(id)를 붙입니다.
+"""
+
+import hashlib
+
+from django.utils.html import escape
+
+from .articles import parse_document
+from .hwp import ARTICLE_PATTERN
+
+
+# 변환 결과 형식이 바뀌면 올려서 저장된 HTML을 다시 만들도록 함
+RENDER_VERSION = 1
+
+# 노드 종류별 첫 줄 CSS 클래스
+LINE_CLASSES = {
+    'PREAMBLE': 'reg-preamble',
+    'CHAPTER': 'reg-heading reg-chapter',
+    'SECTION': 'reg-heading reg-section',
+    'ADDENDA': 'reg-heading reg-addenda',
+    'ARTICLE': 'reg-article',
+    'PARAGRAPH': 'reg-paragraph',
+    'ITEM': 'reg-item',
+}
+# 노드 종류별 이어지는 줄 CSS 클래스 (항/호는 들여쓰기 유지)
+CONTINUATION_CLASSES = {
+    'PARAGRAPH': 'reg-paragraph',
+    'ITEM': 'reg-item',
+}
+
+
+def content_hash(content):
+    """본문과 변환 규칙 버전의 해시"""
+    source = f"{RENDER_VERSION}:{content or ''}"
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def _article_line(line):
+    """조문 첫 줄의 "제N조(제목)" 부분 강조"""
+    match = ARTICLE_PATTERN.match(line)
+    if not match:
+        return escape(line)
+    heading = f"<strong>{escape(match.group(0).rstrip())}</strong>"
+    rest = line[match.end():].strip()
+    return f"{heading} {escape(rest)}" if rest else heading
+
+
+def render_content_html(content):
+    """규정 본문을 HTML로 변환"""
+    nodes, lines = parse_document(content)
+    started = set()
+    parts = []
+    for index, line in lines:
+        node = nodes[index]
+        if index in started:
+            classes = ' '.join(['reg-line', CONTINUATION_CLASSES.get(node.kind, '')]).rstrip()
+            parts.append(f'<p class="{classes}">{escape(line)}</p>')
+            continue
+        started.add(index)
+        text = _article_line(line) if node.kind == 'ARTICLE' else escape(line)
+        parts.append(
+            f'<p id="{node.anchor}" class="reg-line {LINE_CLASSES[node.kind]}">{text}</p>'
+        )
+    return '\n'.join(parts)
+
+
+def refresh_content_html(regulation):
+    """
+    저장된 HTML이 현재 본문과 맞지 않으면 다시 변환 (저장 전 호출)
+    Returns:
+        다시 변환했으면 True
+    """
+    digest = content_hash(regulation.content)
+    if regulation.content_html_hash == digest:
+        return False
+    regulation.content_html = render_content_html(regulation.content) if regulation.content else ''
+    regulation.content_html_hash = digest
+    return True
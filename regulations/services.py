@@ -0,0 +1,94 @@
+"""
+사규 서비스
+첨부파일 텍스트 추출 결과 저장 및 연결 로직
+"""
+
+from .extraction import ExtractionError, extract_text, file_sha256, get_file_type, is_supported
+from .models import ExtractedText, Regulation, RegulationVersion
+
+
+# 첨부파일 종류별 (모델, 파일 필드, 추출 텍스트 필드)
+ATTACHMENTS = {
+    'regulation': (Regulation, 'original_file', 'original_text'),
+    'version': (RegulationVersion, 'content_file', 'content_text'),
+}
+
+
+def save_extracted_text(sha256, file_type, file_size, text, error='', replace=False):
+    """
+    추출 결과 저장
+    같은 해시가 이미 있으면 기존 결과를 반환하고, replace=True이면 내용을 갱신
+    (행을 지우지 않으므로 같은 해시를 참조하는 다른 첨부파일의 연결은 유지)
+    """
+    values = {
+        'file_type': file_type,
+        'file_size': file_size,
+        'status': 'FAILED' if error else 'DONE',
+        'text': text or '',
+        'char_count': len(text or ''),
+        'error': error,
+    }
+    extracted, created = ExtractedText.objects.get_or_create(sha256=sha256, defaults=values)
+    if replace and not created:
+        for field, value in values.items():
+            setattr(extracted, field, value)
+        extracted.save(update_fields=list(values))
+    return extracted
+
+
+def link_extracted_text(kind, pk, extracted):
+    """
+    첨부파일과 추출 텍스트 연결
+    save()를 거치지 않고 UPDATE로 처리하여 수정일 갱신 등 부수 효과를 피함
+    """
+    model, _, text_field = ATTACHMENTS[kind]
+    model.objects.filter(pk=pk).update(**{text_field: extracted})
+
+
+def extract_attachment(kind, pk, force=False):
+    """
+    첨부파일 1건 텍스트 추출
+    파일 해시로 이미 추출한 결과가 있으면 재사용
+
+    Returns:
+        ExtractedText (첨부파일이 없거나 지원하지 않는 형식이면 None)
+    """
+    model, file_field, _ = ATTACHMENTS[kind]
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return None
+
+    field_file = getattr(instance, file_field)
+    if not field_file or not is_supported(field_file.name):
+        link_extracted_text(kind, pk, None)
+        return None
+
+    file_type = get_file_type(field_file.name)
+    with field_file.open('rb') as f:
+        sha256 = file_sha256(f)
+        extracted = ExtractedText.objects.filter(sha256=sha256).first()
+
+        if extracted is None or force:
+            text, error = '', ''
+            try:
+                text = extract_text(f, file_type)
+            except ExtractionError as e:
+                error = str(e)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+
+            extracted = save_extracted_text(
+                sha256, file_type, field_file.size, text, error, replace=force
+            )
+
+    link_extracted_text(kind, pk, extracted)
+    return extracted
+
+
+def queue_attachment_extraction(kind, instance):
+    """첨부파일 텍스트 추출 작업 적재 (첨부파일이 있는 경우)"""
+    from .tasks import extract_attachment_text
+
+    _, file_field, _ = ATTACHMENTS[kind]
+    if getattr(instance, file_field):
+        extract_attachment_text.delay(kind, instance.pk)
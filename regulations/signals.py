@@ -0,0 +1,228 @@
+"""
+사규 시그널
+- 첨부파일 변경/삭제 시 저장 파일(FileBlob) 참조 수 갱신
+- 버전 등록/삭제 시 버전별 규정 본문 이력 갱신
+- 규정 본문 변경 시 조문 색인과 인용 관계 갱신
+- 사규 코드/사규명 변경 시 다른 사규의 인용 관계 갱신
+- 버전 등록/삭제, 시행일/폐지일 변경 시 시행 구간 갱신
+- 버전/즐겨찾기 등록/삭제 시 사규 집계값(RegulationStats) 증감
+- 공통코드 저장/삭제 시 공통코드 캐시 갱신
+- 태그 연결 변경(M2M), 사규 삭제 시 태그별 사규 수 갱신
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save, pre_delete
+from django.db import transaction
+from django.dispatch import receiver
+
+from .articles import rebuild_articles
+from .codes import invalidate_codes
+from .history import detach_version_body, snapshot_version_body
+from .minhash import update_minhash
+from .references import invalidate_patterns, rebuild_references
+from .models import CommonCode, Favorite, Regulation, RegulationStats, RegulationTag, RegulationVersion
+from .stats import add_version, increment, refresh_versions
+from .storage import release_blob, retain_blob
+from .tags import refresh_counts
+from .validity import rebuild_validity, rebuild_validity_for
+
+
+# 모델별 첨부파일 필드
+ATTACHMENT_FIELDS = {
+    Regulation: 'original_file',
+    RegulationVersion: 'content_file',
+}
+
+
+def _file_name(instance):
+    field_file = getattr(instance, ATTACHMENT_FIELDS[type(instance)])
+    return field_file.name or ''
+
+
+@receiver(post_init, sender=Regulation)
+@receiver(post_init, sender=RegulationVersion)
+def remember_attachment(sender, instance, **kwargs):
+    """불러온 시점의 첨부파일 경로 기억 (저장 시 변경 여부 비교용)"""
+    instance._saved_attachment_name = _file_name(instance)
+
+
+@receiver(post_save, sender=Regulation)
+@receiver(post_save, sender=RegulationVersion)
+def update_attachment_refs(sender, instance, **kwargs):
+    """첨부파일이 바뀌면 새 파일 참조 수 증가, 이전 파일 참조 수 감소"""
+    name = _file_name(instance)
+    previous = getattr(instance, '_saved_attachment_name', '')
+    if name != previous:
+        retain_blob(name)
+        release_blob(previous)
+        instance._saved_attachment_name = name
+
+
+@receiver(post_delete, sender=Regulation)
+@receiver(post_delete, sender=RegulationVersion)
+def release_attachment(sender, instance, **kwargs):
+    """삭제된 사규/버전의 첨부파일 참조 수 감소"""
+    release_blob(getattr(instance, '_saved_attachment_name', ''))
+
+
+@receiver(post_save, sender=RegulationVersion)
+def snapshot_body(sender, instance, created, raw=False, **kwargs):
+    """새 버전 등록 시 현재 규정 본문 저장"""
+    if created and not raw:
+        snapshot_version_body(instance)
+
+
+@receiver(pre_delete, sender=RegulationVersion)
+def detach_body(sender, instance, **kwargs):
+    """버전 삭제 전 이 버전 본문을 기준으로 하는 이전 버전 본문을 다시 저장"""
+    detach_version_body(instance)
+
+
+@receiver(post_init, sender=Regulation)
+def remember_content(sender, instance, **kwargs):
+    """불러온 시점의 본문과 코드/사규명 기억 (불러오지 않은(defer) 필드는 None)"""
+    instance._saved_content = instance.__dict__.get('content')
+    instance._saved_names = (instance.__dict__.get('code'), instance.__dict__.get('title'))
+    instance._saved_dates = (instance.__dict__.get('effective_date'), instance.__dict__.get('abolished_date'))
+
+
+def _names_changed(instance):
+    """코드/사규명 변경 여부 (불러오지 않은 필드는 비교하지 않음)"""
+    return any(
+        field in instance.__dict__ and saved is not None and instance.__dict__[field] != saved
+        for field, saved in zip(('code', 'title'), instance._saved_names)
+    )
+
+
+@receiver(post_save, sender=Regulation)
+def update_content_index(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """
+    새 사규 등록 또는 본문 변경 시 조문 색인, 인용 관계, MinHash 서명 다시 만들기
+    코드/사규명 변경 시 이 사규를 인용할 수 있는 다른 사규의 인용 관계 다시 분석
+    """
+    if raw:
+        return
+    names_changed = created or _names_changed(instance)
+    if names_changed:
+        invalidate_patterns()
+
+    content_changed = 'content' in instance.__dict__ and (
+        update_fields is None or 'content' in update_fields
+    ) and (created or instance.content != instance._saved_content)
+    if content_changed:
+        rebuild_articles(instance)
+        rebuild_references(instance)
+        update_minhash(instance)
+        instance._saved_content = instance.content
+
+    if names_changed:
+        from .tasks import rescan_regulation_references
+
+        old_values = [] if created else [value for value in instance._saved_names if value]
+        rescan_regulation_references.delay(instance.pk, old_values)
+        instance._saved_names = (instance.__dict__.get('code'), instance.__dict__.get('title'))
+
+
+@receiver(post_delete, sender=Regulation)
+def forget_patterns(sender, instance, **kwargs):
+    """삭제된 사규의 코드/사규명을 인용 검색 대상에서 제외 (인용 관계는 함께 삭제됨)"""
+    invalidate_patterns()
+
+
+@receiver(post_save, sender=Regulation)
+def update_validity_from_dates(sender, instance, created, raw=False, **kwargs):
+    """새 사규 등록 또는 시행일/폐지일 변경 시 시행 구간 다시 만들기"""
+    if raw:
+        return
+    dates = (instance.__dict__.get('effective_date'), instance.__dict__.get('abolished_date'))
+    if created or dates != instance._saved_dates:
+        rebuild_validity(instance)
+        instance._saved_dates = dates
+
+
+@receiver(post_save, sender=RegulationVersion)
+def update_validity_from_version(sender, instance, raw=False, **kwargs):
+    """버전 등록/수정 시 시행 구간 다시 만들기"""
+    if not raw:
+        rebuild_validity_for(instance.regulation_id)
+
+
+@receiver(post_delete, sender=RegulationVersion)
+def update_validity_after_version_delete(sender, instance, **kwargs):
+    """
+    버전 삭제 후 시행 구간 다시 만들기
+    (사규 삭제로 함께 삭제되는 경우 사규가 삭제된 뒤 실행되도록 커밋 후 처리)
+    """
+    regulation_id = instance.regulation_id
+    transaction.on_commit(lambda: rebuild_validity_for(regulation_id))
+
+
+@receiver(post_save, sender=Regulation)
+def create_stats(sender, instance, created, raw=False, **kwargs):
+    """새 사규 등록 시 집계 행 생성"""
+    if created and not raw:
+        RegulationStats.objects.get_or_create(regulation_id=instance.pk)
+
+
+@receiver(post_save, sender=RegulationVersion)
+def count_version(sender, instance, created, raw=False, **kwargs):
+    """새 버전 등록 시 버전 수 증가, 최신 버전 갱신"""
+    if created and not raw:
+        add_version(instance)
+
+
+@receiver(post_delete, sender=RegulationVersion)
+def uncount_version(sender, instance, **kwargs):
+    """버전 삭제 후 버전 수와 최신 버전 다시 계산 (커밋 후 처리)"""
+    regulation_id = instance.regulation_id
+    transaction.on_commit(lambda: refresh_versions(regulation_id))
+
+
+@receiver(post_save, sender=Favorite)
+def count_favorite(sender, instance, created, raw=False, **kwargs):
+    """즐겨찾기 추가 시 즐겨찾기 수 증가"""
+    if created and not raw:
+        increment(instance.regulation_id, favorite_count=1)
+
+
+@receiver(post_delete, sender=Favorite)
+def uncount_favorite(sender, instance, **kwargs):
+    """즐겨찾기 해제 시 즐겨찾기 수 감소"""
+    increment(instance.regulation_id, favorite_count=-1)
+
+
+@receiver(post_save, sender=CommonCode)
+@receiver(post_delete, sender=CommonCode)
+def forget_codes(sender, **kwargs):
+    """공통코드 변경 시 모든 프로세스의 공통코드 캐시 다시 불러오기"""
+    invalidate_codes()
+
+
+@receiver(m2m_changed, sender=RegulationTag.regulations.through)
+def recount_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    M2M add/remove/clear(관리자 화면 등)로 태그 연결이 바뀐 경우 태그별 사규 수 다시 계산
+    (regulations.tags.sync_tags는 중간 테이블을 직접 바꾸고 사규 수를 증감하므로 호출되지 않음)
+    """
+    if action == 'pre_clear' and reverse:
+        instance._cleared_tag_ids = list(instance.tags.values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        if not reverse:
+            refresh_counts([instance.pk])
+        elif action == 'post_clear':
+            refresh_counts(getattr(instance, '_cleared_tag_ids', []))
+        else:
+            refresh_counts(pk_set)
+
+
+@receiver(pre_delete, sender=Regulation)
+def remember_tags(sender, instance, **kwargs):
+    """사규 삭제 전 태그 기억 (태그 연결은 함께 삭제됨)"""
+    instance._deleted_tag_ids = list(instance.tags.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Regulation)
+def uncount_tags(sender, instance, **kwargs):
+    """사규 삭제 후 태그별 사규 수 다시 계산 (커밋 후 처리)"""
+    tag_ids = getattr(instance, '_deleted_tag_ids', [])
+    if tag_ids:
+        transaction.on_commit(lambda: refresh_counts(tag_ids))
@@ -0,0 +1,302 @@
+"""
+유사 사규 추천
+사규명, 설명, 본문의 글자 n-gram TF-IDF 벡터로 사규별 유사 사규(코사인 유사도 상위 k건)를
+미리 계산하여 RegulationSimilarity에 저장 (화면에서는 저장된 결과만 조회)
+
+- 글자 n-gram은 해시(FEATURES 차원)로 벡터화하므로 어휘 사전 없이 사규별로 따로 계산할 수 있습니다.
+- 사규별 n-gram 빈도 행렬은 SIMILARITY_SETTINGS['MATRIX_PATH']에 저장하고,
+  다음 실행 시 그 뒤에 수정된 사규만 다시 벡터화합니다.
+- 증분 갱신 시 유사 사규를 다시 계산하는 대상은 바뀐(등록/수정/삭제) 사규와,
+  바뀐 사규가 상위 k건에 새로 들어오거나 이미 상위 k건에 있던 사규뿐입니다.
+  (IDF는 매번 전체로 다시 계산하므로 바뀌지 않은 사규 쌍의 점수는 전체 재계산(rebuild) 때 갱신)
+- 유사도는 BATCH_SIZE개 사규씩 희소 행렬 곱으로 계산합니다.
+"""
+
+import os
+import re
+
+import numpy as np
+from scipy import sparse
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+
+DEFAULTS = {
+    # 사규별 저장할 유사 사규 수
+    'TOP_K': 10,
+    # 이보다 낮은 유사도는 저장하지 않음
+    'MIN_SCORE': 0.3,
+    # 글자 n-gram 길이
+    'NGRAM_SIZES': [2, 3],
+    # 해시 벡터 차원 수
+    'FEATURES': 2 ** 20,
+    # 전체 사규의 이 비율을 넘는 사규에 나오는 n-gram은 제외 (사규가 MAX_DF_MIN_DOCUMENTS건 미만이면 미적용)
+    'MAX_DF': 0.5,
+    # 사규명 가중치 (사규명을 반복하는 횟수)
+    'TITLE_WEIGHT': 3,
+    # 한 번에 유사도를 계산할 사규 수 (메모리 사용량: BATCH_SIZE x 전체 사규 수 x 8바이트)
+    'BATCH_SIZE': 256,
+    # 바뀐 사규가 이 비율을 넘으면 증분 갱신 대신 전체 재계산
+    'REBUILD_RATIO': 0.2,
+    'MATRIX_PATH': os.path.join(settings.BASE_DIR, 'var', 'similarity.npz'),
+}
+
+MAX_DF_MIN_DOCUMENTS = 100
+
+WHITESPACE = re.compile(r'\s+')
+
+
+def get_similarity_settings():
+    """SIMILARITY_SETTINGS 설정값 반환 (미설정 항목은 기본값 사용)"""
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'SIMILARITY_SETTINGS', {}))
+    return config
+
+
+def document_text(title, description, content, title_weight=1):
+    """벡터화할 문서 (소문자, 공백 정리)"""
+    parts = [title or ''] * title_weight + [description or '', content or '']
+    return WHITESPACE.sub(' ', ' '.join(parts)).strip().lower()
+
+
+def vectorize(texts, ngram_sizes, features):
+    """문서별 글자 n-gram 해시 빈도 (CSR, 문서 x features)"""
+    data, indices, indptr = [], [], [0]
+    for text in texts:
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        hashes = []
+        for size in ngram_sizes:
+            count = len(codes) - size + 1
+            if count <= 0:
+                continue
+            value = np.zeros(count, dtype=np.uint64)
+            for offset in range(size):
+                value = value * np.uint64(1000003) + codes[offset:offset + count]
+            hashes.append(value * np.uint64(size))
+        if hashes:
+            columns, counts = np.unique(
+                np.concatenate(hashes) % np.uint64(features), return_counts=True
+            )
+            indices.append(columns.astype(np.int32))
+            data.append(counts.astype(np.float32))
+            indptr.append(indptr[-1] + len(columns))
+        else:
+            indptr.append(indptr[-1])
+    return sparse.csr_matrix(
+        (
+            np.concatenate(data) if data else np.zeros(0, dtype=np.float32),
+            np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32),
+            np.array(indptr, dtype=np.int64),
+        ),
+        shape=(len(texts), features),
+    )
+
+
+def tfidf(counts, max_df=1.0):
+    """빈도 행렬을 TF-IDF(로그 빈도, 행 단위 L2 정규화)로 변환"""
+    matrix = counts.tocsr(copy=True)
+    matrix.data = 1 + np.log(matrix.data)
+    documents = matrix.shape[0]
+    document_frequency = np.bincount(matrix.indices, minlength=matrix.shape[1])
+    idf = np.log((1 + documents) / (1 + document_frequency)) + 1
+    if documents >= MAX_DF_MIN_DOCUMENTS:
+        # 대부분의 사규에 나오는 n-gram은 변별력이 없고 유사도 계산량만 늘리므로 제외
+        idf[document_frequency > max_df * documents] = 0
+    matrix.data *= idf[matrix.indices].astype(np.float32)
+    matrix.eliminate_zeros()
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms).dot(matrix).tocsr()
+
+
+def top_neighbours(matrix, rows, top_k, min_score, batch_size):
+    """
+    행별 코사인 유사도 상위 k건
+    Returns:
+        {행 번호: [(열 번호, 유사도), ...]} (유사도 높은 순)
+    """
+    transposed = matrix.T.tocsc()
+    result = {}
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        scores = (matrix[batch] @ transposed).toarray()
+        scores[np.arange(len(batch)), batch] = 0
+        k = min(top_k, scores.shape[1] - 1)
+        if k <= 0:
+            result.update((row, []) for row in batch)
+            continue
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for position, row in enumerate(batch):
+            columns = candidates[position]
+            values = scores[position, columns]
+            order = np.argsort(-values, kind='stable')
+            result[row] = [
+                (int(columns[i]), float(values[i])) for i in order if values[i] >= min_score
+            ]
+    return result
+
+
+class _Store:
+    """
+    사규별 n-gram 빈도 행렬과 유사 사규 목록 파일
+    (neighbours/scores: 행별 유사 사규 ID/유사도, 빈 칸은 -1/0)
+    """
+
+    def __init__(self, path, top_k, features):
+        self.path = path
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.counts = sparse.csr_matrix((0, features), dtype=np.float32)
+        self.neighbours = np.full((0, top_k), -1, dtype=np.int64)
+        self.scores = np.zeros((0, top_k), dtype=np.float32)
+        self.built_at = None
+
+    def load(self):
+        """저장된 파일 불러오기 (없거나 설정이 바뀌었으면 False)"""
+        if not os.path.exists(self.path):
+            return False
+        with np.load(self.path, allow_pickle=False) as archive:
+            shape = tuple(archive['shape'])
+            if shape[1] != self.counts.shape[1] or archive['neighbours'].shape[1] != self.neighbours.shape[1]:
+                return False
+            self.ids = archive['ids']
+            self.counts = sparse.csr_matrix(
+                (archive['data'], archive['indices'], archive['indptr']), shape=shape
+            )
+            self.neighbours = archive['neighbours']
+            self.scores = archive['scores']
+            self.built_at = parse_datetime(str(archive['built_at']))
+        return True
+
+    def save(self, built_at):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temporary = f"{self.path}.tmp.npz"
+        np.savez(
+            temporary,
+            ids=self.ids,
+            data=self.counts.data,
+            indices=self.counts.indices,
+            indptr=self.counts.indptr,
+            shape=np.array(self.counts.shape),
+            neighbours=self.neighbours,
+            scores=self.scores,
+            built_at=np.array(built_at.isoformat()),
+        )
+        os.replace(temporary, self.path)
+
+    def replace_rows(self, keep, ids, counts):
+        """keep 행만 남기고 새 행(ids, counts) 추가"""
+        rows = np.flatnonzero(keep)
+        self.ids = np.concatenate([self.ids[rows], np.asarray(ids, dtype=np.int64)])
+        self.counts = sparse.vstack([self.counts[rows], counts]).tocsr()
+        blank = len(ids), self.neighbours.shape[1]
+        self.neighbours = np.concatenate([self.neighbours[rows], np.full(blank, -1, dtype=np.int64)])
+        self.scores = np.concatenate([self.scores[rows], np.zeros(blank, dtype=np.float32)])
+
+
+def _affected_rows(store, matrix, changed_rows, removed_ids, min_score):
+    """바뀐 사규 때문에 상위 k건이 달라질 수 있는 (바뀌지 않은) 행"""
+    changed_ids = store.ids[changed_rows]
+    # 상위 k건에 바뀐/삭제된 사규가 있는 행
+    affected = np.isin(store.neighbours, np.concatenate([changed_ids, removed_ids])).any(axis=1)
+    if len(changed_rows):
+        # 바뀐 사규와의 유사도가 현재 k번째 유사도(빈 칸이 있으면 MIN_SCORE) 이상인 행
+        best = (matrix[changed_rows] @ matrix.T.tocsc()).max(axis=0).toarray().ravel()
+        threshold = np.where(store.neighbours[:, -1] >= 0, store.scores[:, -1], min_score)
+        affected |= best >= threshold
+    affected[changed_rows] = False
+    return np.flatnonzero(affected).tolist()
+
+
+def _save_neighbours(store, neighbours):
+    """행별 유사 사규 저장 (대상 행의 기존 결과는 교체)"""
+    from .models import RegulationSimilarity
+
+    computed_at = timezone.now()
+    rows = list(neighbours)
+    for row in rows:
+        store.neighbours[row] = -1
+        store.scores[row] = 0
+        for rank, (column, score) in enumerate(neighbours[row]):
+            store.neighbours[row, rank] = store.ids[column]
+            store.scores[row, rank] = score
+
+    with transaction.atomic():
+        for start in range(0, len(rows), 500):
+            chunk = rows[start:start + 500]
+            RegulationSimilarity.objects.filter(
+                regulation_id__in=store.ids[chunk].tolist()
+            ).delete()
+            RegulationSimilarity.objects.bulk_create(
+                [
+                    RegulationSimilarity(
+                        regulation_id=int(store.ids[row]),
+                        similar_id=int(store.ids[column]),
+                        score=round(score, 4),
+                        rank=rank,
+                        computed_at=computed_at,
+                    )
+                    for row in chunk
+                    for rank, (column, score) in enumerate(neighbours[row], start=1)
+                ],
+                batch_size=1000,
+            )
+    return sum(len(neighbours[row]) for row in rows)
+
+
+def update_similarities(rebuild=False):
+    """
+    유사 사규 갱신 (rebuild=True이면 전체 재계산)
+    Returns:
+        {'vectorized': 다시 벡터화한 사규 수, 'recomputed': 유사 사규를 다시 계산한 사규 수, 'pairs': 저장한 건수}
+    """
+    from .models import Regulation, RegulationSimilarity
+
+    config = get_similarity_settings()
+    started_at = timezone.now()
+    store = _Store(config['MATRIX_PATH'], config['TOP_K'], config['FEATURES'])
+    if not rebuild and not store.load():
+        rebuild = True
+
+    # 삭제된 사규는 빼고, 새로 등록/수정된 사규는 다시 벡터화
+    current_ids = np.array(Regulation.objects.values_list('pk', flat=True), dtype=np.int64)
+    if rebuild:
+        changed_ids = current_ids
+    else:
+        modified = Regulation.objects.filter(updated_at__gte=store.built_at).values_list('pk', flat=True)
+        changed_ids = np.union1d(
+            np.array(modified, dtype=np.int64), np.setdiff1d(current_ids, store.ids)
+        )
+    removed_ids = np.setdiff1d(store.ids, current_ids)
+    keep = ~np.isin(store.ids, np.concatenate([changed_ids, removed_ids]))
+
+    new_ids, texts = [], []
+    queryset = Regulation.objects.filter(pk__in=changed_ids.tolist()).order_by('pk')
+    for pk, title, description, content in queryset.values_list(
+        'pk', 'title', 'description', 'content'
+    ).iterator():
+        new_ids.append(pk)
+        texts.append(document_text(title, description, content, config['TITLE_WEIGHT']))
+    store.replace_rows(keep, new_ids, vectorize(texts, config['NGRAM_SIZES'], config['FEATURES']))
+    matrix = tfidf(store.counts, config['MAX_DF'])
+
+    total = len(store.ids)
+    changed_rows = list(range(total - len(new_ids), total))
+    if rebuild or len(changed_rows) > total * config['REBUILD_RATIO']:
+        rows = list(range(total))
+        RegulationSimilarity.objects.exclude(regulation_id__in=store.ids.tolist()).delete()
+    elif changed_rows or len(removed_ids):
+        rows = changed_rows + _affected_rows(
+            store, matrix, changed_rows, removed_ids, config['MIN_SCORE']
+        )
+    else:
+        rows = []
+
+    neighbours = top_neighbours(
+        matrix, rows, config['TOP_K'], config['MIN_SCORE'], config['BATCH_SIZE']
+    )
+    pairs = _save_neighbours(store, neighbours)
+    store.save(started_at)
+    return {'vectorized': len(new_ids), 'recomputed': len(rows), 'pairs': pairs}
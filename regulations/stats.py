@@ -0,0 +1,176 @@
+"""
+사규 집계값 (RegulationStats)
+최신 버전, 버전 수, 즐겨찾기 수, 다운로드 수, 조회 수를 사규별로 저장하여
+목록/관리자 화면에서 건수를 매번 세지 않고 표시
+
+- 버전/즐겨찾기: 등록/삭제 시그널에서 F() 식으로 증감 (동시 요청에도 누락 없음)
+- 다운로드/조회: 감사 로그 일괄 저장(regulations.audit.save_events) 시 사규별 건수를 모아 UPDATE 한 번으로 증가
+- 사규(Regulation)와 별도 테이블이므로 화면에서 불러온 사규를 저장해도 집계값을 덮어쓰지 않음
+- 집계 행이 없는 사규는 처음 증가할 때 원본 데이터에서 계산한 값으로 만듦 (0부터 세지 않음)
+- 값이 어긋나면 repair_regulation_stats 명령어로 원본 데이터에서 다시 계산
+  (삭제된 다운로드/조회 로그는 이용 현황 일별 집계(reports.DailyRegulationUsage)로 보충)
+"""
+
+from django.db import transaction
+from django.db.models import Case, Count, F, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Greatest
+
+
+COUNT_FIELDS = ['version_count', 'favorite_count', 'download_count', 'view_count']
+
+
+def increment(regulation_id, **changes):
+    """
+    집계값 증감 (예: increment(1, favorite_count=1))
+    집계 행이 없으면 원본 데이터에서 다시 계산하여 만들고 (이번 변경도 반영됨),
+    감소(삭제 이벤트)일 때는 만들지 않음 (사규 삭제 중 연쇄 삭제일 수 있음)
+    """
+    from .models import RegulationStats
+
+    # 값이 어긋나 있어도 음수로 내려가지 않도록 0에서 멈춤
+    values = {field: Greatest(F(field) + amount, Value(0)) for field, amount in changes.items()}
+    if RegulationStats.objects.filter(regulation_id=regulation_id).update(**values):
+        return
+    if any(amount > 0 for amount in changes.values()):
+        repair_stats([regulation_id])
+
+
+def add_version(version):
+    """새 버전 등록: 버전 수 증가, 최신 버전 갱신 (집계 행이 없으면 버전 목록에서 계산)"""
+    from .models import RegulationStats
+
+    if not RegulationStats.objects.filter(regulation_id=version.regulation_id).update(
+        version_count=F('version_count') + 1, latest_version=version
+    ):
+        repair_stats([version.regulation_id])
+
+
+def refresh_versions(regulation_id):
+    """버전 수와 최신 버전을 버전 목록에서 다시 계산 (버전 삭제 시)"""
+    from .models import RegulationStats, RegulationVersion
+
+    versions = RegulationVersion.objects.filter(regulation_id=regulation_id)
+    latest = versions.order_by('-created_at', '-pk').values_list('pk', flat=True).first()
+    RegulationStats.objects.filter(regulation_id=regulation_id).update(
+        version_count=versions.count(), latest_version_id=latest
+    )
+
+
+def add_usage(**counts):
+    """
+    다운로드/조회 수 일괄 증가 (로그 저장 후 같은 트랜잭션에서 호출)
+    예: add_usage(download_count={사규 ID: 증가 건수}, view_count={...})
+
+    집계 행이 없는 사규는 저장된 로그까지 포함하여 원본 데이터에서 계산하므로 증가 대상에서 제외
+    """
+    from .models import RegulationStats
+
+    regulation_ids = {pk for field_counts in counts.values() for pk in field_counts}
+    if not regulation_ids:
+        return
+    existing = set(RegulationStats.objects.filter(
+        regulation_id__in=regulation_ids
+    ).values_list('regulation_id', flat=True))
+    if len(existing) < len(regulation_ids):
+        repair_stats(regulation_ids - existing)
+
+    for field, field_counts in counts.items():
+        field_counts = {pk: count for pk, count in field_counts.items() if pk in existing}
+        if not field_counts:
+            continue
+        RegulationStats.objects.filter(regulation_id__in=list(field_counts)).update(**{
+            field: F(field) + Case(
+                *[When(regulation_id=regulation_id, then=Value(count))
+                  for regulation_id, count in field_counts.items()],
+                default=Value(0),
+            )
+        })
+
+
+def _usage_counts(name, model, field, regulation_ids=None):
+    """
+    사규별 다운로드/조회 건수
+    원본 로그가 삭제된 일자는 이용 현황 일별 집계로 계산
+    """
+    from reports.models import DailyRegulationUsage, RollupWatermark
+
+    watermark = RollupWatermark.objects.filter(name=name).first()
+    pruned_before = watermark.pruned_before if watermark else None
+
+    logs = model.objects.all()
+    if regulation_ids is not None:
+        logs = logs.filter(regulation_id__in=regulation_ids)
+    counts = {}
+    if pruned_before:
+        # 삭제 기준일 이전 로그는 집계에 반영되지 않은 것만 원본으로 계산
+        logs = logs.exclude(**{f'{field}__date__lt': pruned_before, 'pk__lte': watermark.last_id})
+        daily = DailyRegulationUsage.objects.filter(date__lt=pruned_before)
+        if regulation_ids is not None:
+            daily = daily.filter(regulation_id__in=regulation_ids)
+        for regulation_id, total in daily.values_list('regulation_id').annotate(total=Sum(f'{name}_count')).order_by():
+            counts[regulation_id] = total or 0
+    for regulation_id, total in logs.values_list('regulation_id').annotate(
+        total=Count('pk')
+    ).order_by():
+        counts[regulation_id] = counts.get(regulation_id, 0) + total
+    return counts
+
+
+def repair_stats(regulation_ids=None):
+    """
+    집계값을 원본 데이터에서 다시 계산
+    Returns:
+        값이 바뀐 사규 수
+    """
+    from .models import (
+        Favorite, Regulation, RegulationDownloadLog, RegulationStats, RegulationVersion,
+        RegulationViewLog,
+    )
+
+    regulations = Regulation.objects.all()
+    favorites = Favorite.objects.all()
+    if regulation_ids is not None:
+        regulation_ids = list(regulation_ids)
+        regulations = regulations.filter(pk__in=regulation_ids)
+        favorites = favorites.filter(regulation_id__in=regulation_ids)
+    latest = RegulationVersion.objects.filter(
+        regulation=OuterRef('pk')
+    ).order_by('-created_at', '-pk').values('pk')[:1]
+    rows = regulations.annotate(
+        latest_version_id=Subquery(latest),
+        version_count=Count('versions', distinct=True),
+    ).values_list('pk', 'latest_version_id', 'version_count')
+
+    favorites = dict(
+        favorites.values_list('regulation_id').annotate(total=Count('pk')).order_by()
+    )
+    downloads = _usage_counts('download', RegulationDownloadLog, 'downloaded_at', regulation_ids)
+    views = _usage_counts('view', RegulationViewLog, 'viewed_at', regulation_ids)
+
+    existing = RegulationStats.objects.in_bulk(
+        None if regulation_ids is None else list(regulation_ids)
+    )
+    changed, created = [], []
+    for pk, latest_version_id, version_count in rows:
+        values = {
+            'latest_version_id': latest_version_id,
+            'version_count': version_count,
+            'favorite_count': favorites.get(pk, 0),
+            'download_count': downloads.get(pk, 0),
+            'view_count': views.get(pk, 0),
+        }
+        stats = existing.get(pk)
+        if stats is None:
+            created.append(RegulationStats(regulation_id=pk, **values))
+        elif any(getattr(stats, name) != value for name, value in values.items()):
+            for name, value in values.items():
+                setattr(stats, name, value)
+            changed.append(stats)
+
+    with transaction.atomic():
+        # 동시에 같은 사규의 집계 행을 만드는 경우 먼저 만든 행을 유지
+        RegulationStats.objects.bulk_create(created, batch_size=500, ignore_conflicts=True)
+        RegulationStats.objects.bulk_update(
+            changed, ['latest_version', *COUNT_FIELDS], batch_size=500
+        )
+    return len(created) + len(changed)
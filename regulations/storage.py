@@ -0,0 +1,114 @@
+"""
+첨부파일 저장소
+파일 내용의 SHA-256 해시를 파일명으로 저장하여 같은 내용의 파일은 한 번만 저장 (내용 주소 저장소)
+
+- 저장 경로: blobs/<해시 앞 2자리>/<해시 3~4자리>/<해시>.<확장자>
+- 업로드 파일은 임시 파일에 쓰면서 해시를 계산하고, 같은 해시의 파일이 이미 있으면 임시 파일만 지움
+- 저장된 파일(blob)별 참조 수는 FileBlob 테이블에서 관리하고 (regulations.signals),
+  참조가 없는 파일은 gc_attachment_blobs 명령어로 삭제
+"""
+
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage, storages
+from django.db.models import F
+from django.utils import timezone
+
+
+BLOB_PREFIX = 'blobs'
+
+
+def blob_name(sha256, ext=''):
+    """해시에 해당하는 저장 경로"""
+    return '/'.join([BLOB_PREFIX, sha256[:2], sha256[2:4], f"{sha256}{ext}"])
+
+
+def is_blob_name(name):
+    """내용 주소 저장소에 저장된 파일명인지 여부"""
+    return bool(name) and name.startswith(f"{BLOB_PREFIX}/")
+
+
+def get_attachment_storage():
+    """첨부파일 저장소 (settings.STORAGES['attachments'])"""
+    return storages['attachments']
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """SHA-256 해시를 파일명으로 저장하는 파일 시스템 저장소"""
+
+    def get_available_name(self, name, max_length=None):
+        # 실제 저장 경로는 _save()에서 해시로 정하므로 업로드 파일명 중복 확인은 하지 않음
+        return name
+
+    def _save(self, name, content):
+        ext = os.path.splitext(name)[1].lower()
+        temp_dir = self.path(os.path.join(BLOB_PREFIX, 'tmp'))
+        os.makedirs(temp_dir, exist_ok=True)
+
+        # 임시 파일에 쓰면서 해시 계산 (파일을 한 번만 읽음)
+        digest = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=temp_dir, prefix='upload-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+
+            sha256 = digest.hexdigest()
+            name = blob_name(sha256, ext)
+            full_path = self.path(name)
+            if os.path.exists(full_path):
+                # 같은 내용의 파일이 이미 저장되어 있음
+                os.remove(temp_path)
+            else:
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(temp_path, self.file_permissions_mode)
+                # 같은 디렉터리 안의 이동이므로 동시에 같은 파일이 올라와도 내용이 깨지지 않음
+                os.replace(temp_path, full_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        register_blob(name, sha256, size)
+        return name
+
+
+def register_blob(name, sha256, size):
+    """저장한 파일을 FileBlob 테이블에 등록 (참조 수는 모델 저장 시 증가)"""
+    from .models import FileBlob
+
+    blob, created = FileBlob.objects.get_or_create(
+        name=name, defaults={'sha256': sha256, 'size': size}
+    )
+    if not created:
+        # 참조가 없어 삭제 대기 중이던 파일이 다시 올라오면 GC 유예 시간을 새로 시작
+        FileBlob.objects.filter(pk=blob.pk).update(updated_at=timezone.now())
+    return blob
+
+
+def retain_blob(name):
+    """파일 참조 수 증가"""
+    from .models import FileBlob
+
+    if is_blob_name(name):
+        FileBlob.objects.filter(name=name).update(
+            ref_count=F('ref_count') + 1, updated_at=timezone.now()
+        )
+
+
+def release_blob(name):
+    """파일 참조 수 감소 (0이 되면 gc_attachment_blobs 삭제 대상)"""
+    from .models import FileBlob
+
+    if is_blob_name(name):
+        FileBlob.objects.filter(name=name, ref_count__gt=0).update(
+            ref_count=F('ref_count') - 1, updated_at=timezone.now()
+        )
@@ -0,0 +1,148 @@
+"""
+사규 태그 동기화
+사규의 태그를 지정한 목록과 비교하여 바뀐 태그만 중간 테이블에 일괄 추가/삭제하고,
+태그별 사규 수(RegulationTag.regulation_count)를 증감합니다.
+
+- 없는 태그는 bulk_create(ignore_conflicts=True)로 한 번에 생성 (동시 생성 시에도 중복 없음)
+- 태그가 바뀌지 않으면 중간 테이블을 건드리지 않음
+- 관리자 화면 등 M2M add/remove/clear로 바뀐 경우는 시그널(regulations.signals)에서 사규 수를 다시 계산
+- 값이 어긋나면 repair_regulation_stats 명령어로 다시 계산
+"""
+
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+
+def parse_tags(text):
+    """콤마로 구분한 태그 문자열 → 태그명 목록 (입력 순서 유지, 중복 제거)"""
+    return normalize(text.split(',') if text else [])
+
+
+def normalize(names):
+    """공백 제거, 빈 값/중복 제외"""
+    return list(dict.fromkeys(name.strip() for name in names if name and name.strip()))
+
+
+def ensure_tags(names):
+    """
+    태그명 → 태그 ID (없는 태그는 일괄 생성)
+    Returns:
+        {태그명: 태그 ID}
+    """
+    from .models import RegulationTag
+
+    names = normalize(names)
+    if not names:
+        return {}
+    found = dict(RegulationTag.objects.filter(name__in=names).values_list('name', 'pk'))
+    missing = [name for name in names if name not in found]
+    if missing:
+        RegulationTag.objects.bulk_create(
+            [RegulationTag(name=name) for name in missing], ignore_conflicts=True
+        )
+        # ignore_conflicts는 생성된 ID를 돌려주지 않으므로 다시 조회
+        found.update(RegulationTag.objects.filter(name__in=missing).values_list('name', 'pk'))
+    return found
+
+
+def _change_counts(counts):
+    """태그별 사규 수 증감 {태그 ID: 증감} (UPDATE 한 번)"""
+    from .models import RegulationTag
+
+    counts = {pk: delta for pk, delta in counts.items() if delta}
+    if not counts:
+        return
+    RegulationTag.objects.filter(pk__in=list(counts)).update(regulation_count=F('regulation_count') + Case(
+        *[When(pk=pk, then=Value(delta)) for pk, delta in counts.items()],
+        default=Value(0),
+        output_field=IntegerField(),
+    ))
+
+
+def sync_tags(regulation, names):
+    """
+    사규의 태그를 names로 맞춤 (바뀐 태그만 추가/삭제)
+    Returns:
+        (추가된 태그명 목록, 삭제된 태그명 목록)
+    """
+    from .models import RegulationTag
+
+    through = RegulationTag.regulations.through
+    names = normalize(names)
+    current = dict(
+        through.objects.filter(regulation_id=regulation.pk)
+        .values_list('regulationtag__name', 'regulationtag_id')
+    )
+    added = [name for name in names if name not in current]
+    removed = [name for name in current if name not in names]
+    if not added and not removed:
+        return [], []
+
+    with transaction.atomic():
+        if removed:
+            through.objects.filter(
+                regulation_id=regulation.pk,
+                regulationtag_id__in=[current[name] for name in removed],
+            ).delete()
+        tag_ids = ensure_tags(added)
+        through.objects.bulk_create(
+            [through(regulation_id=regulation.pk, regulationtag_id=tag_ids[name]) for name in added],
+            ignore_conflicts=True,
+        )
+        counts = Counter({tag_ids[name]: 1 for name in added})
+        counts.update({current[name]: -1 for name in removed})
+        _change_counts(counts)
+    return added, removed
+
+
+def add_tags(assignments):
+    """
+    여러 사규에 태그 일괄 추가 (기존 태그는 유지)
+    Args:
+        assignments: {사규 ID: [태그명, ...]}
+    Returns:
+        추가된 (사규, 태그) 연결 수
+    """
+    from .models import RegulationTag
+
+    through = RegulationTag.regulations.through
+    tag_ids = ensure_tags(name for names in assignments.values() for name in names)
+    wanted = {
+        (regulation_id, tag_ids[name])
+        for regulation_id, names in assignments.items()
+        for name in normalize(names)
+    }
+    if not wanted:
+        return 0
+    existing = set(
+        through.objects.filter(regulation_id__in=list(assignments))
+        .values_list('regulation_id', 'regulationtag_id')
+    )
+    new = sorted(wanted - existing)
+    with transaction.atomic():
+        through.objects.bulk_create(
+            [through(regulation_id=regulation_id, regulationtag_id=tag_id) for regulation_id, tag_id in new],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+        _change_counts(Counter(tag_id for _, tag_id in new))
+    return len(new)
+
+
+def refresh_counts(tag_ids=None):
+    """태그별 사규 수를 중간 테이블에서 다시 계산"""
+    from .models import RegulationTag
+
+    through = RegulationTag.regulations.through
+    counted = through.objects.filter(regulationtag_id=OuterRef('pk')).values(
+        'regulationtag_id'
+    ).annotate(total=Count('pk')).values('total')
+    tags = RegulationTag.objects.all()
+    if tag_ids is not None:
+        tags = tags.filter(pk__in=list(tag_ids))
+    return tags.exclude(
+        regulation_count=Coalesce(Subquery(counted), 0)
+    ).update(regulation_count=Coalesce(Subquery(counted), 0))
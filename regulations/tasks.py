@@ -0,0 +1,47 @@
+"""
+사규 백그라운드 작업
+"""
+
+from django.core.management import call_command
+
+from tasks.registry import task
+
+
+@task(name='regulations.import_naver_regulations', max_attempts=1)
+def import_naver_regulations(file_path):
+    """네이버 사규 목록 엑셀 가져오기"""
+    call_command('import_naver_regulations', file=file_path)
+    return file_path
+
+
+@task(name='regulations.extract_attachment_text', priority=-1)
+def extract_attachment_text(kind, pk):
+    """첨부파일 텍스트 추출"""
+    from .services import extract_attachment
+
+    extracted = extract_attachment(kind, pk)
+    return extracted.sha256 if extracted else None
+
+
+@task(name='regulations.replay_audit_spool', every=300)
+def replay_audit_spool():
+    """감사 로그 스풀 파일 재저장"""
+    from .audit import replay_spool
+
+    return replay_spool()
+
+
+@task(name='regulations.rescan_references')
+def rescan_regulation_references(regulation_id, old_values=None):
+    """코드/사규명이 바뀐 사규를 인용할 수 있는 사규의 인용 관계 다시 분석"""
+    from .references import rescan_references_to
+
+    return rescan_references_to(regulation_id, old_values or [])
+
+
+@task(name='regulations.update_similarities', priority=-1, every=3600)
+def update_regulation_similarities():
+    """유사 사규 증분 갱신 (마지막 실행 이후 등록/수정된 사규 기준)"""
+    from .similarity import update_similarities
+
+    return update_similarities()
@@ -19,6 +19,7 @@ urlpatterns = [
     path("<int:pk>/", views.RegulationDetailView.as_view(), name="detail"),
     path("<int:pk>/edit/", views.RegulationUpdateView.as_view(), name="update"),
     path("<int:pk>/delete/", views.RegulationDeleteView.as_view(), name="delete"),
+    path("<int:pk>/acl/", views.regulation_acl, name="acl"),
     # 버전 관리
     path(
         "<int:regulation_pk>/version/create/",
@@ -26,12 +27,37 @@ urlpatterns = [
         name="version_create",
     ),
     path("<int:pk>/history/", views.regulation_history, name="history"),
+    # 조문
+    path(
+        "<int:pk>/articles/<int:number>/",
+        views.article_detail,
+        name="article_detail",
+    ),
+    path(
+        "<int:pk>/articles/<int:number>-<int:branch>/",
+        views.article_detail,
+        name="article_branch_detail",
+    ),
     # 파일 다운로드
     path(
         "version/<int:version_pk>/download/",
         views.download_regulation_file,
         name="download",
     ),
+    path(
+        "<int:pk>/original/download/",
+        views.download_original_file,
+        name="original_download",
+    ),
+    # 사규 체계도
+    path("<int:pk>/hierarchy/", views.regulation_hierarchy, name="hierarchy"),
+    # 첨부파일 일괄 다운로드 (ZIP)
+    path(
+        "category/<str:category>/bundle/",
+        views.download_category_bundle,
+        name="category_bundle",
+    ),
+    path("<int:pk>/bundle/", views.download_version_bundle, name="version_bundle"),
     # 태그
     path("tags/", views.tag_list, name="tag_list"),
     path("tags/<str:tag_name>/", views.regulations_by_tag, name="by_tag"),
@@ -42,4 +68,7 @@ urlpatterns = [
     path("codes/<int:pk>/delete/", views.code_delete, name="code_delete"),
     # API
     path("api/by-category/", views.get_regulations_by_category, name="api_by_category"),
+    path("api/<int:pk>/hierarchy/", views.hierarchy_api, name="api_hierarchy"),
+    path("api/<int:pk>/impact/", views.impact_api, name="api_impact"),
+    path("api/autocomplete/<str:source>/", views.autocomplete_api, name="autocomplete"),
 ]
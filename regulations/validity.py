@@ -0,0 +1,78 @@
+"""
+사규 시행 기간 (시점 조회)
+사규별로 시행 중이던 기간과 그 기간의 버전을 RegulationValidity 구간 [valid_from, valid_to)으로 저장하여
+"특정 일자에 시행 중이던 사규/버전"을 구간 조건 한 번으로 조회
+
+- 사규 시행 기간: 시행일(없으면 첫 버전 등록일, 버전도 없으면 사규 생성일)부터 폐지일 전날까지
+- 제정/개정 버전은 등록일부터 다음 버전 등록일 전날까지 시행된 것으로 봄
+  (첫 버전 등록 전 기간은 version 없이 저장, 같은 날 등록된 버전은 마지막 버전만 남김)
+- 버전 등록/삭제, 시행일/폐지일 변경 시 해당 사규의 구간을 다시 만듦 (regulations.signals)
+"""
+
+from django.db import transaction
+from django.utils import timezone
+
+
+def _date(value):
+    return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+
+
+def validity_intervals(regulation, versions):
+    """
+    사규의 시행 구간 목록
+    Args:
+        versions: 제정/개정 버전 (등록 순)
+    Returns:
+        [(버전 또는 None, valid_from, valid_to 또는 None), ...]
+    """
+    starts = [(_date(version.created_at), version) for version in versions]
+    start = regulation.effective_date or (
+        starts[0][0] if starts else _date(regulation.created_at)
+    )
+    end = regulation.abolished_date
+
+    # 시행일 이전에 등록된 버전은 시행일부터 적용
+    boundaries = [(start, None)]
+    for day, version in starts:
+        if day <= start:
+            boundaries[0] = (start, version)
+        else:
+            boundaries.append((day, version))
+
+    intervals = []
+    for index, (valid_from, version) in enumerate(boundaries):
+        valid_to = boundaries[index + 1][0] if index + 1 < len(boundaries) else None
+        if end is not None and (valid_to is None or valid_to > end):
+            valid_to = end
+        if valid_to is not None and valid_from >= valid_to:
+            continue
+        intervals.append((version, valid_from, valid_to))
+    return intervals
+
+
+def rebuild_validity(regulation):
+    """사규의 시행 구간 다시 만들기"""
+    from .models import RegulationValidity
+
+    versions = regulation.versions.filter(
+        change_type__in=['CREATE', 'REVISE']
+    ).order_by('created_at', 'pk').only('pk', 'created_at')
+    with transaction.atomic():
+        RegulationValidity.objects.filter(regulation=regulation).delete()
+        RegulationValidity.objects.bulk_create([
+            RegulationValidity(
+                regulation=regulation, version=version, valid_from=valid_from, valid_to=valid_to
+            )
+            for version, valid_from, valid_to in validity_intervals(regulation, versions)
+        ])
+
+
+def rebuild_validity_for(regulation_id):
+    """사규 ID로 시행 구간 다시 만들기 (사규가 삭제되었으면 무시)"""
+    from .models import Regulation
+
+    regulation = Regulation.objects.filter(pk=regulation_id).only(
+        'pk', 'effective_date', 'abolished_date', 'created_at'
+    ).first()
+    if regulation is not None:
+        rebuild_validity(regulation)
@@ -14,14 +14,39 @@ from django.views.generic import (
     DeleteView,
 )
 from django.urls import reverse_lazy, reverse
-from django.http import FileResponse, Http404, JsonResponse, HttpResponseForbidden
-from django.db.models import Q, Count
+from django.http import Http404, JsonResponse, HttpResponseForbidden, StreamingHttpResponse
+from django.db.models import Q, Count, Exists, OuterRef
 from django.utils import timezone
+from django.utils.http import content_disposition_header
 from django.core.paginator import Paginator
 
-from .models import Regulation, RegulationVersion, RegulationTag, RegulationDownloadLog
-from .forms import RegulationForm, RegulationVersionForm, RegulationSearchForm
-from accounts.models import Department
+from .models import (
+    Regulation,
+    RegulationArticle,
+    RegulationVersion,
+    RegulationVersionBody,
+    RegulationTag,
+)
+from .forms import RegulationAclForm, RegulationForm, RegulationVersionForm, RegulationSearchForm
+from .services import queue_attachment_extraction
+from .downloads import serve_file
+from .bundles import category_bundle, iter_bundle, version_bundle
+from .codes import get_labels
+from .diff import get_version_diff
+from .history import VersionBodyError
+from .articles import PIECE_KINDS
+from .references import cited_by, cites
+from . import acl, autocomplete, graph
+from .tasks import update_regulation_similarities
+from .audit import record_download, record_downloads, record_view
+from accounts.models import Department, User
+from notifications.services import schedule_change_notification
+
+
+# 사규 목록 검색 시 표시할 최대 조문 수
+ARTICLE_HIT_LIMIT = 50
+# 접근 권한 일괄 지정 미리보기에 표시할 최대 직원 수
+ACL_PREVIEW_SIZE = 20
 
 
 class RegulationListView(LoginRequiredMixin, ListView):
@@ -58,12 +83,20 @@ class RegulationListView(LoginRequiredMixin, ListView):
         is_public = self.request.GET.get("is_public", "")
 
         if keyword:
+            # 첨부파일 본문은 업로드 시 미리 추출한 텍스트에서 검색
+            version_text_match = RegulationVersion.objects.filter(
+                regulation=OuterRef("pk"),
+                content_text__text__icontains=keyword,
+            )
             queryset = queryset.filter(
                 Q(code__icontains=keyword)
                 | Q(title__icontains=keyword)
                 | Q(description__icontains=keyword)
                 | Q(manager__icontains=keyword)
                 | Q(group__icontains=keyword)
+                | Q(content__icontains=keyword)
+                | Q(original_text__text__icontains=keyword)
+                | Exists(version_text_match)
             )
 
         if category:
@@ -109,6 +142,19 @@ class RegulationListView(LoginRequiredMixin, ListView):
         context["total_count"] = self.get_queryset().count()
         context["is_dept_manager"] = self.request.user.role == 'DEPT_MANAGER'
 
+        # 본문 검색 결과는 조문 단위로 함께 표시
+        keyword = self.request.GET.get("keyword", "").strip()
+        if keyword:
+            context["article_hits"] = (
+                RegulationArticle.objects.filter(
+                    regulation__in=self.object_list.values("pk"),
+                    kind="ARTICLE",
+                    text__icontains=keyword,
+                )
+                .select_related("regulation")
+                .order_by("regulation__category", "regulation__code", "position")[:ARTICLE_HIT_LIMIT]
+            )
+
         # 분류별 카운트 (권한 적용)
         context["category_counts"] = (
             Regulation.objects.accessible_to(self.request.user)
@@ -129,10 +175,11 @@ class CategoryRegulationListView(RegulationListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         category_code = self.kwargs.get("category").upper()
-        category_display = dict(Regulation.CATEGORY_CHOICES).get(
+        category_display = get_labels("CATEGORY", Regulation.CATEGORY_CHOICES).get(
             category_code, category_code
         )
         context["category_display"] = category_display
+        context["category_code"] = category_code
         context["is_category_view"] = True
         return context
 
@@ -141,6 +188,7 @@ class RegulationDetailView(LoginRequiredMixin, DetailView):
     """사규 상세 뷰"""
 
     model = Regulation
+    queryset = Regulation.objects.select_related("stats")
     template_name = "regulations/regulation_detail.html"
     context_object_name = "regulation"
 
@@ -150,6 +198,7 @@ class RegulationDetailView(LoginRequiredMixin, DetailView):
         if not self.object.can_user_access(request.user):
             messages.error(request, "이 사규에 대한 접근 권한이 없습니다.")
             return redirect("regulations:list")
+        record_view(request, self.object)
         context = self.get_context_data(object=self.object)
         return self.render_to_response(context)
 
@@ -158,6 +207,18 @@ class RegulationDetailView(LoginRequiredMixin, DetailView):
         context["versions"] = self.object.versions.all().order_by("-created_at")
         context["related"] = self.object.related_regulations.all()
         context["children"] = self.object.child_regulations.all()
+        # 본문은 미리 변환한 HTML로 표시하고, 조문 색인이 있으면 목차 표시
+        context["content_html"] = self.object.get_content_html()
+        # 본문에서 찾은 인용 관계
+        context["cited_by"] = cited_by(self.object, self.request.user)
+        context["cites"] = cites(self.object, self.request.user)
+        context["similar"] = self.object.get_similar_regulations(self.request.user)
+        context["article_toc"] = (
+            self.object.articles.filter(kind__in=PIECE_KINDS)
+            .exclude(kind="PREAMBLE")
+            .only("kind", "label", "title", "anchor", "depth")
+            .order_by("position")
+        )
         return context
 
 
@@ -209,7 +270,11 @@ class RegulationCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
             form.instance.responsible_dept = user.department
         
         messages.success(self.request, "사규가 등록되었습니다.")
-        return super().form_valid(form)
+        response = super().form_valid(form)
+        queue_attachment_extraction("regulation", self.object)
+        # 새 사규의 유사 사규는 다음 주기를 기다리지 않고 바로 계산
+        update_regulation_similarities.delay()
+        return response
 
     def get_success_url(self):
         return reverse("regulations:detail", kwargs={"pk": self.object.pk})
@@ -263,8 +328,16 @@ class RegulationUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         if user.role == 'DEPT_MANAGER' and user.department:
             form.instance.responsible_dept = user.department
         
+        # 원본 파일이 바뀌면 이전 추출 텍스트 연결 해제 후 다시 추출
+        file_changed = "original_file" in form.changed_data
+        if file_changed:
+            form.instance.original_text = None
+
         messages.success(self.request, "사규가 수정되었습니다.")
-        return super().form_valid(form)
+        response = super().form_valid(form)
+        if file_changed:
+            queue_attachment_extraction("regulation", self.object)
+        return response
 
     def get_success_url(self):
         return reverse("regulations:detail", kwargs={"pk": self.object.pk})
@@ -274,6 +347,8 @@ class RegulationUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         context["is_create"] = False
         context["title"] = "사규 수정"
         context["is_dept_manager"] = self.request.user.role == 'DEPT_MANAGER'
+        # 중복/통합 검토용 유사 사규
+        context["similar"] = self.object.get_similar_regulations(self.request.user)
         return context
 
 
@@ -304,7 +379,9 @@ class RegulationVersionCreateView(LoginRequiredMixin, UserPassesTestMixin, Creat
         return self.request.user.can_manage_regulations()
 
     def dispatch(self, request, *args, **kwargs):
-        self.regulation = get_object_or_404(Regulation, pk=kwargs["regulation_pk"])
+        self.regulation = get_object_or_404(
+            Regulation.objects.select_related("stats__latest_version"), pk=kwargs["regulation_pk"]
+        )
         return super().dispatch(request, *args, **kwargs)
 
     def form_valid(self, form):
@@ -326,8 +403,16 @@ class RegulationVersionCreateView(LoginRequiredMixin, UserPassesTestMixin, Creat
             self.regulation.abolished_date = timezone.now().date()
             self.regulation.save()
 
+        response = super().form_valid(form)
+        queue_attachment_extraction("version", self.object)
+
+        # 제개정 알림 예약 (같은 사규의 연속 변경은 하나의 알림으로 병합)
+        schedule_change_notification(
+            self.regulation, self.object, exclude_user=self.request.user
+        )
+
         messages.success(self.request, "버전이 등록되었습니다.")
-        return super().form_valid(form)
+        return response
 
     def get_success_url(self):
         return reverse("regulations:detail", kwargs={"pk": self.regulation.pk})
@@ -336,39 +421,127 @@ class RegulationVersionCreateView(LoginRequiredMixin, UserPassesTestMixin, Creat
         context = super().get_context_data(**kwargs)
         context["regulation"] = self.regulation
         context["latest_version"] = self.regulation.get_latest_version()
+        # 개정 영향 범위: 이 사규를 인용하는 사규
+        context["cited_by"] = cited_by(self.regulation, self.request.user)
         return context
 
 
+def _is_new_download(response):
+    """다운로드 로그 대상 응답인지 여부 (캐시 재검증, 이어받기 요청은 제외)"""
+    if response.status_code == 206:
+        return response["Content-Range"].startswith("bytes 0-")
+    return response.status_code == 200
+
+
 @login_required
 def download_regulation_file(request, version_pk):
     """사규 파일 다운로드"""
-    version = get_object_or_404(RegulationVersion, pk=version_pk)
+    version = get_object_or_404(
+        RegulationVersion.objects.select_related("regulation"), pk=version_pk
+    )
 
     if not version.content_file:
         raise Http404("첨부파일이 없습니다.")
 
-    # 다운로드 로그 기록
-    RegulationDownloadLog.objects.create(
-        regulation=version.regulation,
-        version=version,
-        user=request.user,
-        ip_address=request.META.get("REMOTE_ADDR"),
-    )
+    if not version.regulation.can_user_access(request.user):
+        return HttpResponseForbidden("이 사규에 대한 접근 권한이 없습니다.")
+
+    # 파일 응답 (전송은 웹 서버 오프로드 또는 sendfile)
+    response = serve_file(request, version.content_file, version.get_download_filename())
+
+    # 다운로드 로그 기록 (버퍼에 넣고 백그라운드에서 저장)
+    if _is_new_download(response):
+        record_download(request, version)
+    return response
+
+
+@login_required
+def download_original_file(request, pk):
+    """사규 원본 파일 다운로드"""
+    regulation = get_object_or_404(Regulation, pk=pk)
 
-    # 파일 응답
-    response = FileResponse(
-        version.content_file.open("rb"),
-        as_attachment=True,
-        filename=version.content_file.name.split("/")[-1],
+    if not regulation.original_file:
+        raise Http404("원본 파일이 없습니다.")
+
+    if not regulation.can_user_access(request.user):
+        return HttpResponseForbidden("이 사규에 대한 접근 권한이 없습니다.")
+
+    return serve_file(request, regulation.original_file, regulation.get_download_filename())
+
+
+def _bundle_response(request, entries, skipped, filename):
+    """첨부파일 묶음(ZIP) 스트리밍 응답 (전송 완료 후 버전 파일 다운로드 로그를 한 번에 기록)"""
+
+    def on_complete(included):
+        record_downloads(request, [entry.version for entry in included if entry.version])
+
+    response = StreamingHttpResponse(
+        iter_bundle(entries, skipped, on_complete=on_complete),
+        content_type="application/zip",
     )
+    response["Content-Disposition"] = content_disposition_header(True, filename)
+    response["Cache-Control"] = "private, no-store"
+    # nginx가 응답을 임시 파일에 모으지 않고 바로 전달하도록 함
+    response["X-Accel-Buffering"] = "no"
     return response
 
 
+@login_required
+def download_category_bundle(request, category):
+    """분류별 현재 첨부파일 일괄 다운로드 (ZIP)"""
+    category = category.upper()
+    category_display = get_labels("CATEGORY", Regulation.CATEGORY_CHOICES).get(category)
+    if not category_display:
+        raise Http404("분류가 없습니다.")
+
+    entries, skipped = category_bundle(request.user, category)
+    filename = f"{category_display.replace('/', '_')}_{timezone.localdate():%Y%m%d}.zip"
+    return _bundle_response(request, entries, skipped, filename)
+
+
+@login_required
+def download_version_bundle(request, pk):
+    """사규 전체 버전 첨부파일 일괄 다운로드 (ZIP)"""
+    regulation = get_object_or_404(Regulation, pk=pk)
+
+    if not regulation.can_user_access(request.user):
+        return HttpResponseForbidden("이 사규에 대한 접근 권한이 없습니다.")
+
+    entries = version_bundle(regulation)
+    if not entries:
+        raise Http404("첨부파일이 없습니다.")
+    return _bundle_response(request, entries, [], f"{regulation.code}_전체버전.zip")
+
+
 @login_required
 def regulation_history(request, pk):
-    """사규 변경 이력 조회"""
+    """사규 변경 이력 조회 (?from=버전ID&to=버전ID 지정 시 본문 비교)"""
     regulation = get_object_or_404(Regulation, pk=pk)
-    versions = regulation.versions.all().order_by("-created_at")
+    if not regulation.can_user_access(request.user):
+        messages.error(request, "이 사규에 대한 접근 권한이 없습니다.")
+        return redirect("regulations:list")
+
+    versions = list(
+        regulation.versions.select_related("created_by", "approved_by")
+        .annotate(has_body=Exists(RegulationVersionBody.objects.filter(version=OuterRef("pk"))))
+        .order_by("-created_at", "-pk")
+    )
+    # 본문이 저장된 바로 이전 버전 (이전 버전과 비교 링크용)
+    previous = None
+    for version in reversed(versions):
+        version.previous_with_body = previous if version.has_body else None
+        if version.has_body:
+            previous = version
+
+    by_pk = {str(version.pk): version for version in versions}
+    from_version = by_pk.get(request.GET.get("from", ""))
+    to_version = by_pk.get(request.GET.get("to", ""))
+    diff = None
+    if from_version and to_version:
+        try:
+            diff = get_version_diff(from_version, to_version)
+        except VersionBodyError as e:
+            messages.error(request, f"버전 본문을 복원할 수 없습니다: {e}")
 
     return render(
         request,
@@ -376,6 +549,110 @@ def regulation_history(request, pk):
         {
             "regulation": regulation,
             "versions": versions,
+            "versions_with_body": [version for version in versions if version.has_body],
+            "from_version": from_version,
+            "to_version": to_version,
+            "diff": diff,
+        },
+    )
+
+
+@login_required
+def regulation_acl(request, pk):
+    """
+    사규 접근 권한 일괄 지정 (사번 목록/부서/법인)
+    미리보기에서 추가/삭제 대상과 접근 가능 인원을 확인한 뒤 적용
+    """
+    regulation = get_object_or_404(Regulation, pk=pk)
+    user = request.user
+    if not user.can_manage_regulations() or (
+        user.role == "DEPT_MANAGER" and regulation.responsible_dept_id != user.department_id
+    ):
+        messages.error(request, "이 사규의 접근 권한을 변경할 권한이 없습니다.")
+        return redirect("regulations:detail", pk=pk)
+
+    plan = None
+    if request.method == "POST":
+        form = RegulationAclForm(request.POST, request.FILES)
+        if form.is_valid():
+            data = form.cleaned_data
+            plan = acl.plan_changes(
+                regulation,
+                employee_ids=data["employee_list"],
+                department_codes=data["department_list"],
+                company_codes=data["company_list"],
+                include_children=data["include_children"],
+                mode=data["mode"],
+                access_level=data["access_level"],
+            )
+            if "apply" in request.POST:
+                acl.apply_changes(regulation, plan)
+                messages.success(
+                    request,
+                    f"접근 권한이 변경되었습니다. (직원 +{len(plan['add_users'])}/-{len(plan['remove_users'])}, "
+                    f"부서 +{len(plan['add_departments'])}/-{len(plan['remove_departments'])})",
+                )
+                return redirect("regulations:detail", pk=pk)
+            # 업로드한 파일의 사번을 입력란에 합쳐서 적용 시 다시 업로드하지 않도록 함
+            post = request.POST.copy()
+            post["employee_ids"] = "\n".join(data["employee_list"])
+            form = RegulationAclForm(post)
+            form.is_valid()
+    else:
+        form = RegulationAclForm(initial={"access_level": regulation.access_level})
+
+    context = {"regulation": regulation, "form": form, "plan": plan}
+    if plan:
+        context.update({
+            "added_users": User.objects.filter(pk__in=sorted(plan["add_users"])[:ACL_PREVIEW_SIZE])
+            .select_related("department"),
+            "removed_users": User.objects.filter(pk__in=sorted(plan["remove_users"])[:ACL_PREVIEW_SIZE])
+            .select_related("department"),
+            "added_departments": Department.objects.filter(pk__in=plan["add_departments"]),
+            "removed_departments": Department.objects.filter(pk__in=plan["remove_departments"]),
+        })
+    return render(request, "regulations/regulation_acl.html", context)
+
+
+@login_required
+def article_detail(request, pk, number, branch=None):
+    """사규 조문 조회 (제N조, 제N조의M)"""
+    regulation = get_object_or_404(Regulation, pk=pk)
+    if not regulation.can_user_access(request.user):
+        messages.error(request, "이 사규에 대한 접근 권한이 없습니다.")
+        return redirect("regulations:list")
+
+    article = (
+        regulation.articles.select_related("parent__parent")
+        .filter(kind="ARTICLE", number=number, branch=branch, in_addenda=False)
+        .first()
+    )
+    if article is None:
+        raise Http404("해당 조문이 없습니다.")
+    record_view(request, regulation)
+
+    # 상위 장/절
+    ancestors = []
+    parent = article.parent
+    while parent is not None:
+        ancestors.insert(0, parent)
+        parent = parent.parent
+
+    siblings = regulation.articles.filter(kind="ARTICLE", in_addenda=False).only(
+        "regulation", "kind", "number", "branch", "label", "title", "position", "in_addenda"
+    )
+    return render(
+        request,
+        "regulations/article_detail.html",
+        {
+            "regulation": regulation,
+            "article": article,
+            "ancestors": ancestors,
+            "cited_by": cited_by(regulation, request.user, article.number, article.branch),
+            "previous_article": siblings.filter(position__lt=article.position)
+            .order_by("-position").first(),
+            "next_article": siblings.filter(position__gt=article.position)
+            .order_by("position").first(),
         },
     )
 
@@ -393,17 +670,18 @@ def tag_list(request):
             Q(manager__icontains=user.get_full_name()) |
             Q(manager_primary__icontains=user.get_full_name())
         )
-        tags = RegulationTag.objects.filter(
+        tags = list(RegulationTag.objects.filter(
             regulations__in=my_regulations
         ).distinct().annotate(
-            regulation_count=Count("regulations", filter=Q(regulations__in=my_regulations))
-        ).order_by("-regulation_count")
+            my_count=Count("regulations", filter=Q(regulations__in=my_regulations))
+        ).order_by("-my_count"))
+        # 담당 사규 기준 사규 수로 표시
+        for tag in tags:
+            tag.regulation_count = tag.my_count
         total_regulations = my_regulations.count()
     else:
-        # 다른 권한은 모든 태그 표시
-        tags = RegulationTag.objects.annotate(
-            regulation_count=Count("regulations")
-        ).order_by("-regulation_count")
+        # 다른 권한은 모든 태그 표시 (태그별 사규 수는 저장된 값 사용)
+        tags = RegulationTag.objects.order_by("-regulation_count", "name")
         total_regulations = Regulation.objects.count()
 
     return render(
@@ -462,6 +740,110 @@ def get_regulations_by_category(request):
     return JsonResponse({"regulations": list(regulations)})
 
 
+@login_required
+def autocomplete_api(request, source):
+    """자동완성 API (?q=검색어&page=N) - 사규 등록/수정 폼의 선택 필드"""
+    if source not in autocomplete.SOURCES:
+        raise Http404("자동완성 대상이 없습니다.")
+    if not request.user.can_manage_regulations():
+        return JsonResponse({"error": "사규 관리 권한이 없습니다."}, status=403)
+
+    try:
+        page = max(int(request.GET.get("page", 1)), 1)
+    except ValueError:
+        page = 1
+    results, more = autocomplete.search(
+        autocomplete.SOURCES[source], request, request.GET.get("q", "").strip(), page
+    )
+    return JsonResponse({"results": results, "more": more})
+
+
+def _graph_nodes(user, ids):
+    """그래프 노드 정보 {사규 ID: 정보} (사용자가 볼 수 없는 사규는 제외)"""
+    return {
+        row["id"]: dict(row, url=reverse("regulations:detail", args=[row["id"]]))
+        for row in Regulation.objects.accessible_to(user)
+        .filter(pk__in=ids)
+        .values("id", "code", "title", "category", "status")
+    }
+
+
+def _hidden_node(pk):
+    return {"id": pk, "code": "", "title": "접근 권한이 없는 사규", "hidden": True}
+
+
+@login_required
+def regulation_hierarchy(request, pk):
+    """사규 체계도 (상위사규 사슬, 하위사규 트리, 개정 영향 범위)"""
+    regulation = get_object_or_404(Regulation, pk=pk)
+    if not regulation.can_user_access(request.user):
+        messages.error(request, "이 사규에 대한 접근 권한이 없습니다.")
+        return redirect("regulations:list")
+    return render(
+        request,
+        "regulations/regulation_hierarchy.html",
+        {"regulation": regulation, "edge_kinds": graph.EDGE_KINDS},
+    )
+
+
+@login_required
+def hierarchy_api(request, pk):
+    """사규 체계 API - 상위사규 사슬과 하위사규 트리 (재귀 CTE 조회)"""
+    regulation = get_object_or_404(Regulation, pk=pk)
+    if not regulation.can_user_access(request.user):
+        return JsonResponse({"error": "이 사규에 대한 접근 권한이 없습니다."}, status=403)
+
+    chain = graph.ancestors(regulation.pk)
+    nodes = graph.subtree(regulation.pk)
+    info = _graph_nodes(
+        request.user, [regulation.pk] + [node.id for node in chain] + [node.id for node in nodes]
+    )
+    children = graph.build_tree(regulation.pk, nodes)
+
+    def branch(node_id):
+        data = dict(info.get(node_id) or _hidden_node(node_id))
+        data["children"] = [branch(child) for child in children.get(node_id, [])]
+        return data
+
+    return JsonResponse({
+        "id": regulation.pk,
+        # 최상위부터
+        "ancestors": [info.get(node.id) or _hidden_node(node.id) for node in reversed(chain)],
+        "tree": branch(regulation.pk),
+        "descendant_count": len(nodes),
+    })
+
+
+@login_required
+def impact_api(request, pk):
+    """개정 영향 범위 API - 하위사규/인용/관련사규를 따라 영향을 받는 사규 전체"""
+    regulation = get_object_or_404(Regulation, pk=pk)
+    if not regulation.can_user_access(request.user):
+        return JsonResponse({"error": "이 사규에 대한 접근 권한이 없습니다."}, status=403)
+
+    nodes = graph.affected_by(regulation.pk)
+    info = _graph_nodes(request.user, [node.id for node in nodes] + [regulation.pk])
+    affected = []
+    for node in nodes:
+        if node.id not in info:
+            continue
+        via = info.get(node.via) or _hidden_node(node.via)
+        affected.append(dict(
+            info[node.id],
+            depth=node.depth,
+            kind=node.kind,
+            kind_display=graph.EDGE_KINDS[node.kind],
+            via={"id": via["id"], "code": via["code"], "title": via["title"]},
+        ))
+    return JsonResponse({
+        "id": regulation.pk,
+        "count": len(affected),
+        # 권한이 없어 목록에서 제외한 사규 수
+        "hidden_count": len(nodes) - len(affected),
+        "affected": affected,
+    })
+
+
 # ============================================
 # 공통코드 관리 뷰
 # ============================================
@@ -0,0 +1,62 @@
+"""
+자동완성 선택 위젯
+선택 목록 전체 대신 현재 선택된 값만 옵션으로 렌더링하고,
+나머지 항목은 화면에서 검색어를 입력할 때 자동완성 API(regulations:autocomplete)로 불러옵니다.
+"""
+
+from django import forms
+from django.urls import reverse
+
+
+class AutocompleteMixin:
+    """
+    Args:
+        source: 자동완성 대상 (regulations.autocomplete.SOURCES의 키)
+        forward: 검색 시 함께 보낼 폼 필드 {파라미터명: 필드 id}
+        extra: 검색 시 함께 보낼 고정 값 {파라미터명: 값}
+    """
+
+    def __init__(self, source, forward=None, extra=None, attrs=None):
+        super().__init__(attrs)
+        self.source = source
+        self.forward = forward or {}
+        self.extra = extra or {}
+
+    class Media:
+        js = ['js/autocomplete.js']
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        attrs.setdefault('class', 'form-select')
+        attrs['data-autocomplete-url'] = reverse('regulations:autocomplete', args=[self.source])
+        if self.forward:
+            attrs['data-autocomplete-forward'] = ','.join(
+                f'{param}:{field_id}' for param, field_id in self.forward.items()
+            )
+        if self.extra:
+            attrs['data-autocomplete-extra'] = '&'.join(
+                f'{param}={value}' for param, value in self.extra.items() if value not in (None, '')
+            )
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        """선택된 값만 옵션으로 (선택 목록 전체를 조회하지 않음)"""
+        field = self.choices.field
+        selected = {str(v) for v in value if str(v) not in field.empty_values}
+        options = []
+        if not self.allow_multiple_selected:
+            options.append(self.create_option(name, '', '', not selected, 0))
+        if selected:
+            for obj in field.queryset.filter(pk__in=selected):
+                options.append(self.create_option(
+                    name, str(obj.pk), field.label_from_instance(obj), True, len(options)
+                ))
+        return [(None, options, 0)]
+
+
+class AutocompleteSelect(AutocompleteMixin, forms.Select):
+    """자동완성 단일 선택"""
+
+
+class AutocompleteSelectMultiple(AutocompleteMixin, forms.SelectMultiple):
+    """자동완성 다중 선택"""
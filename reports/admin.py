@@ -0,0 +1,25 @@
+"""
+보고서 관리자 페이지 설정
+"""
+
+from django.contrib import admin
+from .models import DailyRegulationUsage, RollupWatermark
+
+
+@admin.register(DailyRegulationUsage)
+class DailyRegulationUsageAdmin(admin.ModelAdmin):
+    """사규 일별 이용 집계"""
+    list_display = ['date', 'regulation', 'department', 'download_count', 'download_users', 'view_count', 'view_users']
+    list_filter = ['date', 'department']
+    search_fields = ['regulation__code', 'regulation__title']
+    ordering = ['-date']
+    date_hierarchy = 'date'
+    list_select_related = ['regulation', 'department']
+    readonly_fields = ['date', 'regulation', 'department', 'download_count', 'download_users', 'view_count', 'view_users']
+
+
+@admin.register(RollupWatermark)
+class RollupWatermarkAdmin(admin.ModelAdmin):
+    """집계 진행 위치"""
+    list_display = ['name', 'last_id', 'pruned_before', 'updated_at']
+    readonly_fields = ['name', 'last_id', 'pruned_before', 'updated_at']
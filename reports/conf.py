@@ -0,0 +1,23 @@
+"""
+보고서 설정값
+settings.REPORT_SETTINGS 조회 (미설정 항목은 기본값 사용)
+"""
+
+from django.conf import settings
+
+
+DEFAULTS = {
+    # 다운로드/조회 원본 로그 보관 일수 (일별 집계에 반영된 로그만 삭제)
+    'USAGE_LOG_RETENTION_DAYS': 365,
+    # 집계 1회(한 트랜잭션)에 반영할 최대 로그 건수
+    'ROLLUP_BATCH_SIZE': 50000,
+    # 원본 로그 삭제 시 한 트랜잭션에서 처리할 건수
+    'PRUNE_CHUNK_SIZE': 1000,
+}
+
+
+def get_report_settings():
+    """REPORT_SETTINGS 설정값 반환"""
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'REPORT_SETTINGS', {}))
+    return config
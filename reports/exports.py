@@ -0,0 +1,227 @@
+"""
+보고서 엑셀 생성
+사규 현황/제개정 이력/만료예정 보고서의 조회 조건 및 엑셀 파일 생성 로직
+
+뷰(즉시 다운로드)와 백그라운드 작업(대용량 보고서)에서 함께 사용합니다.
+"""
+
+import io
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from openpyxl import Workbook
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.utils import get_column_letter
+
+from regulations.codes import get_labels
+from regulations.models import Regulation, RegulationVersion
+
+
+def _dept_manager_filter(user, prefix=''):
+    """책임부서담당자(DEPT_MANAGER)가 담당하는 사규 조건"""
+    return (
+        Q(**{f'{prefix}responsible_dept': user.department}) |
+        Q(**{f'{prefix}manager__icontains': user.get_full_name()}) |
+        Q(**{f'{prefix}manager_primary__icontains': user.get_full_name()})
+    )
+
+
+def get_status_queryset(user, params):
+    """사규 현황 보고서 조회"""
+    category = params.get('category', '')
+    status = params.get('status', '')
+    dept_id = params.get('department', '')
+
+    regulations = Regulation.objects.select_related('responsible_dept').all()
+
+    if category:
+        regulations = regulations.filter(category=category)
+    if status:
+        regulations = regulations.filter(status=status)
+    if dept_id:
+        regulations = regulations.filter(responsible_dept_id=dept_id)
+
+    return regulations.order_by('category', 'code')
+
+
+def get_history_queryset(user, params):
+    """제개정 이력 보고서 조회"""
+    start_date = params.get('start_date', '')
+    end_date = params.get('end_date', '')
+    change_type = params.get('change_type', '')
+
+    versions = RegulationVersion.objects.select_related(
+        'regulation', 'regulation__responsible_dept', 'created_by', 'approved_by'
+    ).filter(regulation__isnull=False)
+
+    # 책임부서담당자(DEPT_MANAGER)인 경우: 자신이 담당하는 사규만
+    if user.role == 'DEPT_MANAGER' and user.department:
+        versions = versions.filter(_dept_manager_filter(user, 'regulation__'))
+
+    if start_date:
+        versions = versions.filter(created_at__date__gte=start_date)
+    if end_date:
+        versions = versions.filter(created_at__date__lte=end_date)
+    if change_type:
+        versions = versions.filter(change_type=change_type)
+
+    return versions.order_by('-created_at')
+
+
+def get_expiry_queryset(user, params):
+    """만료예정 보고서 조회"""
+    days = int(params.get('days', 30))
+
+    today = timezone.now().date()
+    target_date = today + timedelta(days=days)
+
+    regulations = Regulation.objects.filter(
+        status='ACTIVE',
+        expiry_date__lte=target_date,
+        expiry_date__gte=today
+    ).select_related('responsible_dept')
+
+    # 책임부서담당자(DEPT_MANAGER)인 경우: 자신이 담당하는 사규만
+    if user.role == 'DEPT_MANAGER' and user.department:
+        regulations = regulations.filter(_dept_manager_filter(user))
+
+    return regulations.order_by('expiry_date')
+
+
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+
+
+def _write_header(ws, headers, fill_color):
+    """헤더 행 작성"""
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
+    header_alignment = Alignment(horizontal="center", vertical="center")
+    for col, header in enumerate(headers, 1):
+        cell = ws.cell(row=1, column=col, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+        cell.border = THIN_BORDER
+
+
+def _write_rows(ws, rows, column_widths):
+    """데이터 행 작성 및 컬럼 너비 조정"""
+    for row, values in enumerate(rows, 2):
+        ws.cell(row=row, column=1, value=row-1).border = THIN_BORDER
+        for col, value in enumerate(values, 2):
+            ws.cell(row=row, column=col, value=value).border = THIN_BORDER
+
+    for i, width in enumerate(column_widths, 1):
+        ws.column_dimensions[get_column_letter(i)].width = width
+
+
+def write_status_sheet(ws, regulations):
+    """사규 현황 시트 작성"""
+    ws.title = "사규 현황"
+    _write_header(ws, ['No.', '사규코드', '사규명', '분류', '상태', '의무준수', '적용범위', '책임부서', '현재버전', '시행일', '정기검토예정일'], "2E75B6")
+
+    # 분류 레이블
+    category_labels = get_labels('CATEGORY', Regulation.CATEGORY_CHOICES)
+    status_labels = dict(Regulation.STATUS_CHOICES)
+    scope_labels = dict(Regulation.SCOPE_CHOICES)
+
+    _write_rows(ws, (
+        [
+            reg.code,
+            reg.title,
+            category_labels.get(reg.category, reg.category),
+            status_labels.get(reg.status, reg.status),
+            '의무' if reg.is_mandatory else '비의무',
+            scope_labels.get(reg.scope, reg.scope),
+            reg.responsible_dept.name if reg.responsible_dept else '',
+            reg.current_version,
+            reg.effective_date.strftime('%Y-%m-%d') if reg.effective_date else '',
+            reg.expiry_date.strftime('%Y-%m-%d') if reg.expiry_date else '',
+        ]
+        for reg in regulations.iterator()
+    ), [6, 15, 40, 15, 10, 10, 12, 20, 10, 12, 15])
+
+
+def write_history_sheet(ws, versions):
+    """제개정 이력 시트 작성"""
+    ws.title = "제개정 이력"
+    _write_header(ws, ['No.', '사규코드', '사규명', '버전', '변경유형', '변경사유', '작성자', '승인자', '승인일', '등록일'], "2E75B6")
+
+    change_type_labels = dict(RegulationVersion.CHANGE_TYPE_CHOICES)
+
+    _write_rows(ws, (
+        [
+            ver.regulation.code if ver.regulation else '삭제된 사규',
+            ver.regulation.title if ver.regulation else '-',
+            f"v{ver.version_number}",
+            change_type_labels.get(ver.change_type, ver.change_type),
+            ver.change_reason[:50] + '...' if len(ver.change_reason) > 50 else ver.change_reason,
+            ver.created_by.get_full_name() if ver.created_by else '',
+            ver.approved_by.get_full_name() if ver.approved_by else '',
+            ver.approved_at.strftime('%Y-%m-%d') if ver.approved_at else '',
+            ver.created_at.strftime('%Y-%m-%d %H:%M'),
+        ]
+        for ver in versions.iterator()
+    ), [6, 15, 40, 10, 10, 50, 15, 15, 12, 18])
+
+
+def write_expiry_sheet(ws, regulations):
+    """만료예정 시트 작성"""
+    ws.title = "만료예정 사규"
+    _write_header(ws, ['No.', '사규코드', '사규명', '분류', '책임부서', '정기검토예정일', '남은일수'], "C65911")
+
+    today = timezone.now().date()
+    category_labels = get_labels('CATEGORY', Regulation.CATEGORY_CHOICES)
+
+    _write_rows(ws, (
+        [
+            reg.code,
+            reg.title,
+            category_labels.get(reg.category, reg.category),
+            reg.responsible_dept.name if reg.responsible_dept else '',
+            reg.expiry_date.strftime('%Y-%m-%d'),
+            f"{(reg.expiry_date - today).days}일",
+        ]
+        for reg in regulations.iterator()
+    ), [6, 15, 40, 15, 20, 15, 10])
+
+
+# 보고서별 (조회 함수, 시트 작성 함수, 파일명)
+EXPORTS = {
+    'status': (get_status_queryset, write_status_sheet, '사규현황보고서'),
+    'history': (get_history_queryset, write_history_sheet, '제개정이력보고서'),
+    'expiry': (get_expiry_queryset, write_expiry_sheet, '만료예정보고서'),
+}
+
+
+def build_excel(report, user, params, queryset=None):
+    """
+    보고서 엑셀 파일 생성
+    Returns:
+        (파일명, 파일 내용 bytes)
+    """
+    get_queryset, write_sheet, title = EXPORTS[report]
+    if queryset is None:
+        queryset = get_queryset(user, params)
+
+    wb = Workbook()
+    write_sheet(wb.active, queryset)
+
+    output = io.BytesIO()
+    wb.save(output)
+
+    filename = f"{title}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    return filename, output.getvalue()
+
+
+def get_async_threshold():
+    """백그라운드에서 생성할 보고서의 최소 행 수"""
+    return getattr(settings, 'REPORT_ASYNC_THRESHOLD', 2000)
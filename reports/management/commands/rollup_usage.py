@@ -0,0 +1,46 @@
+"""
+사규 이용 현황 집계 명령어
+다운로드/조회 원본 로그를 일별 집계 테이블에 반영하고, 보관 기간이 지난 원본 로그를 삭제
+
+사용 예:
+    python manage.py rollup_usage
+    python manage.py rollup_usage --prune --days 180
+    python manage.py rollup_usage --rebuild
+"""
+
+from django.core.management.base import BaseCommand
+
+from reports.rollups import prune_usage_logs, rollup_usage
+
+
+class Command(BaseCommand):
+    help = '다운로드/조회 로그를 일별 이용 현황으로 집계합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='남아 있는 원본 로그로 처음부터 다시 집계합니다.'
+        )
+        parser.add_argument(
+            '--prune',
+            action='store_true',
+            help='집계 후 보관 기간이 지난 원본 로그를 삭제합니다.'
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=None,
+            help='원본 로그 보관 일수 (기본값: REPORT_SETTINGS["USAGE_LOG_RETENTION_DAYS"])'
+        )
+
+    def handle(self, *args, **options):
+        result = rollup_usage(rebuild=options['rebuild'])
+        self.stdout.write(f'  - 집계에 반영된 로그: {result["logs"]}건 ({result["days"]}일)')
+
+        if options['prune']:
+            deleted = prune_usage_logs(days=options['days'])
+            self.stdout.write(f'  - 삭제된 다운로드 로그: {deleted["download"]}건')
+            self.stdout.write(f'  - 삭제된 조회 로그: {deleted["view"]}건')
+
+        self.stdout.write(self.style.SUCCESS('이용 현황 집계 완료!'))
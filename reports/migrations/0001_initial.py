@@ -0,0 +1,51 @@
+# Generated by Django 6.0 on 2026-10-19 06:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('accounts', '0002_company_department_company_user_company'),
+        ('regulations', '0016_regulation_view_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='집계 대상')),
+                ('last_id', models.BigIntegerField(default=0, verbose_name='마지막 로그 ID')),
+                ('pruned_before', models.DateField(blank=True, null=True, verbose_name='원본 로그 삭제 기준일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='갱신일시')),
+            ],
+            options={
+                'verbose_name': '집계 진행 위치',
+                'verbose_name_plural': '집계 진행 위치',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyRegulationUsage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='일자')),
+                ('download_count', models.PositiveIntegerField(default=0, verbose_name='다운로드 수')),
+                ('download_users', models.PositiveIntegerField(default=0, verbose_name='다운로드 사용자 수')),
+                ('view_count', models.PositiveIntegerField(default=0, verbose_name='조회 수')),
+                ('view_users', models.PositiveIntegerField(default=0, verbose_name='조회 사용자 수')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='daily_regulation_usage', to='accounts.department', verbose_name='사용자 부서')),
+                ('regulation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_usage', to='regulations.regulation', verbose_name='사규')),
+            ],
+            options={
+                'verbose_name': '사규 일별 이용 집계',
+                'verbose_name_plural': '사규 일별 이용 집계',
+                'ordering': ['-date'],
+                'indexes': [models.Index(fields=['date'], name='usage_date_idx'), models.Index(fields=['regulation', 'date'], name='usage_regulation_date_idx')],
+                'unique_together': {('date', 'regulation', 'department')},
+            },
+        ),
+    ]
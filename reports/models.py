@@ -0,0 +1,66 @@
+"""
+보고서 관련 모델
+사규 다운로드/조회 일별 집계
+"""
+
+from django.db import models
+
+
+class DailyRegulationUsage(models.Model):
+    """
+    사규 일별 이용 집계
+    다운로드/조회 로그를 일자, 사규, 사용자 부서별로 집계 (보고서/대시보드는 이 테이블만 조회)
+    """
+
+    date = models.DateField("일자")
+    regulation = models.ForeignKey(
+        "regulations.Regulation",
+        on_delete=models.CASCADE,
+        related_name="daily_usage",
+        verbose_name="사규",
+    )
+    department = models.ForeignKey(
+        "accounts.Department",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="daily_regulation_usage",
+        verbose_name="사용자 부서",
+    )
+    download_count = models.PositiveIntegerField("다운로드 수", default=0)
+    download_users = models.PositiveIntegerField("다운로드 사용자 수", default=0)
+    view_count = models.PositiveIntegerField("조회 수", default=0)
+    view_users = models.PositiveIntegerField("조회 사용자 수", default=0)
+
+    class Meta:
+        verbose_name = "사규 일별 이용 집계"
+        verbose_name_plural = "사규 일별 이용 집계"
+        ordering = ["-date"]
+        unique_together = ["date", "regulation", "department"]
+        indexes = [
+            models.Index(fields=["date"], name="usage_date_idx"),
+            models.Index(fields=["regulation", "date"], name="usage_regulation_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.regulation_id} (다운로드 {self.download_count}, 조회 {self.view_count})"
+
+
+class RollupWatermark(models.Model):
+    """
+    집계 진행 위치
+    원본 로그별로 마지막으로 집계에 반영한 로그 ID와 원본 로그를 삭제한 기준 일자를 기록
+    """
+
+    name = models.CharField("집계 대상", max_length=50, unique=True)
+    last_id = models.BigIntegerField("마지막 로그 ID", default=0)
+    # 이 일자 이전의 원본 로그는 삭제되었으므로 다시 집계하지 않음
+    pruned_before = models.DateField("원본 로그 삭제 기준일", null=True, blank=True)
+    updated_at = models.DateTimeField("갱신일시", auto_now=True)
+
+    class Meta:
+        verbose_name = "집계 진행 위치"
+        verbose_name_plural = "집계 진행 위치"
+
+    def __str__(self):
+        return f"{self.name}: {self.last_id}"
@@ -0,0 +1,241 @@
+"""
+사규 이용 현황 일별 집계
+다운로드/조회 원본 로그를 (일자, 사규, 사용자 부서)별 건수와 사용자 수로 집계 (DailyRegulationUsage)
+
+- 원본 로그별 집계 진행 위치(RollupWatermark)에 마지막으로 반영한 로그 ID를 기록하고,
+  그 이후에 저장된 로그가 있는 일자만 다시 집계합니다.
+- 사용자 수(중복 제외)는 더할 수 없으므로 해당 일자를 원본 로그로 다시 계산합니다.
+  감사 로그 스풀 재저장 등으로 지난 일자의 로그가 늦게 저장되어도 그 일자가 다시 집계됩니다.
+- 원본 로그가 삭제된 일자(pruned_before 이전)에 늦게 저장된 로그는 기존 집계에 건수만 더합니다.
+  (사용자 수는 기존 값과 새 로그의 사용자 수 중 큰 값으로 근사)
+- 부서는 집계 시점의 사용자 소속 부서입니다.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Max
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from regulations.models import RegulationDownloadLog, RegulationViewLog
+
+from .conf import get_report_settings
+from .models import DailyRegulationUsage, RollupWatermark
+
+
+# 집계 대상: 이름 -> (원본 로그 모델, 발생 시각 필드)
+# 이름은 RollupWatermark.name 및 DailyRegulationUsage의 <이름>_count/<이름>_users 필드에 사용
+SOURCES = {
+    'download': (RegulationDownloadLog, 'downloaded_at'),
+    'view': (RegulationViewLog, 'viewed_at'),
+}
+
+COUNT_FIELDS = ['download_count', 'download_users', 'view_count', 'view_users']
+
+
+def _day_start(day):
+    """일자의 시작 시각 (TIME_ZONE 기준)"""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _counts(row):
+    return tuple(getattr(row, name) for name in COUNT_FIELDS)
+
+
+def _batch_high(model, last_id, batch_size):
+    """이번 집계에 반영할 마지막 로그 ID (새 로그가 없으면 None)"""
+    pks = list(
+        model.objects.filter(pk__gt=last_id).order_by('pk')
+        .values_list('pk', flat=True)[batch_size - 1:batch_size]
+    )
+    if pks:
+        return pks[0]
+    return model.objects.filter(pk__gt=last_id).aggregate(high=Max('pk'))['high']
+
+
+def _aggregate(model, field, days, **filters):
+    """
+    지정 일자의 로그를 (일자, 사규, 부서)별로 집계
+    Returns:
+        ((일자, 사규 ID, 부서 ID), 건수, 사용자 수) 목록
+    """
+    queryset = model.objects.filter(
+        **{
+            f'{field}__gte': _day_start(min(days)),
+            f'{field}__lt': _day_start(max(days) + timedelta(days=1)),
+        },
+        **filters,
+    ).annotate(day=TruncDate(field)).filter(day__in=days)
+
+    rows = queryset.values(
+        'day', 'regulation_id', department=F('user__department_id')
+    ).annotate(
+        count=Count('pk'), users=Count('user', distinct=True)
+    ).order_by()
+
+    return [
+        ((row['day'], row['regulation_id'], row['department']), row['count'], row['users'])
+        for row in rows
+    ]
+
+
+def _load_rows(days):
+    """지정 일자의 기존 집계 행 (키: (일자, 사규 ID, 부서 ID))"""
+    rows = {}
+    duplicates = []
+    for row in DailyRegulationUsage.objects.filter(date__in=days):
+        key = (row.date, row.regulation_id, row.department_id)
+        if key in rows:
+            # 부서 삭제(SET_NULL)로 같은 키가 된 행은 하나로 합침
+            kept = rows[key]
+            for name in COUNT_FIELDS:
+                setattr(kept, name, getattr(kept, name) + getattr(row, name))
+            duplicates.append(row.pk)
+        else:
+            rows[key] = row
+    return rows, duplicates
+
+
+def _rollup_batch(batch_size, rebuild=False):
+    """
+    원본 로그 최대 batch_size건을 집계에 반영 (한 트랜잭션에서 호출)
+    Returns:
+        (반영한 로그 건수, 다시 집계한 일자 set)
+    """
+    plans = {}
+    for name, (model, field) in SOURCES.items():
+        watermark, _ = RollupWatermark.objects.select_for_update().get_or_create(name=name)
+        high = _batch_high(model, watermark.last_id, batch_size)
+        if high is None:
+            continue
+        new_logs = model.objects.filter(pk__gt=watermark.last_id, pk__lte=high)
+        days = set(
+            new_logs.annotate(day=TruncDate(field)).order_by()
+            .values_list('day', flat=True).distinct()
+        )
+        plans[name] = (watermark, high, days, new_logs.count())
+
+    if not plans:
+        return 0, set()
+
+    touched = set().union(*(plan[2] for plan in plans.values()))
+    rows, duplicates = _load_rows(touched)
+    original = {key: _counts(row) for key, row in rows.items()}
+
+    def get_row(key):
+        if key not in rows:
+            rows[key] = DailyRegulationUsage(
+                date=key[0], regulation_id=key[1], department_id=key[2]
+            )
+        return rows[key]
+
+    for name, (watermark, high, days, _) in plans.items():
+        model, field = SOURCES[name]
+        count_field, users_field = f'{name}_count', f'{name}_users'
+        pruned_before = watermark.pruned_before
+        merge_days = {day for day in days if pruned_before and day < pruned_before}
+        recompute_days = days - merge_days
+
+        if recompute_days:
+            for key, row in rows.items():
+                if key[0] in recompute_days:
+                    setattr(row, count_field, 0)
+                    setattr(row, users_field, 0)
+            for key, count, users in _aggregate(model, field, recompute_days, pk__lte=high):
+                row = get_row(key)
+                setattr(row, count_field, count)
+                setattr(row, users_field, users)
+
+        # 재집계 시에는 삭제된 일자의 늦은 로그가 이미 더해져 있으므로 다시 더하지 않음
+        if merge_days and not rebuild:
+            for key, count, users in _aggregate(
+                model, field, merge_days, pk__gt=watermark.last_id, pk__lte=high
+            ):
+                row = get_row(key)
+                setattr(row, count_field, getattr(row, count_field) + count)
+                setattr(row, users_field, max(getattr(row, users_field), users))
+
+        watermark.last_id = high
+        watermark.save(update_fields=['last_id', 'updated_at'])
+
+    to_create, to_update = [], []
+    for key, row in rows.items():
+        if not any(_counts(row)):
+            if row.pk:
+                duplicates.append(row.pk)
+        elif row.pk is None:
+            to_create.append(row)
+        elif _counts(row) != original[key]:
+            to_update.append(row)
+
+    if duplicates:
+        DailyRegulationUsage.objects.filter(pk__in=duplicates).delete()
+    DailyRegulationUsage.objects.bulk_update(to_update, COUNT_FIELDS, batch_size=500)
+    DailyRegulationUsage.objects.bulk_create(to_create, batch_size=500)
+
+    return sum(plan[3] for plan in plans.values()), touched
+
+
+def rollup_usage(rebuild=False, batch_size=None):
+    """
+    마지막 집계 이후 저장된 다운로드/조회 로그를 일별 집계에 반영
+    rebuild=True이면 처음부터 다시 집계 (원본 로그가 삭제된 일자의 집계는 유지)
+
+    Returns:
+        {'logs': 반영한 로그 건수, 'days': 다시 집계한 일자 수}
+    """
+    batch_size = batch_size or get_report_settings()['ROLLUP_BATCH_SIZE']
+
+    if rebuild:
+        RollupWatermark.objects.filter(name__in=SOURCES).update(last_id=0)
+
+    total = 0
+    touched = set()
+    while True:
+        # SQLite 쓰기 잠금을 오래 잡지 않도록 batch_size건씩 나누어 반영
+        with transaction.atomic():
+            processed, days = _rollup_batch(batch_size, rebuild=rebuild)
+        if not processed:
+            break
+        total += processed
+        touched |= days
+    return {'logs': total, 'days': len(touched)}
+
+
+def prune_usage_logs(days=None, chunk_size=None, now=None):
+    """
+    보관 기간이 지난 다운로드/조회 원본 로그 삭제
+    일별 집계에 반영된 로그만 삭제하며, 삭제 기준일은 RollupWatermark.pruned_before에 기록
+
+    Returns:
+        {'download': 삭제 건수, 'view': 삭제 건수}
+    """
+    config = get_report_settings()
+    days = config['USAGE_LOG_RETENTION_DAYS'] if days is None else days
+    chunk_size = chunk_size or config['PRUNE_CHUNK_SIZE']
+    cutoff_date = timezone.localdate(now) - timedelta(days=days)
+    cutoff = _day_start(cutoff_date)
+
+    deleted = {}
+    for name, (model, field) in SOURCES.items():
+        watermark, _ = RollupWatermark.objects.get_or_create(name=name)
+        # 삭제 전에 기록하여 이후 늦게 저장된 로그가 삭제된 일자를 덮어쓰지 않도록 함
+        if not watermark.pruned_before or watermark.pruned_before < cutoff_date:
+            RollupWatermark.objects.filter(pk=watermark.pk).update(pruned_before=cutoff_date)
+
+        queryset = model.objects.filter(
+            **{f'{field}__lt': cutoff}, pk__lte=watermark.last_id
+        )
+        total = 0
+        while True:
+            pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:chunk_size])
+            if not pks:
+                break
+            with transaction.atomic():
+                model.objects.filter(pk__in=pks).delete()
+            total += len(pks)
+            if len(pks) < chunk_size:
+                break
+        deleted[name] = total
+    return deleted
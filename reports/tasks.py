@@ -0,0 +1,64 @@
+"""
+보고서 백그라운드 작업
+대용량 엑셀 보고서 생성
+"""
+
+import uuid
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.urls import reverse
+
+from tasks.registry import task
+
+
+def get_export_storage():
+    """
+    생성된 보고서 저장소 (settings.STORAGES['exports'])
+    MEDIA_URL로 공개되지 않는 경로에 사용자별 하위 폴더로 저장하고, download_export 화면으로만 내려받습니다.
+    """
+    return storages['exports']
+
+
+def export_path(user_id, stored_name):
+    """보고서 저장 경로 (요청자별 하위 폴더)"""
+    return f"{user_id}/{stored_name}"
+
+
+@task(name='reports.generate_excel_report')
+def generate_excel_report(report, user_id, params):
+    """보고서 엑셀 생성 후 요청자에게 다운로드 알림 발송"""
+    from accounts.models import User
+    from notifications.models import Notification
+    from .exports import build_excel
+
+    user = User.objects.get(pk=user_id)
+    filename, content = build_excel(report, user, params)
+
+    stored_name = f"{uuid.uuid4().hex[:8]}_{filename}"
+    get_export_storage().save(export_path(user_id, stored_name), ContentFile(content))
+
+    url = reverse('reports:export_download', kwargs={'filename': stored_name})
+    Notification.objects.create(
+        user=user,
+        notification_type='SYSTEM',
+        title=f"[보고서] {filename} 생성 완료",
+        message=f"요청하신 보고서가 생성되었습니다.\n\n- 파일명: {filename}\n- 다운로드: {url}",
+    )
+    return stored_name
+
+
+@task(name='reports.rollup_usage', every=10 * 60)
+def rollup_usage():
+    """다운로드/조회 로그 일별 집계 (10분 주기)"""
+    from .rollups import rollup_usage as rollup
+    return rollup()
+
+
+@task(name='reports.prune_usage_logs', every=24 * 60 * 60)
+def prune_usage_logs():
+    """보관 기간이 지난 다운로드/조회 원본 로그 삭제 (1일 주기)"""
+    from .rollups import prune_usage_logs as prune, rollup_usage as rollup
+    # 아직 집계되지 않은 로그가 삭제 대상에서 빠지지 않도록 먼저 집계
+    rollup()
+    return prune()
@@ -18,12 +18,24 @@ urlpatterns = [
     path('history/', views.change_history_report, name='history'),
     path('history/export/', views.export_change_history_excel, name='history_export'),
     
+    # 시점 조회 보고서 (특정 일자에 시행 중이던 사규/버전)
+    path('as-of/', views.as_of_report, name='as_of'),
+    
     # 부서별 보고서
     path('department/', views.department_report, name='department'),
     
     # 만료예정 보고서
     path('expiry/', views.expiry_report, name='expiry'),
     path('expiry/export/', views.export_expiry_excel, name='expiry_export'),
+    
+    # 이용 현황 보고서 (다운로드/조회 일별 집계)
+    path('usage/', views.usage_report, name='usage'),
+    
+    # 유사 중복 사규 보고서 (본문 MinHash)
+    path('duplicates/', views.duplicate_report, name='duplicates'),
+    
+    # 백그라운드에서 생성된 보고서 다운로드
+    path('exports/<str:filename>/', views.download_export, name='export_download'),
 ]
 
 
@@ -3,21 +3,24 @@
 사규 현황 및 이력 보고서 생성
 """
 
-import io
-from datetime import datetime, timedelta
+from datetime import timedelta
 
-from django.shortcuts import render
+from django.shortcuts import render, redirect
+from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse
+from django.http import FileResponse, Http404, HttpResponse
+from django.urls import reverse
 from django.utils import timezone
-from django.db.models import Count, Q
+from django.db.models import Count, Max, Q, Sum
+from django.utils.dateparse import parse_date
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-from openpyxl.utils import get_column_letter
-
-from regulations.models import Regulation, RegulationVersion
+from regulations.codes import get_labels, get_model_choices
+from regulations.minhash import find_clusters, get_duplicate_settings
+from regulations.models import Regulation, RegulationValidity, RegulationVersion
 from accounts.models import Department
+from .models import DailyRegulationUsage, RollupWatermark
+from .exports import EXPORTS, build_excel, get_async_threshold
+from .tasks import export_path, generate_excel_report, get_export_storage
 
 
 @login_required
@@ -65,85 +68,7 @@ def regulation_status_report(request):
 @login_required
 def export_regulation_status_excel(request):
     """사규 현황 보고서 엑셀 다운로드"""
-    # 필터 파라미터
-    category = request.GET.get('category', '')
-    status = request.GET.get('status', '')
-    dept_id = request.GET.get('department', '')
-    
-    regulations = Regulation.objects.select_related('responsible_dept').all()
-    
-    if category:
-        regulations = regulations.filter(category=category)
-    if status:
-        regulations = regulations.filter(status=status)
-    if dept_id:
-        regulations = regulations.filter(responsible_dept_id=dept_id)
-    
-    regulations = regulations.order_by('category', 'code')
-    
-    # Excel 생성
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "사규 현황"
-    
-    # 스타일 정의
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="2E75B6", end_color="2E75B6", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # 헤더
-    headers = ['No.', '사규코드', '사규명', '분류', '상태', '의무준수', '적용범위', '책임부서', '현재버전', '시행일', '정기검토예정일']
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-    
-    # 분류 레이블
-    category_labels = dict(Regulation.CATEGORY_CHOICES)
-    status_labels = dict(Regulation.STATUS_CHOICES)
-    scope_labels = dict(Regulation.SCOPE_CHOICES)
-    
-    # 데이터
-    for row, reg in enumerate(regulations, 2):
-        ws.cell(row=row, column=1, value=row-1).border = thin_border
-        ws.cell(row=row, column=2, value=reg.code).border = thin_border
-        ws.cell(row=row, column=3, value=reg.title).border = thin_border
-        ws.cell(row=row, column=4, value=category_labels.get(reg.category, reg.category)).border = thin_border
-        ws.cell(row=row, column=5, value=status_labels.get(reg.status, reg.status)).border = thin_border
-        ws.cell(row=row, column=6, value='의무' if reg.is_mandatory else '비의무').border = thin_border
-        ws.cell(row=row, column=7, value=scope_labels.get(reg.scope, reg.scope)).border = thin_border
-        ws.cell(row=row, column=8, value=reg.responsible_dept.name if reg.responsible_dept else '').border = thin_border
-        ws.cell(row=row, column=9, value=reg.current_version).border = thin_border
-        ws.cell(row=row, column=10, value=reg.effective_date.strftime('%Y-%m-%d') if reg.effective_date else '').border = thin_border
-        ws.cell(row=row, column=11, value=reg.expiry_date.strftime('%Y-%m-%d') if reg.expiry_date else '').border = thin_border
-    
-    # 컬럼 너비 조정
-    column_widths = [6, 15, 40, 15, 10, 10, 12, 20, 10, 12, 15]
-    for i, width in enumerate(column_widths, 1):
-        ws.column_dimensions[get_column_letter(i)].width = width
-    
-    # 응답 생성
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
-    
-    filename = f"사규현황보고서_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    response = HttpResponse(
-        output.read(),
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
-    return response
-
+    return _export_excel(request, 'status', 'reports:status')
 
 @login_required
 def change_history_report(request):
@@ -190,91 +115,44 @@ def change_history_report(request):
 @login_required
 def export_change_history_excel(request):
     """제개정 이력 보고서 엑셀 다운로드"""
-    user = request.user
-    # 기간 필터
-    start_date = request.GET.get('start_date', '')
-    end_date = request.GET.get('end_date', '')
-    change_type = request.GET.get('change_type', '')
-    
-    versions = RegulationVersion.objects.select_related(
-        'regulation', 'regulation__responsible_dept', 'created_by', 'approved_by'
-    ).filter(regulation__isnull=False)
-    
-    # 책임부서담당자(DEPT_MANAGER)인 경우: 자신이 담당하는 사규만
-    if user.role == 'DEPT_MANAGER' and user.department:
-        versions = versions.filter(
-            Q(regulation__responsible_dept=user.department) |
-            Q(regulation__manager__icontains=user.get_full_name()) |
-            Q(regulation__manager_primary__icontains=user.get_full_name())
-        )
-    
-    if start_date:
-        versions = versions.filter(created_at__date__gte=start_date)
-    if end_date:
-        versions = versions.filter(created_at__date__lte=end_date)
-    if change_type:
-        versions = versions.filter(change_type=change_type)
-    
-    versions = versions.order_by('-created_at')
-    
-    # Excel 생성
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "제개정 이력"
-    
-    # 스타일
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="2E75B6", end_color="2E75B6", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # 헤더
-    headers = ['No.', '사규코드', '사규명', '버전', '변경유형', '변경사유', '작성자', '승인자', '승인일', '등록일']
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-    
-    change_type_labels = dict(RegulationVersion.CHANGE_TYPE_CHOICES)
-    
-    # 데이터
-    for row, ver in enumerate(versions, 2):
-        ws.cell(row=row, column=1, value=row-1).border = thin_border
-        ws.cell(row=row, column=2, value=ver.regulation.code if ver.regulation else '삭제된 사규').border = thin_border
-        ws.cell(row=row, column=3, value=ver.regulation.title if ver.regulation else '-').border = thin_border
-        ws.cell(row=row, column=4, value=f"v{ver.version_number}").border = thin_border
-        ws.cell(row=row, column=5, value=change_type_labels.get(ver.change_type, ver.change_type)).border = thin_border
-        ws.cell(row=row, column=6, value=ver.change_reason[:50] + '...' if len(ver.change_reason) > 50 else ver.change_reason).border = thin_border
-        ws.cell(row=row, column=7, value=ver.created_by.get_full_name() if ver.created_by else '').border = thin_border
-        ws.cell(row=row, column=8, value=ver.approved_by.get_full_name() if ver.approved_by else '').border = thin_border
-        ws.cell(row=row, column=9, value=ver.approved_at.strftime('%Y-%m-%d') if ver.approved_at else '').border = thin_border
-        ws.cell(row=row, column=10, value=ver.created_at.strftime('%Y-%m-%d %H:%M')).border = thin_border
-    
-    # 컬럼 너비 조정
-    column_widths = [6, 15, 40, 10, 10, 50, 15, 15, 12, 18]
-    for i, width in enumerate(column_widths, 1):
-        ws.column_dimensions[get_column_letter(i)].width = width
-    
-    # 응답 생성
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
-    
-    filename = f"제개정이력보고서_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    response = HttpResponse(
-        output.read(),
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    return _export_excel(request, 'history', 'reports:history')
+
+
+@login_required
+def as_of_report(request):
+    """
+    시점 조회 보고서
+    지정한 일자에 시행 중이던 사규와 버전 (RegulationValidity 구간 조회)
+    """
+    today = timezone.localdate()
+    as_of = _get_date(request, 'date', today)
+    category = request.GET.get('category', '')
+
+    intervals = RegulationValidity.objects.as_of(as_of).select_related(
+        'regulation', 'regulation__responsible_dept', 'version'
     )
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
-    return response
+    if category:
+        intervals = intervals.filter(regulation__category=category)
+    intervals = intervals.order_by('regulation__category', 'regulation__code')
+
+    category_labels = get_labels('CATEGORY', Regulation.CATEGORY_CHOICES)
+    context = {
+        'intervals': intervals,
+        'total_count': intervals.count(),
+        'category_stats': [
+            (category_labels.get(row['regulation__category']), row['count'])
+            # 목록 정렬(분류, 코드)이 GROUP BY에 들어가지 않도록 정렬 해제 후 집계
+            for row in intervals.order_by().values('regulation__category').annotate(
+                count=Count('id')
+            ).order_by('regulation__category')
+        ],
+        'categories': get_model_choices('CATEGORY', Regulation.CATEGORY_CHOICES),
+        'selected_date': as_of,
+        'selected_category': category,
+        'today': today,
+    }
+
+    return render(request, 'reports/as_of_report.html', context)
 
 
 @login_required
@@ -344,81 +222,132 @@ def expiry_report(request):
 @login_required
 def export_expiry_excel(request):
     """만료예정 보고서 엑셀 다운로드"""
-    user = request.user
-    days = int(request.GET.get('days', 30))
-    
-    today = timezone.now().date()
-    target_date = today + timedelta(days=days)
-    
-    regulations = Regulation.objects.filter(
-        status='ACTIVE',
-        expiry_date__lte=target_date,
-        expiry_date__gte=today
-    ).select_related('responsible_dept')
-    
-    # 책임부서담당자(DEPT_MANAGER)인 경우: 자신이 담당하는 사규만
-    if user.role == 'DEPT_MANAGER' and user.department:
-        regulations = regulations.filter(
-            Q(responsible_dept=user.department) |
-            Q(manager__icontains=user.get_full_name()) |
-            Q(manager_primary__icontains=user.get_full_name())
-        )
-    
-    regulations = regulations.order_by('expiry_date')
-    
-    # Excel 생성
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "만료예정 사규"
-    
-    # 스타일
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="C65911", end_color="C65911", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # 헤더
-    headers = ['No.', '사규코드', '사규명', '분류', '책임부서', '정기검토예정일', '남은일수']
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-    
-    category_labels = dict(Regulation.CATEGORY_CHOICES)
-    
-    # 데이터
-    for row, reg in enumerate(regulations, 2):
-        days_left = (reg.expiry_date - today).days
-        ws.cell(row=row, column=1, value=row-1).border = thin_border
-        ws.cell(row=row, column=2, value=reg.code).border = thin_border
-        ws.cell(row=row, column=3, value=reg.title).border = thin_border
-        ws.cell(row=row, column=4, value=category_labels.get(reg.category, reg.category)).border = thin_border
-        ws.cell(row=row, column=5, value=reg.responsible_dept.name if reg.responsible_dept else '').border = thin_border
-        ws.cell(row=row, column=6, value=reg.expiry_date.strftime('%Y-%m-%d')).border = thin_border
-        ws.cell(row=row, column=7, value=f"{days_left}일").border = thin_border
-    
-    # 컬럼 너비 조정
-    column_widths = [6, 15, 40, 15, 20, 15, 10]
-    for i, width in enumerate(column_widths, 1):
-        ws.column_dimensions[get_column_letter(i)].width = width
-    
-    # 응답 생성
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
-    
-    filename = f"만료예정보고서_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    return _export_excel(request, 'expiry', 'reports:expiry')
+
+
+@login_required
+def usage_report(request):
+    """
+    사규 이용 현황 보고서
+    다운로드/조회 원본 로그가 아닌 일별 집계(DailyRegulationUsage)만 조회
+    """
+    today = timezone.localdate()
+    start_date = _get_date(request, 'start_date', today - timedelta(days=29))
+    end_date = _get_date(request, 'end_date', today)
+    if start_date > end_date:
+        start_date, end_date = end_date, start_date
+    dept_id = request.GET.get('department', '')
+    if not dept_id.isdigit():
+        dept_id = ''
+
+    usage = DailyRegulationUsage.objects.filter(date__gte=start_date, date__lte=end_date)
+    if dept_id:
+        usage = usage.filter(department_id=dept_id)
+
+    sums = {
+        'downloads': Sum('download_count'),
+        'download_users': Sum('download_users'),
+        'views': Sum('view_count'),
+        'view_users': Sum('view_users'),
+    }
+    by_regulation = usage.values(
+        'regulation_id', 'regulation__code', 'regulation__title'
+    ).annotate(**sums)
+
+    context = {
+        'totals': usage.aggregate(**sums),
+        'top_downloads': by_regulation.filter(downloads__gt=0).order_by('-downloads')[:20],
+        'top_views': by_regulation.filter(views__gt=0).order_by('-views')[:20],
+        'by_department': usage.values('department_id', 'department__name').annotate(**sums).order_by('-downloads', '-views'),
+        'daily': usage.values('date').annotate(**sums).order_by('-date'),
+        'departments': Department.objects.filter(is_active=True),
+        'selected_start': start_date,
+        'selected_end': end_date,
+        'selected_dept': dept_id,
+        'last_rollup': RollupWatermark.objects.aggregate(last=Max('updated_at'))['last'],
+    }
+
+    return render(request, 'reports/usage_report.html', context)
+
+
+@login_required
+def duplicate_report(request):
+    """
+    유사 중복 사규 보고서
+    본문 MinHash 서명으로 찾은 거의 같은 사규 묶음 (Jaccard 유사도 추정값 기준)
+    """
+    default_threshold = get_duplicate_settings()['THRESHOLD']
+    try:
+        threshold = min(max(float(request.GET.get('threshold', default_threshold)), 0.5), 1.0)
+    except ValueError:
+        threshold = default_threshold
+
+    # 볼 수 있는 사규끼리의 묶음만 표시
+    accessible_ids = Regulation.objects.accessible_to(request.user).values_list('pk', flat=True)
+    clusters = find_clusters(threshold, regulation_ids=accessible_ids)
+    regulations = Regulation.objects.select_related(
+        'responsible_dept', 'responsible_dept__company'
+    ).in_bulk({pk for cluster in clusters for pk in cluster['ids']})
+    for cluster in clusters:
+        cluster['regulations'] = [regulations[pk] for pk in cluster['ids']]
+        cluster['pairs'] = [
+            (regulations[left], regulations[right], score)
+            for left, right, score in cluster['pairs']
+        ]
+
+    context = {
+        'clusters': clusters,
+        'regulation_count': len(regulations),
+        'selected_threshold': threshold,
+        'thresholds': [0.5, 0.6, 0.7, 0.8, 0.9, 0.95],
+    }
+
+    return render(request, 'reports/duplicate_report.html', context)
+
+
+def _get_date(request, name, default):
+    """GET 파라미터의 날짜 (없거나 잘못된 값이면 default)"""
+    try:
+        return parse_date(request.GET.get(name, '')) or default
+    except ValueError:
+        # 형식은 맞지만 없는 날짜 (예: 2024-02-30, 2024-13-01)
+        return default
+
+
+def _export_excel(request, report, redirect_url):
+    """
+    보고서 엑셀 다운로드 응답
+    행 수가 많은 보고서는 백그라운드 작업으로 생성하고, 완료 시 알림으로 다운로드 링크 전달
+    """
+    get_queryset = EXPORTS[report][0]
+    queryset = get_queryset(request.user, request.GET)
+
+    if queryset.count() > get_async_threshold():
+        generate_excel_report.delay(report, request.user.pk, request.GET.dict())
+        messages.info(request, '보고서 데이터가 많아 백그라운드에서 생성합니다. 완료되면 알림으로 알려드립니다.')
+        query = request.GET.urlencode()
+        return redirect(f"{reverse(redirect_url)}?{query}" if query else reverse(redirect_url))
+
+    filename, content = build_excel(report, request.user, request.GET, queryset=queryset)
     response = HttpResponse(
-        output.read(),
+        content,
         content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
     )
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
+
     return response
+
+
+@login_required
+def download_export(request, filename):
+    """백그라운드에서 생성된 보고서 다운로드 (본인이 요청한 보고서만)"""
+    storage = get_export_storage()
+    path = export_path(request.user.pk, filename)
+    if '/' in filename or '\\' in filename or not storage.exists(path):
+        raise Http404("보고서 파일을 찾을 수 없습니다.")
+
+    return FileResponse(
+        storage.open(path, 'rb'),
+        as_attachment=True,
+        filename=filename.split('_', 1)[-1],
+    )
@@ -0,0 +1,184 @@
+/*
+ * 자동완성 선택 위젯 (regulations.widgets.AutocompleteSelect / AutocompleteSelectMultiple)
+ * 원래 select는 숨기고 선택된 값만 옵션으로 유지하며,
+ * 검색어를 입력하면 data-autocomplete-url에서 페이지 단위로 결과를 불러옵니다.
+ */
+(function () {
+  'use strict';
+
+  const DELAY = 250;
+
+  function setup(select) {
+    if (select.dataset.autocompleteReady) {
+      return;
+    }
+    select.dataset.autocompleteReady = '1';
+    select.classList.add('d-none');
+
+    const wrapper = document.createElement('div');
+    wrapper.className = 'position-relative';
+    const chips = document.createElement('div');
+    chips.className = 'd-flex flex-wrap gap-1 mb-1';
+    const input = document.createElement('input');
+    input.type = 'text';
+    input.className = 'form-control';
+    input.placeholder = '검색어 입력 (코드 또는 이름 앞부분)';
+    input.autocomplete = 'off';
+    const menu = document.createElement('ul');
+    menu.className = 'dropdown-menu w-100 overflow-auto';
+    menu.style.maxHeight = '18rem';
+    wrapper.append(chips, input, menu);
+    select.after(wrapper);
+
+    let timer = null;
+    let controller = null;
+    let page = 1;
+
+    function renderChips() {
+      chips.innerHTML = '';
+      Array.from(select.options).filter(option => option.selected && option.value).forEach(option => {
+        const chip = document.createElement('span');
+        chip.className = 'badge text-bg-secondary d-inline-flex align-items-center';
+        chip.textContent = option.text;
+        const remove = document.createElement('button');
+        remove.type = 'button';
+        remove.className = 'btn-close btn-close-white ms-1';
+        remove.style.fontSize = '0.6rem';
+        remove.setAttribute('aria-label', '선택 해제');
+        remove.addEventListener('click', () => {
+          option.remove();
+          select.dispatchEvent(new Event('change', { bubbles: true }));
+          renderChips();
+        });
+        chip.append(remove);
+        chips.append(chip);
+      });
+    }
+
+    function choose(item) {
+      if (!select.multiple) {
+        Array.from(select.options).forEach(option => {
+          if (option.value) {
+            option.remove();
+          }
+        });
+      }
+      let option = Array.from(select.options).find(opt => opt.value === String(item.id));
+      if (!option) {
+        option = new Option(item.text, item.id, true, true);
+        select.add(option);
+      }
+      option.selected = true;
+      select.dispatchEvent(new Event('change', { bubbles: true }));
+      renderChips();
+      input.value = '';
+      close();
+    }
+
+    function close() {
+      menu.classList.remove('show');
+      menu.innerHTML = '';
+    }
+
+    function buildUrl() {
+      const params = new URLSearchParams(select.dataset.autocompleteExtra || '');
+      params.set('q', input.value.trim());
+      params.set('page', page);
+      (select.dataset.autocompleteForward || '').split(',').filter(Boolean).forEach(pair => {
+        const [param, fieldId] = pair.split(':');
+        const field = document.getElementById(fieldId);
+        if (field && field.value) {
+          params.set(param, field.value);
+        }
+      });
+      return select.dataset.autocompleteUrl + '?' + params.toString();
+    }
+
+    function load(append) {
+      if (controller) {
+        controller.abort();
+      }
+      controller = new AbortController();
+      fetch(buildUrl(), { signal: controller.signal, headers: { 'X-Requested-With': 'XMLHttpRequest' } })
+        .then(response => response.json())
+        .then(data => {
+          if (!append) {
+            menu.innerHTML = '';
+          }
+          const moreItem = menu.querySelector('[data-more]');
+          if (moreItem) {
+            moreItem.remove();
+          }
+          const selected = new Set(Array.from(select.selectedOptions).map(option => option.value));
+          (data.results || []).forEach(item => {
+            const li = document.createElement('li');
+            const link = document.createElement('button');
+            link.type = 'button';
+            link.className = 'dropdown-item' + (selected.has(String(item.id)) ? ' active' : '');
+            link.textContent = item.text;
+            link.addEventListener('click', () => choose(item));
+            li.append(link);
+            menu.append(li);
+          });
+          if (!menu.children.length) {
+            menu.innerHTML = '<li><span class="dropdown-item-text text-muted">검색 결과가 없습니다.</span></li>';
+          }
+          if (data.more) {
+            const li = document.createElement('li');
+            li.dataset.more = '1';
+            const link = document.createElement('button');
+            link.type = 'button';
+            link.className = 'dropdown-item text-primary';
+            link.textContent = '더 보기';
+            link.addEventListener('click', event => {
+              event.stopPropagation();
+              page += 1;
+              load(true);
+            });
+            li.append(link);
+            menu.append(li);
+          }
+          menu.classList.add('show');
+        })
+        .catch(error => {
+          if (error.name !== 'AbortError') {
+            console.error('자동완성 검색 중 오류 발생:', error);
+          }
+        });
+    }
+
+    function search() {
+      clearTimeout(timer);
+      timer = setTimeout(() => {
+        page = 1;
+        load(false);
+      }, DELAY);
+    }
+
+    input.addEventListener('input', search);
+    input.addEventListener('focus', search);
+    input.addEventListener('keydown', event => {
+      if (event.key === 'Escape') {
+        close();
+      } else if (event.key === 'Enter') {
+        // 폼 제출 대신 첫 번째 결과 선택
+        event.preventDefault();
+        const first = menu.querySelector('.dropdown-item:not([data-more] .dropdown-item)');
+        if (first && first.tagName === 'BUTTON') {
+          first.click();
+        }
+      }
+    });
+    document.addEventListener('click', event => {
+      if (!wrapper.contains(event.target)) {
+        close();
+      }
+    });
+
+    renderChips();
+  }
+
+  document.addEventListener('DOMContentLoaded', () => {
+    document.querySelectorAll('select[data-autocomplete-url]').forEach(setup);
+  });
+})();
@@ -0,0 +1,26 @@
+"""
+백그라운드 작업 관리자 페이지 설정
+"""
+
+from django.contrib import admin
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    """백그라운드 작업 관리"""
+    list_display = ['name', 'status', 'priority', 'attempts', 'max_attempts', 'run_after', 'locked_by', 'created_at', 'finished_at']
+    list_filter = ['status', 'name']
+    search_fields = ['name', 'last_error']
+    ordering = ['-created_at']
+    date_hierarchy = 'created_at'
+    readonly_fields = ['created_at', 'started_at', 'finished_at', 'locked_until', 'locked_by', 'attempts', 'result', 'last_error']
+
+    actions = ['retry_tasks']
+
+    @admin.action(description='선택한 작업 다시 실행')
+    def retry_tasks(self, request, queryset):
+        from django.utils import timezone
+        queryset.exclude(status='RUNNING').update(
+            status='PENDING', attempts=0, run_after=timezone.now(), last_error=''
+        )
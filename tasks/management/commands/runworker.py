@@ -0,0 +1,64 @@
+"""
+백그라운드 작업자 실행 명령어
+작업 대기열(Task)의 작업과 주기 작업을 실행
+
+사용 예:
+    python manage.py runworker
+    python manage.py runworker --concurrency 8 --pool process
+    python manage.py runworker --once
+"""
+
+import signal
+
+from django.core.management.base import BaseCommand
+
+from tasks.worker import Worker
+
+
+class Command(BaseCommand):
+    help = '백그라운드 작업 대기열을 처리하는 작업자를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=None,
+            help='동시에 실행할 작업 수 (기본값: TASK_SETTINGS["WORKERS"])'
+        )
+        parser.add_argument(
+            '--pool',
+            choices=['thread', 'process'],
+            default=None,
+            help='작업 실행 방식 (기본값: TASK_SETTINGS["POOL"])'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='현재 실행 가능한 작업만 처리하고 종료합니다.'
+        )
+        parser.add_argument(
+            '--no-periodic',
+            action='store_true',
+            help='주기 작업을 적재하지 않습니다.'
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(
+            concurrency=options['concurrency'],
+            pool=options['pool'],
+            periodic=not options['no_periodic'],
+        )
+
+        def shutdown(signum, frame):
+            self.stdout.write('종료 요청을 받았습니다. 실행 중인 작업을 마친 후 종료합니다...')
+            worker.stop()
+
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+
+        self.stdout.write(
+            f'작업자 시작: {worker.worker_id} '
+            f'(동시 실행 {worker.concurrency}, {worker.pool} 풀)'
+        )
+        processed = worker.run(once=options['once'])
+        self.stdout.write(self.style.SUCCESS(f'작업자 종료: {processed}건 처리'))
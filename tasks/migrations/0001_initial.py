@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-19 05:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Task',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(db_index=True, max_length=200, verbose_name='작업명')),
+                ('args', models.JSONField(blank=True, default=list, verbose_name='인자')),
+                ('kwargs', models.JSONField(blank=True, default=dict, verbose_name='키워드 인자')),
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('RUNNING', '실행중'), ('SUCCEEDED', '완료'), ('FAILED', '실패')], default='PENDING', max_length=10, verbose_name='상태')),
+                ('priority', models.SmallIntegerField(default=0, help_text='값이 클수록 먼저 실행', verbose_name='우선순위')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도횟수')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3, verbose_name='최대 시도횟수')),
+                ('run_after', models.DateTimeField(help_text='이 시간 이후에 실행 (재시도 대기 포함)', verbose_name='실행가능시간')),
+                ('locked_until', models.DateTimeField(blank=True, help_text='실행 중 작업자가 응답 없이 이 시간을 넘기면 다른 작업자가 다시 실행', null=True, verbose_name='점유만료시간')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='작업자')),
+                ('result', models.JSONField(blank=True, null=True, verbose_name='결과')),
+                ('last_error', models.TextField(blank=True, verbose_name='최근오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작시간')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료시간')),
+            ],
+            options={
+                'verbose_name': '백그라운드 작업',
+                'verbose_name_plural': '백그라운드 작업',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'priority', 'run_after'], name='task_claim_idx'), models.Index(fields=['status', 'locked_until'], name='task_visibility_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+"""
+백그라운드 작업 모델
+Task models for nCompliance
+"""
+
+from django.db import models
+
+
+class Task(models.Model):
+    """
+    백그라운드 작업 모델
+    요청 처리 중 적재되고 작업자(runworker)가 가져가 실행하는 작업 대기열
+    """
+    STATUS_CHOICES = [
+        ('PENDING', '대기'),
+        ('RUNNING', '실행중'),
+        ('SUCCEEDED', '완료'),
+        ('FAILED', '실패'),
+    ]
+
+    name = models.CharField('작업명', max_length=200, db_index=True)
+    args = models.JSONField('인자', default=list, blank=True)
+    kwargs = models.JSONField('키워드 인자', default=dict, blank=True)
+    status = models.CharField('상태', max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    priority = models.SmallIntegerField('우선순위', default=0, help_text='값이 클수록 먼저 실행')
+    attempts = models.PositiveSmallIntegerField('시도횟수', default=0)
+    max_attempts = models.PositiveSmallIntegerField('최대 시도횟수', default=3)
+    run_after = models.DateTimeField('실행가능시간', help_text='이 시간 이후에 실행 (재시도 대기 포함)')
+    locked_until = models.DateTimeField('점유만료시간', null=True, blank=True,
+                                        help_text='실행 중 작업자가 응답 없이 이 시간을 넘기면 다른 작업자가 다시 실행')
+    locked_by = models.CharField('작업자', max_length=100, blank=True)
+    result = models.JSONField('결과', null=True, blank=True)
+    last_error = models.TextField('최근오류', blank=True)
+    created_at = models.DateTimeField('생성일', auto_now_add=True)
+    started_at = models.DateTimeField('시작시간', null=True, blank=True)
+    finished_at = models.DateTimeField('종료시간', null=True, blank=True)
+
+    class Meta:
+        verbose_name = '백그라운드 작업'
+        verbose_name_plural = '백그라운드 작업'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'priority', 'run_after'], name='task_claim_idx'),
+            models.Index(fields=['status', 'locked_until'], name='task_visibility_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
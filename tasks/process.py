@@ -0,0 +1,16 @@
+"""
+프로세스 풀 진입점
+spawn 방식의 작업 프로세스는 Django 설정 전에 이 모듈을 불러오므로 모델을 직접 import하지 않습니다.
+"""
+
+
+def init_process():
+    """작업 프로세스 초기화"""
+    import django
+    django.setup()
+
+
+def run_task(task_id, worker_id):
+    """작업 프로세스에서 작업 1건 실행"""
+    from .worker import execute_task
+    return execute_task(task_id, worker_id)
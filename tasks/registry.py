@@ -0,0 +1,124 @@
+"""
+백그라운드 작업 등록
+@task 데코레이터로 함수를 작업으로 등록하고, .delay()로 작업 대기열에 적재
+
+사용 예:
+    from tasks.registry import task
+
+    @task(name='notifications.send_change_notification', priority=5)
+    def send_change_notification(regulation_id, version_ids):
+        ...
+
+    send_change_notification.delay(regulation.pk, [version.pk])
+
+작업 인자는 JSON으로 저장되므로 모델 객체 대신 pk 등 단순 값만 전달합니다.
+TASK_SETTINGS['EAGER']가 True이면 적재하지 않고 즉시 실행합니다. (테스트용)
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+
+DEFAULTS = {
+    'EAGER': False,
+    'WORKERS': 4,
+    'POOL': 'thread',
+    'POLL_INTERVAL': 1.0,
+    'VISIBILITY_TIMEOUT': 300,
+    'RETRY_BASE_SECONDS': 30,
+    'SUCCEEDED_RETENTION_DAYS': 7,
+    'FAILED_RETENTION_DAYS': 30,
+    'RETENTION_CHUNK_SIZE': 500,
+    'RETENTION_CHUNK_PAUSE': 0.05,
+}
+
+_registry = {}
+
+
+def get_task_settings():
+    """TASK_SETTINGS 설정값 반환 (미설정 항목은 기본값 사용)"""
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'TASK_SETTINGS', {}))
+    return config
+
+
+class TaskFunction:
+    """작업으로 등록된 함수 (직접 호출 시 동기 실행)"""
+
+    def __init__(self, func, name, priority=0, max_attempts=3, every=None):
+        self.func = func
+        self.name = name
+        self.priority = priority
+        self.max_attempts = max_attempts
+        self.every = every
+        self.__doc__ = func.__doc__
+        self.__name__ = func.__name__
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<TaskFunction {self.name}>"
+
+    def delay(self, *args, **kwargs):
+        """기본 옵션으로 작업 적재"""
+        return self.enqueue(args=args, kwargs=kwargs)
+
+    def enqueue(self, args=(), kwargs=None, priority=None, countdown=None):
+        """
+        작업 적재
+        countdown(초)을 지정하면 해당 시간 이후에 실행
+        """
+        from .models import Task
+
+        kwargs = kwargs or {}
+        task = Task(
+            name=self.name,
+            args=list(args),
+            kwargs=kwargs,
+            priority=self.priority if priority is None else priority,
+            max_attempts=self.max_attempts,
+            run_after=timezone.now() + timedelta(seconds=countdown or 0),
+        )
+
+        if get_task_settings()['EAGER']:
+            # 즉시 실행 모드: 대기열에 적재하지 않고 호출자 스레드에서 실행
+            task.attempts = 1
+            task.started_at = timezone.now()
+            task.result = self.func(*task.args, **task.kwargs)
+            task.status = 'SUCCEEDED'
+            task.finished_at = timezone.now()
+            return task
+
+        task.save()
+        return task
+
+
+def task(name=None, priority=0, max_attempts=3, every=None):
+    """
+    작업 등록 데코레이터
+    - name: 작업명 (기본값: 모듈명.함수명)
+    - priority: 우선순위 (값이 클수록 먼저 실행)
+    - max_attempts: 실패 시 최대 시도 횟수
+    - every: 주기 실행 간격(초) - 지정하면 작업자가 주기적으로 적재
+    """
+    def decorator(func):
+        task_name = name or f"{func.__module__}.{func.__name__}"
+        task_function = TaskFunction(
+            func, task_name, priority=priority, max_attempts=max_attempts, every=every
+        )
+        _registry[task_name] = task_function
+        return task_function
+    return decorator
+
+
+def get_task(name):
+    """등록된 작업 반환 (없으면 None)"""
+    return _registry.get(name)
+
+
+def get_periodic_tasks():
+    """주기 실행 작업 목록 반환"""
+    return [t for t in _registry.values() if t.every]
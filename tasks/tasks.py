@@ -0,0 +1,69 @@
+"""
+백그라운드 작업 대기열 정리 작업
+완료/실패한 작업은 보관 기간이 지나면 삭제하여 대기열 테이블과 점유 조회가 계속 커지지 않도록 합니다.
+삭제는 RETENTION_CHUNK_SIZE 단위의 짧은 트랜잭션으로 나누어 실행합니다.
+"""
+
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .registry import get_periodic_tasks, get_task_settings, task
+
+
+def _delete_in_chunks(queryset, chunk_size, pause):
+    """pk 기준 청크로 나누어 삭제하고 삭제한 총 건수 반환"""
+    total = 0
+    while True:
+        pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:chunk_size])
+        if not pks:
+            break
+        with transaction.atomic():
+            queryset.model.objects.filter(pk__in=pks).delete()
+        total += len(pks)
+        if len(pks) < chunk_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return total
+
+
+def purge_finished_tasks(succeeded_days=None, failed_days=None, chunk_size=None, pause=None, now=None):
+    """
+    보관 기간이 지난 완료/실패 작업 삭제
+    주기 실행 작업의 중복 적재 확인에 쓰이므로 가장 긴 실행 주기 안의 작업은 남겨 둡니다.
+
+    Returns:
+        상태별 삭제 건수 dict
+    """
+    from .models import Task
+
+    config = get_task_settings()
+    succeeded_days = config['SUCCEEDED_RETENTION_DAYS'] if succeeded_days is None else succeeded_days
+    failed_days = config['FAILED_RETENTION_DAYS'] if failed_days is None else failed_days
+    chunk_size = chunk_size or config['RETENTION_CHUNK_SIZE']
+    pause = config['RETENTION_CHUNK_PAUSE'] if pause is None else pause
+    now = now or timezone.now()
+    longest_every = max((t.every for t in get_periodic_tasks()), default=0)
+
+    def cutoff(days):
+        return min(now - timedelta(days=days), now - timedelta(seconds=longest_every))
+
+    return {
+        'succeeded': _delete_in_chunks(
+            Task.objects.filter(status='SUCCEEDED', finished_at__lt=cutoff(succeeded_days)),
+            chunk_size, pause,
+        ),
+        'failed': _delete_in_chunks(
+            Task.objects.filter(status='FAILED', finished_at__lt=cutoff(failed_days)),
+            chunk_size, pause,
+        ),
+    }
+
+
+@task(name='tasks.purge_finished_tasks', priority=-1, every=24 * 60 * 60)
+def purge_finished_tasks_task():
+    """오래된 완료/실패 작업 삭제 (1일 주기)"""
+    return purge_finished_tasks()
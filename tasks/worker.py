@@ -0,0 +1,275 @@
+"""
+백그라운드 작업 실행기
+작업 대기열(Task)에서 작업을 가져와 스레드 또는 프로세스 풀에서 실행
+
+- 별도 메시지 브로커 없이 데이터베이스만으로 동작합니다.
+- 작업 점유는 조건부 UPDATE로 처리하여 여러 작업자가 동시에 실행되어도 중복 실행되지 않습니다.
+- 실행 중에는 점유 시간을 주기적으로 연장하고(heartbeat), 연장이 끊긴 채 VISIBILITY_TIMEOUT이 지난 작업
+  (작업자 비정상 종료 등)은 다른 작업자가 다시 실행합니다.
+- 결과는 점유 정보(작업자, 시도 횟수)가 그대로인 경우에만 기록하므로, 다시 점유된 작업을 이전 실행이 완료 처리하지 않습니다.
+- 실패한 작업은 지수 백오프로 재시도하고, 최대 시도 횟수를 넘으면 실패 처리합니다.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import traceback
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connections
+from django.db.models import F, Q
+from django.utils import timezone
+
+from . import process
+from .models import Task
+from .registry import get_periodic_tasks, get_task, get_task_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+def _json_result(value):
+    """작업 결과를 JSONField에 저장 가능한 값으로 변환"""
+    try:
+        return json.loads(json.dumps(value, cls=DjangoJSONEncoder))
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+def _heartbeat(task_id, worker_id, attempts, timeout, stop_event):
+    """실행이 끝날 때까지 점유 시간 연장 (VISIBILITY_TIMEOUT의 1/3 간격)"""
+    try:
+        while not stop_event.wait(timeout.total_seconds() / 3):
+            renewed = Task.objects.filter(
+                pk=task_id, locked_by=worker_id, attempts=attempts, status='RUNNING'
+            ).update(locked_until=timezone.now() + timeout)
+            if not renewed:
+                logger.warning("작업 점유가 해제되어 점유 연장을 중단합니다: #%s", task_id)
+                break
+    except Exception:
+        logger.exception("작업 점유 연장 실패: #%s", task_id)
+    finally:
+        connections.close_all()
+
+
+def execute_task(task_id, worker_id):
+    """작업 1건 실행 및 결과 기록"""
+    close_old_connections()
+    try:
+        task = Task.objects.filter(pk=task_id, locked_by=worker_id, status='RUNNING').first()
+        if not task:
+            return
+
+        config = get_task_settings()
+        task_function = get_task(task.name)
+        # 점유 토큰: 작업자와 시도 횟수가 모두 같을 때만 결과 기록
+        owned = Task.objects.filter(
+            pk=task.pk, locked_by=worker_id, attempts=task.attempts, status='RUNNING'
+        )
+
+        if task_function is None:
+            owned.update(
+                status='FAILED',
+                last_error=f"등록되지 않은 작업입니다: {task.name}",
+                finished_at=timezone.now(),
+                locked_until=None,
+            )
+            return
+
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=_heartbeat,
+            args=(task.pk, worker_id, task.attempts,
+                  timedelta(seconds=config['VISIBILITY_TIMEOUT']), stop_heartbeat),
+            name=f'task-heartbeat-{task.pk}',
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            result = task_function.func(*task.args, **task.kwargs)
+        except Exception:
+            error = traceback.format_exc()
+            logger.exception("작업 실패: %s (#%s)", task.name, task.pk)
+            stop_heartbeat.set()
+            heartbeat.join()
+            if task.attempts < task.max_attempts:
+                delay = config['RETRY_BASE_SECONDS'] * 2 ** (task.attempts - 1)
+                updated = owned.update(
+                    status='PENDING',
+                    run_after=timezone.now() + timedelta(seconds=delay),
+                    locked_until=None,
+                    locked_by='',
+                    last_error=error,
+                )
+            else:
+                updated = owned.update(
+                    status='FAILED',
+                    locked_until=None,
+                    last_error=error,
+                    finished_at=timezone.now(),
+                )
+        else:
+            stop_heartbeat.set()
+            heartbeat.join()
+            updated = owned.update(
+                status='SUCCEEDED',
+                result=_json_result(result),
+                locked_until=None,
+                finished_at=timezone.now(),
+            )
+        if not updated:
+            logger.warning("다른 작업자가 다시 점유한 작업이므로 결과를 기록하지 않습니다: %s (#%s)",
+                           task.name, task.pk)
+    finally:
+        connections.close_all()
+
+
+class Worker:
+    """작업 대기열 처리기"""
+
+    def __init__(self, concurrency=None, pool=None, worker_id=None, poll_interval=None,
+                 visibility_timeout=None, periodic=True):
+        config = get_task_settings()
+        self.concurrency = concurrency or config['WORKERS']
+        self.pool = pool or config['POOL']
+        self.poll_interval = poll_interval or config['POLL_INTERVAL']
+        self.visibility_timeout = timedelta(
+            seconds=visibility_timeout or config['VISIBILITY_TIMEOUT']
+        )
+        self.periodic = periodic
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.stop_event = threading.Event()
+        # 이 작업자가 실행 중인 작업 pk (점유 시간이 만료되어도 다시 점유하지 않음)
+        self.running = set()
+
+    def _claimable(self, now):
+        """실행 가능한 작업 조건 (대기 중이거나 점유 시간이 만료된 실행 중 작업)"""
+        return Q(status='PENDING', run_after__lte=now) | Q(
+            status='RUNNING', locked_until__lt=now, attempts__lt=F('max_attempts')
+        )
+
+    def claim(self, limit):
+        """
+        실행할 작업을 최대 limit건 점유하고 pk 목록 반환
+        조건부 UPDATE로 점유하므로 다른 작업자가 먼저 가져간 작업은 건너뜀
+        """
+        now = timezone.now()
+        claimable = self._claimable(now)
+        candidates = list(
+            Task.objects.filter(claimable)
+            .exclude(pk__in=list(self.running))
+            .order_by('-priority', 'run_after', 'pk')
+            .values_list('pk', flat=True)[:limit * 2]
+        )
+
+        claimed = []
+        for pk in candidates:
+            if len(claimed) >= limit:
+                break
+            updated = Task.objects.filter(claimable, pk=pk).update(
+                status='RUNNING',
+                locked_by=self.worker_id,
+                locked_until=now + self.visibility_timeout,
+                attempts=F('attempts') + 1,
+                started_at=now,
+            )
+            if updated:
+                claimed.append(pk)
+        return claimed
+
+    def reap(self):
+        """점유 시간이 만료되었고 재시도 횟수를 모두 쓴 작업을 실패 처리"""
+        return Task.objects.filter(
+            status='RUNNING',
+            locked_until__lt=timezone.now(),
+            attempts__gte=F('max_attempts'),
+        ).update(
+            status='FAILED',
+            locked_until=None,
+            last_error='작업 시간이 초과되었습니다. (VISIBILITY_TIMEOUT)',
+            finished_at=timezone.now(),
+        )
+
+    def schedule_periodic(self):
+        """
+        주기 실행 작업 적재
+        같은 작업이 주기 안에 이미 적재되었으면 건너뜀 (작업자 재시작/다중 작업자 중복 방지)
+        """
+        now = timezone.now()
+        scheduled = 0
+        for task_function in get_periodic_tasks():
+            recent = Task.objects.filter(
+                name=task_function.name,
+                created_at__gt=now - timedelta(seconds=task_function.every),
+            ).exists()
+            if not recent:
+                task_function.enqueue()
+                scheduled += 1
+        return scheduled
+
+    @property
+    def _target(self):
+        return process.run_task if self.pool == 'process' else execute_task
+
+    def _make_executor(self):
+        if self.pool == 'process':
+            # 부모 프로세스의 DB 연결을 공유하지 않도록 spawn 방식 사용
+            return ProcessPoolExecutor(
+                max_workers=self.concurrency,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=process.init_process,
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix='task-worker'
+        )
+
+    def stop(self):
+        """실행 중인 작업을 마친 후 종료하도록 요청"""
+        self.stop_event.set()
+
+    def run(self, once=False):
+        """
+        작업 처리 루프
+        once=True이면 현재 실행 가능한 작업을 모두 처리한 뒤 종료
+        처리한 작업 수를 반환
+        """
+        processed = 0
+        in_flight = {}
+        executor = self._make_executor()
+        try:
+            while not self.stop_event.is_set():
+                if self.periodic and not once:
+                    self.schedule_periodic()
+                self.reap()
+
+                free = self.concurrency - len(in_flight)
+                claimed = self.claim(free) if free > 0 else []
+                for pk in claimed:
+                    in_flight[executor.submit(self._target, pk, self.worker_id)] = pk
+                    self.running.add(pk)
+                processed += len(claimed)
+
+                if once and not claimed and not in_flight:
+                    break
+
+                if in_flight:
+                    done, _ = wait(
+                        in_flight, timeout=self.poll_interval, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        self.running.discard(in_flight.pop(future))
+                        if future.exception():
+                            logger.error("작업 실행 오류: %s", future.exception())
+                elif not claimed:
+                    self.stop_event.wait(self.poll_interval)
+
+                close_old_connections()
+        finally:
+            executor.shutdown(wait=True)
+        return processed